@@ -0,0 +1,132 @@
+"""
+Benchmark of the cold start of a PTT worker process.
+
+Imports the application and creates the application served by uvicorn in new
+interpreters, as a worker does, and breaks the time down by top level package
+from the -X importtime report, and by phase from common/startup.py. The ODA is
+initialised by a startup handler, so oda_init is part of the time to ready only. With
+--ready-url, also starts the service and measures the time until its readiness
+route answers, the time a new pod takes to receive traffic.
+
+Run with::
+
+    poetry run python benchmarks/cold_start.py --repeat 5
+
+and, against an ODA reachable from the environment, with::
+
+    poetry run python benchmarks/cold_start.py --ready-url \\
+        http://localhost:5000/ska-oso-ptt-services/ptt/api/v0/health/ready
+"""
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import httpx
+
+IMPORT_TIME_LINE = re.compile(r"import time:\s*(\d+) \|\s*(\d+) \|(\s*)(\S+)$")
+
+CREATE_MAIN_APP = (
+    "import json, time\n"
+    "started = time.perf_counter()\n"
+    "import ska_oso_ptt_services.app\n"
+    "imported = time.perf_counter()\n"
+    "from ska_oso_ptt_services.common.startup import startup_timer\n"
+    "print(json.dumps({'import_app': imported - started, **startup_timer.phases}))\n"
+)
+
+
+def create_main_app() -> Tuple[Dict[str, float], Dict[str, float]]:
+    """
+    Creates the application served by uvicorn in a new interpreter and returns
+    the import seconds of every top level package and the startup phases
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CREATE_MAIN_APP],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages: Dict[str, float] = defaultdict(float)
+    for line in completed.stderr.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, _, _, module = match.groups()
+            packages[module.split(".")[0]] += int(self_us) / 1e6
+    return dict(packages), json.loads(completed.stdout.splitlines()[-1])
+
+
+def time_to_ready(ready_url: str, timeout: float) -> float:
+    """
+    Starts the service and returns the seconds until the readiness route at
+    ready_url answers 200
+    """
+    started = time.perf_counter()
+    server = subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-m", "ska_oso_ptt_services.server"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                if httpx.get(ready_url, timeout=1.0).status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            time.sleep(0.05)
+        raise TimeoutError(f"{ready_url} not ready after {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def median_by_key(samples: List[Dict[str, float]]) -> Dict[str, float]:
+    keys = {key for sample in samples for key in sample}
+    return {
+        key: statistics.median(sample.get(key, 0.0) for sample in samples)
+        for key in keys
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--ready-url")
+    parser.add_argument("--ready-timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    runs = [create_main_app() for _ in range(args.repeat)]
+    packages = median_by_key([packages for packages, _ in runs])
+    phases = median_by_key([phases for _, phases in runs])
+
+    print(f"Median of {args.repeat} runs")
+    print("Import time by top level package:")
+    for package, seconds in sorted(
+        packages.items(), key=lambda item: item[1], reverse=True
+    )[: args.top]:
+        print(f"{package:>28}: {seconds * 1000:9.2f} ms")
+    print(f"{'total':>28}: {sum(packages.values()) * 1000:9.2f} ms")
+
+    print("Startup phases:")
+    for phase in ("import_app", "import", "create_app"):
+        if phase in phases:
+            print(f"{phase:>28}: {phases[phase] * 1000:9.2f} ms")
+
+    if args.ready_url:
+        seconds = statistics.median(
+            time_to_ready(args.ready_url, args.ready_timeout)
+            for _ in range(args.repeat)
+        )
+        print(f"{'time to ready':>28}: {seconds * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+In-memory stand-in for the ODA used by the route benchmarks.
+
+It implements the parts of the ODA unit of work the routers use: the sbds, sbis,
+ebs and prjs entity repositories and their status history repositories. Every
+repository call and commit sleeps for a configurable latency, standing in for
+the database round trip, so the benchmarks exercise the thread pools and the
+number of ODA calls made by each route as well as the service code.
+
+Query filters are not applied, entity queries return the latest version of every
+entity of the repository.
+"""
+
+import copy
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from ska_db_oda.persistence.domain.errors import ODANotFound
+from ska_oso_pdm import OSOExecutionBlock, Project, SBDefinition, SBInstance
+from ska_oso_pdm.entity_status_history import (
+    OSOEBStatusHistory,
+    ProjectStatusHistory,
+    SBDStatusHistory,
+    SBIStatusHistory,
+)
+
+TEST_FILES_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "tests/unit/ska_oso_ptt_services/routers/test_data_files",
+)
+
+# entity key: (entity model, id field, sample entities, status model, sample
+# statuses)
+ENTITIES = {
+    "sbd": (
+        SBDefinition,
+        "sbd_id",
+        "testfile_sample_multiple_sbds_with_status.json",
+        SBDStatusHistory,
+        "testfile_sample_sbd_status_history.json",
+    ),
+    "sbi": (
+        SBInstance,
+        "sbi_id",
+        "testfile_sample_multiple_sbis_with_status.json",
+        SBIStatusHistory,
+        "testfile_sample_sbi_status_history.json",
+    ),
+    "eb": (
+        OSOExecutionBlock,
+        "eb_id",
+        "testfile_sample_multiple_ebs_with_status.json",
+        OSOEBStatusHistory,
+        "testfile_sample_eb_status_history.json",
+    ),
+    "prj": (
+        Project,
+        "prj_id",
+        "testfile_sample_multiple_prjs_with_status.json",
+        ProjectStatusHistory,
+        "testfile_sample_prj_status_history.json",
+    ),
+}
+
+
+def load_samples(filename: str) -> List[Dict[str, Any]]:
+    with open(os.path.join(TEST_FILES_PATH, filename), "r", encoding="utf-8") as file:
+        return json.load(file)
+
+
+class InMemoryRepository:
+    """
+    Entity repository holding the latest version of every entity
+    """
+
+    def __init__(self, oda: "InMemoryODA", id_field: str) -> None:
+        self._oda = oda
+        self._id_field = id_field
+        self.entities: Dict[str, Any] = {}
+
+    def get(self, entity_id: str, version: Optional[int] = None) -> Any:
+        self._oda.round_trip()
+        try:
+            return self.entities[entity_id]
+        except KeyError:
+            raise ODANotFound(identifier=entity_id) from None
+
+    def query(self, qry_params: Any) -> List[Any]:  # pylint: disable=W0613
+        self._oda.round_trip()
+        return list(self.entities.values())
+
+    def add(self, entity: Any) -> Any:
+        self._oda.round_trip()
+        self.entities[getattr(entity, self._id_field)] = entity
+        return entity
+
+
+class InMemoryStatusRepository:
+    """
+    Status history repository holding the statuses of every entity in the order
+    they were added
+    """
+
+    def __init__(self, oda: "InMemoryODA", entity_type: str) -> None:
+        self._oda = oda
+        self._ref_field = f"{entity_type}_ref"
+        self._version_field = f"{entity_type}_version"
+        self.history: Dict[str, List[Any]] = defaultdict(list)
+
+    def _matching(self, entity_id: str, version: Optional[int]) -> List[Any]:
+        return [
+            status
+            for status in self.history.get(entity_id, [])
+            if version is None
+            or str(getattr(status, self._version_field)) == str(version)
+        ]
+
+    def get(
+        self,
+        entity_id: str,
+        version: Optional[int] = None,
+        is_status_history: bool = False,
+    ) -> Any:
+        self._oda.round_trip()
+        statuses = self._matching(entity_id, version)
+        if not statuses:
+            raise ODANotFound(identifier=entity_id)
+        return statuses if is_status_history else statuses[-1]
+
+    def query(self, qry_params: Any, is_status_history: bool = True) -> List[Any]:
+        self._oda.round_trip()
+        statuses = self._matching(
+            getattr(qry_params, "entity_id", None),
+            getattr(qry_params, "version", None),
+        )
+        return statuses if is_status_history else statuses[-1:]
+
+    def add(self, status: Any) -> Any:
+        self._oda.round_trip()
+        entity_id = getattr(status, self._ref_field)
+        metadata = status.metadata or (
+            self.history[entity_id][-1].metadata if self.history[entity_id] else None
+        )
+        if metadata is not None:
+            metadata = metadata.model_copy(
+                update={"last_modified_on": datetime.now(timezone.utc)}
+            )
+        persisted = status.model_copy(update={"metadata": metadata})
+        self.history[entity_id].append(persisted)
+        return persisted
+
+
+class InMemoryUnitOfWork:
+    """
+    Unit of work over the repositories of an InMemoryODA. Changes are visible
+    immediately, commit only costs a round trip.
+    """
+
+    def __init__(self, oda: "InMemoryODA") -> None:
+        self._oda = oda
+
+    def __enter__(self) -> "InMemoryUnitOfWork":
+        self._oda.round_trip()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._oda.repositories[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def commit(self) -> None:
+        self._oda.round_trip()
+
+
+class InMemoryODA:
+    """
+    Drop-in replacement of ska_db_oda.persistence.oda for the routers
+
+    :param latency_seconds: time every repository call, unit of work and commit
+        waits for, standing in for the database round trip
+    """
+
+    def __init__(self, latency_seconds: float = 0.0) -> None:
+        self.latency_seconds = latency_seconds
+        self.round_trips = 0
+        self._lock = threading.Lock()
+        self.repositories: Dict[str, Any] = {}
+        for entity_type, (_, id_field, _, _, _) in ENTITIES.items():
+            self.repositories[f"{entity_type}s"] = InMemoryRepository(self, id_field)
+            self.repositories[f"{entity_type}s_status_history"] = (
+                InMemoryStatusRepository(self, entity_type)
+            )
+
+    def round_trip(self) -> None:
+        with self._lock:
+            self.round_trips += 1
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+
+    def uow(self) -> InMemoryUnitOfWork:
+        return InMemoryUnitOfWork(self)
+
+    def seed(self, counts: Dict[str, int], statuses_per_entity: int) -> None:
+        """
+        Takes the number of entities to create per entity type and fills the
+        repositories with copies of the unit test samples, each with
+        statuses_per_entity status history entries
+        """
+        latency_seconds, self.latency_seconds = self.latency_seconds, 0.0
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        for entity_type, count in counts.items():
+            model, id_field, entities_file, status_model, statuses_file = ENTITIES[
+                entity_type
+            ]
+            samples = load_samples(entities_file)
+            status_sample = load_samples(statuses_file)[0]
+            entities = self.repositories[f"{entity_type}s"]
+            history = self.repositories[f"{entity_type}s_status_history"]
+
+            for index in range(count):
+                entity_id = f"{entity_type}-bench-{index:08}"
+                modified_on = (start + timedelta(seconds=index)).isoformat()
+                sample = copy.deepcopy(samples[index % len(samples)])
+                sample.pop("status", None)
+                sample[id_field] = entity_id
+                sample["metadata"].update(
+                    {"version": 1, "last_modified_on": modified_on}
+                )
+                entities.add(model(**sample))
+
+                for _ in range(statuses_per_entity):
+                    status = copy.deepcopy(status_sample)
+                    status[f"{entity_type}_ref"] = entity_id
+                    status[f"{entity_type}_version"] = 1
+                    status["metadata"]["last_modified_on"] = modified_on
+                    history.history[entity_id].append(status_model(**status))
+
+        self.latency_seconds = latency_seconds
+        self.round_trips = 0
+
+    def entity_ids(self, entity_type: str) -> List[str]:
+        return list(self.repositories[f"{entity_type}s"].entities)
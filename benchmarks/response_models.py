@@ -0,0 +1,208 @@
+"""
+Benchmark of the response models of the entity routes.
+
+Measures the import time of the application, the time create_app takes to build
+its routes and the OpenAPI document, and compares, for every entity type:
+
+- declaring the routes with response models parametrised in every decorator and
+  documented again in responses, as the routes used to, with the registry of
+  common/response_models.py;
+- serialising a status history response by FastAPI, dumping it to dictionaries,
+  validating and serialising it again, with serialise_response. Both paths are
+  checked to produce the same document.
+
+Run with::
+
+    poetry run python benchmarks/response_models.py --statuses 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import subprocess
+import sys
+import timeit
+from http import HTTPStatus
+
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from ska_oso_ptt_services.app import create_app
+from ska_oso_ptt_services.common.constant import entity_descriptors
+from ska_oso_ptt_services.common.response_models import (
+    entity_response_models,
+    serialise_response,
+)
+from ska_oso_ptt_services.common.utils import convert_to_response_object
+from ska_oso_ptt_services.models.models import (
+    ApiResponse,
+    BatchApiResponse,
+    PaginatedApiResponse,
+)
+
+SBD_STATUS_HISTORY_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "tests/unit/ska_oso_ptt_services/routers/test_data_files",
+    "testfile_sample_sbd_status_history.json",
+)
+
+
+def import_seconds() -> float:
+    """
+    Imports the application in a new interpreter and returns the cumulative
+    import time of ska_oso_ptt_services.app reported by -X importtime
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ska_oso_ptt_services.app"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stderr.splitlines():
+        match = re.match(
+            r"import time:\s*\d+ \|\s*(\d+) \|\s*ska_oso_ptt_services\.app$", line
+        )
+        if match:
+            return int(match.group(1)) / 1e6
+    raise RuntimeError("ska_oso_ptt_services.app not found in the import times")
+
+
+def start_app() -> None:
+    create_app().openapi()
+
+
+def _endpoint() -> None:
+    return None
+
+
+def declare_previous_routes() -> APIRouter:
+    router = APIRouter()
+    for descriptor in entity_descriptors.values():
+        status_model = descriptor.status_model
+        history_model = descriptor.status_history.model
+        for path, response_model in (
+            ("entities", PaginatedApiResponse[status_model]),
+            ("batch", BatchApiResponse[status_model]),
+            ("entity", ApiResponse[status_model]),
+            ("status", ApiResponse[history_model]),
+            ("history", PaginatedApiResponse[history_model]),
+        ):
+            router.add_api_route(
+                f"/{descriptor.repository}/{path}",
+                _endpoint,
+                response_model=response_model,
+                responses={
+                    status.HTTP_200_OK: {
+                        "description": "Successful Response",
+                        "model": response_model,
+                    }
+                },
+            )
+    return router
+
+
+def declare_registry_routes() -> APIRouter:
+    router = APIRouter()
+    for entity_type, descriptor in entity_descriptors.items():
+        for path, response_model in zip(
+            ("entities", "batch", "entity", "status", "history"),
+            entity_response_models[entity_type],
+        ):
+            router.add_api_route(
+                f"/{descriptor.repository}/{path}",
+                _endpoint,
+                response_model=response_model,
+            )
+    return router
+
+
+def load_status_history(count: int) -> list:
+    with open(SBD_STATUS_HISTORY_FILE, "r", encoding="utf-8") as history_file:
+        samples = json.load(history_file)
+
+    history_model = entity_descriptors["sbd"].status_history.model
+    return [
+        history_model(**{**samples[index % len(samples)], "sbd_version": index + 1})
+        for index in range(count)
+    ]
+
+
+def previous_response(field, statuses: list) -> bytes:
+    api_response = convert_to_response_object(
+        [history.model_dump(mode="json") for history in statuses],
+        result_code=HTTPStatus.OK,
+    )
+    content = asyncio.run(
+        serialize_response(field=field, response_content=api_response)
+    )
+    return JSONResponse(content).body
+
+
+def registry_response(statuses: list) -> bytes:
+    return serialise_response(
+        entity_response_models["sbd"].status_history,
+        convert_to_response_object(statuses, result_code=HTTPStatus.OK),
+    ).body
+
+
+def report(name: str, previous: float, registry: float, unit: str) -> None:
+    print(
+        f"{name:>22}: {previous * 1000:9.2f} ms previous, "
+        f"{registry * 1000:9.2f} ms registry, {previous / registry:6.2f}x {unit}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statuses", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    seconds = min(import_seconds() for _ in range(args.repeat))
+    print(f"{'import':>22}: {seconds * 1000:9.2f} ms")
+
+    seconds = min(timeit.repeat(start_app, number=1, repeat=args.repeat))
+    print(f"{'create_app + openapi':>22}: {seconds * 1000:9.2f} ms")
+
+    report(
+        "route declaration",
+        min(timeit.repeat(declare_previous_routes, number=1, repeat=args.repeat)),
+        min(timeit.repeat(declare_registry_routes, number=1, repeat=args.repeat)),
+        f"for {len(entity_descriptors) * 5} routes",
+    )
+
+    statuses = load_status_history(args.statuses)
+    field = create_response_field(
+        name="benchmark_response",
+        type_=entity_response_models["sbd"].status_history,
+        mode="serialization",
+    )
+    assert json.loads(previous_response(field, statuses)) == json.loads(
+        registry_response(statuses)
+    ), "The response paths produce different documents"
+
+    report(
+        "status history",
+        min(
+            timeit.repeat(
+                lambda: previous_response(field, statuses),
+                number=1,
+                repeat=args.repeat,
+            )
+        ),
+        min(
+            timeit.repeat(
+                lambda: registry_response(statuses), number=1, repeat=args.repeat
+            )
+        ),
+        f"for {args.statuses} statuses",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark of the serialisation of GET /sbds responses.
+
+Compares the previous response path, where entities were dumped to dictionaries,
+wrapped in an ApiResponse and then validated and serialised again by FastAPI
+against the response_model of the route, with the single serialisation path of
+convert_to_json_response. Both paths are checked to produce the same document.
+
+Run with::
+
+    poetry run python benchmarks/response_serialisation.py --entities 1000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import timeit
+from http import HTTPStatus
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from ska_oso_pdm import SBDefinition
+
+from ska_oso_ptt_services.common.utils import (
+    convert_to_json_response,
+    convert_to_response_object,
+    entity_with_status_json,
+)
+from ska_oso_ptt_services.models.models import (
+    PaginatedApiResponse,
+    SBDefinitionStatusModel,
+)
+
+SBDS_FILE = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "tests/unit/ska_oso_ptt_services/routers/test_data_files",
+    "testfile_sample_multiple_sbds_with_status.json",
+)
+
+RESPONSE_FIELD = create_response_field(
+    name="benchmark_response",
+    type_=PaginatedApiResponse[SBDefinitionStatusModel],
+)
+
+
+def load_sbds(count: int) -> list[SBDefinition]:
+    with open(SBDS_FILE, "r", encoding="utf-8") as sbds_file:
+        samples = json.load(sbds_file)
+
+    return [
+        SBDefinition(
+            **{**samples[index % len(samples)], "sbd_id": f"sbd-bench-{index:08}"}
+        )
+        for index in range(count)
+    ]
+
+
+def previous_response(sbds: list[SBDefinition]) -> bytes:
+    sbd_with_status = [
+        {**sbd.model_dump(mode="json"), "status": "Draft"} for sbd in sbds
+    ]
+    api_response = convert_to_response_object(
+        sbd_with_status, result_code=HTTPStatus.OK
+    )
+    content = asyncio.run(
+        serialize_response(field=RESPONSE_FIELD, response_content=api_response)
+    )
+    return JSONResponse(content).body
+
+
+def single_serialisation_response(sbds: list[SBDefinition]) -> bytes:
+    return convert_to_json_response(
+        [entity_with_status_json(sbd, "Draft") for sbd in sbds],
+        result_code=HTTPStatus.OK,
+        paginated=True,
+    ).body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    sbds = load_sbds(args.entities)
+
+    assert json.loads(previous_response(sbds)) == json.loads(
+        single_serialisation_response(sbds)
+    ), "The response paths produce different documents"
+
+    results = {}
+    for name, response in (
+        ("previous", previous_response),
+        ("single_serialisation", single_serialisation_response),
+    ):
+        seconds = min(
+            timeit.repeat(lambda: response(sbds), number=1, repeat=args.repeat)
+        )
+        results[name] = seconds
+        print(f"{name:>22}: {seconds * 1000:9.2f} ms for {args.entities} SBDs")
+
+    speed_up = results["previous"] / results["single_serialisation"]
+    print(f"{'speed-up':>22}: {speed_up:9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
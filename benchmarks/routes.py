@@ -0,0 +1,397 @@
+"""
+Benchmark of the PTT REST routes against an in-memory ODA.
+
+Seeds an InMemoryODA with the requested numbers of SBDs, SBIs, EBs and Projects,
+installs it in place of the ODA of every router and drives each route of the
+application in process, through its ASGI interface, with a fixed number of
+concurrent clients. Latency percentiles, throughput, the ODA round trips per
+request and the peak RSS of the process are printed and written to a JSON file,
+so results can be compared across releases.
+
+Run with::
+
+    poetry run python benchmarks/routes.py --entities 1000 --concurrency 20
+
+and compare two result files with::
+
+    poetry run python benchmarks/routes.py --compare old.json new.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import httpx
+from fastapi.routing import APIRoute
+from in_memory_oda import ENTITIES, InMemoryODA, load_samples
+
+from ska_oso_ptt_services.app import API_PREFIX, create_app
+from ska_oso_ptt_services.routers import entities, health, status
+
+ROUTER_MODULES = (entities, status, health)
+
+# Routes that never complete and so cannot be timed request by request
+SKIPPED_ROUTES = {("GET", "/status/stream")}
+
+LIST_QUERY = {
+    "query_type": "created_between",
+    "created_after": "2000-01-01T00:00:00+00:00",
+}
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+class Scenario(NamedTuple):
+    name: str
+    method: str
+    route: str
+    request: Callable[[int], Dict[str, Any]]
+
+
+def entity_scenarios(entity_type: str, oda: InMemoryODA, page_size: int):
+    prefix = f"/{entity_type}s"
+    ids = oda.entity_ids(entity_type)
+    status_sample = load_samples(ENTITIES[entity_type][4])[0]
+
+    def entity_id(index: int) -> str:
+        return ids[index % len(ids)]
+
+    def status_body(index: int) -> Dict[str, Any]:
+        return {
+            "current_status": status_sample["current_status"],
+            "previous_status": status_sample["previous_status"],
+            f"{entity_type}_ref": entity_id(index),
+            f"{entity_type}_version": 1,
+        }
+
+    return [
+        Scenario(
+            f"GET {prefix}?page_size={page_size}",
+            "GET",
+            prefix,
+            lambda index: {"params": {**LIST_QUERY, "page_size": page_size}},
+        ),
+        Scenario(
+            f"GET {prefix} (all, ndjson)",
+            "GET",
+            prefix,
+            lambda index: {
+                "params": LIST_QUERY,
+                "headers": {"accept": "application/x-ndjson"},
+            },
+        ),
+        Scenario(
+            f"POST {prefix}/batch_get",
+            "POST",
+            f"{prefix}/batch_get",
+            lambda index: {
+                "json": {"ids": [entity_id(index + offset) for offset in range(100)]}
+            },
+        ),
+        Scenario(
+            f"GET {prefix}/{{{entity_type}_id}}",
+            "GET",
+            f"{prefix}/{{{entity_type}_id}}",
+            lambda index: {"url": f"{prefix}/{entity_id(index)}"},
+        ),
+        Scenario(
+            f"GET {prefix}/{{{entity_type}_id}}/status",
+            "GET",
+            f"{prefix}/{{{entity_type}_id}}/status",
+            lambda index: {"url": f"{prefix}/{entity_id(index)}/status"},
+        ),
+        Scenario(
+            f"PUT {prefix}/{{{entity_type}_id}}/status",
+            "PUT",
+            f"{prefix}/{{{entity_type}_id}}/status",
+            lambda index: {
+                "url": f"{prefix}/{entity_id(index)}/status",
+                "json": status_body(index),
+            },
+        ),
+        Scenario(
+            f"GET {prefix}/status/history",
+            "GET",
+            f"{prefix}/status/history",
+            lambda index: {"params": {"entity_id": entity_id(index), "version": 1}},
+        ),
+        Scenario(
+            f"GET {prefix}/status/history?latest=1",
+            "GET",
+            f"{prefix}/status/history",
+            lambda index: {
+                "params": {"entity_id": entity_id(index), "version": 1, "latest": 1}
+            },
+        ),
+    ]
+
+
+def status_scenarios(oda: InMemoryODA) -> List[Scenario]:
+    sbi_ids = oda.entity_ids("sbi")
+    eb_ids = oda.entity_ids("eb")
+
+    def bulk_body(index: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "current_status": "Executing",
+                "previous_status": "Created",
+                "sbi_ref": sbi_ids[index % len(sbi_ids)],
+                "sbi_version": 1,
+            },
+            {
+                "current_status": "Fully Observed",
+                "previous_status": "Created",
+                "eb_ref": eb_ids[index % len(eb_ids)],
+                "eb_version": 1,
+            },
+        ]
+
+    return [
+        Scenario(
+            "GET /status/get_entity",
+            "GET",
+            "/status/get_entity",
+            lambda index: {"params": {"entity_name": list(ENTITIES)[index % 4]}},
+        ),
+        Scenario(
+            "GET /status/summary",
+            "GET",
+            "/status/summary",
+            lambda index: {"params": LIST_QUERY},
+        ),
+        Scenario("GET /status/cache", "GET", "/status/cache", lambda index: {}),
+        Scenario("GET /health/ready", "GET", "/health/ready", lambda index: {}),
+        Scenario(
+            "PUT /status/bulk",
+            "PUT",
+            "/status/bulk",
+            lambda index: {"json": bulk_body(index)},
+        ),
+    ]
+
+
+def check_coverage(app, scenarios: List[Scenario]) -> None:
+    """
+    Fails when a route of the application has no scenario, so that new routes
+    are added to the benchmark
+    """
+    covered = {(scenario.method, scenario.route) for scenario in scenarios}
+    missing = [
+        (method, route.path[len(API_PREFIX) :])
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+        if (method, route.path[len(API_PREFIX) :]) not in covered | SKIPPED_ROUTES
+    ]
+    if missing:
+        raise SystemExit(f"Routes without a benchmark scenario: {missing}")
+
+
+def peak_rss_bytes() -> int:
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def percentile(latencies: List[float], fraction: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    oda: InMemoryODA,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> Dict[str, Any]:
+    async def send(index: int) -> float:
+        request = scenario.request(index)
+        started = time.perf_counter()
+        response = await client.request(
+            scenario.method,
+            API_PREFIX + request.get("url", scenario.route),
+            params=request.get("params"),
+            json=request.get("json"),
+            headers=request.get("headers"),
+        )
+        elapsed = time.perf_counter() - started
+        if response.status_code >= 400 or '"result_status":"failed"' in response.text:
+            raise RuntimeError(
+                f"{scenario.name} failed with {response.status_code}: "
+                f"{response.text[:500]}"
+            )
+        return elapsed
+
+    for index in range(warmup):
+        await send(index)
+
+    queue = asyncio.Queue()
+    for index in range(requests):
+        queue.put_nowait(index)
+    latencies = []
+
+    async def worker() -> None:
+        while not queue.empty():
+            latencies.append(await send(queue.get_nowait()))
+
+    round_trips = oda.round_trips
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "name": scenario.name,
+        "requests": requests,
+        "throughput_rps": requests / elapsed,
+        "latency_ms": {
+            "mean": statistics.fmean(latencies) * 1000,
+            "p50": percentile(latencies, 0.50) * 1000,
+            "p90": percentile(latencies, 0.90) * 1000,
+            "p99": percentile(latencies, 0.99) * 1000,
+            "max": max(latencies) * 1000,
+        },
+        "oda_round_trips_per_request": (oda.round_trips - round_trips) / requests,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def environment() -> Dict[str, Any]:
+    try:
+        version = metadata.version("ska-oso-ptt-services")
+    except metadata.PackageNotFoundError:
+        version = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "version": version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+    }
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    oda = InMemoryODA(latency_seconds=args.oda_latency_ms / 1000)
+    oda.seed(
+        {entity_type: args.entities for entity_type in ENTITIES},
+        statuses_per_entity=args.statuses,
+    )
+    for module in ROUTER_MODULES:
+        module.oda = oda
+
+    app = create_app()
+    scenarios = [
+        scenario
+        for entity_type in ENTITIES
+        for scenario in entity_scenarios(entity_type, oda, args.page_size)
+    ] + status_scenarios(oda)
+    check_coverage(app, scenarios)
+
+    results = []
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://benchmark"
+    ) as client:
+        for scenario in scenarios:
+            if args.only and args.only not in scenario.name:
+                continue
+            result = await run_scenario(
+                client, oda, scenario, args.requests, args.concurrency, args.warmup
+            )
+            results.append(result)
+            print(
+                f"{result['name']:<42} {result['throughput_rps']:9.1f} req/s  "
+                f"p50 {result['latency_ms']['p50']:8.2f} ms  "
+                f"p99 {result['latency_ms']['p99']:8.2f} ms  "
+                f"{result['oda_round_trips_per_request']:7.1f} ODA calls"
+            )
+
+    return {
+        "environment": environment(),
+        "parameters": {
+            "entities": args.entities,
+            "statuses_per_entity": args.statuses,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "page_size": args.page_size,
+            "oda_latency_ms": args.oda_latency_ms,
+        },
+        "results": results,
+        "peak_rss_bytes": peak_rss_bytes(),
+    }
+
+
+def compare(baseline_file: str, candidate_file: str) -> None:
+    with open(baseline_file, "r", encoding="utf-8") as file:
+        baseline = {result["name"]: result for result in json.load(file)["results"]}
+    with open(candidate_file, "r", encoding="utf-8") as file:
+        candidate = json.load(file)["results"]
+
+    for result in candidate:
+        previous = baseline.get(result["name"])
+        if previous is None:
+            continue
+        print(
+            f"{result['name']:<42} throughput "
+            f"{result['throughput_rps'] / previous['throughput_rps']:6.2f}x  p99 "
+            f"{result['latency_ms']['p99'] / previous['latency_ms']['p99']:6.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entities", type=int, default=1000)
+    parser.add_argument("--statuses", type=int, default=3)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--oda-latency-ms", type=float, default=1.0)
+    parser.add_argument("--only", help="Only run the scenarios containing this")
+    parser.add_argument("--output", help="Result file, by default in results/")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    report = asyncio.run(run(args))
+
+    output: Optional[str] = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(
+            RESULTS_DIR,
+            f"routes-{report['environment']['version']}-"
+            f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json",
+        )
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
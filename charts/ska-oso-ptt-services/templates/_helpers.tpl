@@ -43,3 +43,20 @@ Create chart name and version as used by the chart label.
 {{- define "ska-oso-ptt-services.chart" -}}
 {{- printf "%s-%s" .Chart.Name .Chart.Version | replace "+" "_" | trunc 63 | trimSuffix "-" -}}
 {{- end -}}
+
+{{/*
+Number of uvicorn worker processes, rest.server.workers or else one per core of
+the CPU limit
+*/}}
+{{- define "ska-oso-ptt-services.workers" -}}
+{{- if .Values.rest.server.workers -}}
+{{- .Values.rest.server.workers -}}
+{{- else -}}
+{{- $cpu := toString .Values.rest.resources.limits.cpu -}}
+{{- if hasSuffix "m" $cpu -}}
+{{- max 1 (div (trimSuffix "m" $cpu | atoi) 1000) -}}
+{{- else -}}
+{{- max 1 ($cpu | float64 | floor | int) -}}
+{{- end -}}
+{{- end -}}
+{{- end -}}
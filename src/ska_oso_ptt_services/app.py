@@ -4,6 +4,7 @@ ska_oso_ptt_services app.py
 
 import logging
 import os
+from functools import partial
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -11,6 +12,8 @@ from ska_db_oda.persistence import oda
 from ska_db_oda.persistence.domain.errors import StatusHistoryException
 from ska_ser_logging import configure_logging
 
+from ska_oso_ptt_services.common.compression import CompressionMiddleware
+from ska_oso_ptt_services.common.constant import entity_descriptors
 from ska_oso_ptt_services.common.error_handling import (
     EntityNotFound,
     ODANotFound,
@@ -20,10 +23,22 @@ from ska_oso_ptt_services.common.error_handling import (
     oda_status_error_handler,
     oda_validation_error_handler,
 )
-from ska_oso_ptt_services.routers.ebs import eb_router
-from ska_oso_ptt_services.routers.prjs import prj_router
-from ska_oso_ptt_services.routers.sbds import sbd_router
-from ska_oso_ptt_services.routers.sbis import sbi_router
+from ska_oso_ptt_services.common.lifecycle import (
+    close_oda,
+    configure_threadpool,
+    init_oda,
+)
+from ska_oso_ptt_services.common.metrics import (
+    PrometheusMiddleware,
+    mark_worker_dead,
+    metrics_endpoint,
+)
+from ska_oso_ptt_services.common.oda_pool import ODAPoolSettings, configure_oda_pools
+from ska_oso_ptt_services.common.profiling import ProfilingMiddleware
+from ska_oso_ptt_services.common.read_only_uow import open_read_replica_pool
+from ska_oso_ptt_services.common.startup import startup_timer
+from ska_oso_ptt_services.routers.entities import add_entity_routes
+from ska_oso_ptt_services.routers.health import health_router
 from ska_oso_ptt_services.routers.status import status_router
 
 KUBE_NAMESPACE = os.getenv("KUBE_NAMESPACE", "ska-oso-ptt-services")
@@ -34,13 +49,25 @@ API_PREFIX = f"/{KUBE_NAMESPACE}/ptt/api/v{PTT_MAJOR_VERSION}"
 
 PRODUCTION = os.getenv("PRODUCTION", "false").lower() == "true"
 
+# Profiles the requests sent with the X-Profile header, see common/profiling.py
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() == "true"
+
 ODA_BACKEND_TYPE = os.getenv("ODA_BACKEND_TYPE", "postgres")
+# Connection pools of the Postgres ODA, see common/oda_pool.py
+ODA_POOL_SETTINGS = ODAPoolSettings(
+    min_size=int(os.getenv("ODA_POOL_MIN_SIZE", "4")),
+    max_size=int(os.getenv("ODA_POOL_MAX_SIZE", "20")),
+    timeout_seconds=float(os.getenv("ODA_POOL_TIMEOUT_SECONDS", "10")),
+    max_lifetime_seconds=float(os.getenv("ODA_POOL_MAX_LIFETIME_SECONDS", "3600")),
+)
+# Optional Postgres read replica serving the GET routes, see common/read_only_uow.py
+ODA_READ_REPLICA_DSN = os.getenv("ODA_READ_REPLICA_DSN")
 
 LOGGER = logging.getLogger(__name__)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
 
-def create_app(production=PRODUCTION) -> FastAPI:
+def create_app(production=PRODUCTION, profiling=PROFILING_ENABLED) -> FastAPI:
     """
     Create the Connexion application with required config
     """
@@ -56,13 +83,24 @@ def create_app(production=PRODUCTION) -> FastAPI:
         allow_headers=["*"],
         allow_credentials=True,
     )
+    app.add_middleware(CompressionMiddleware)
+    app.add_middleware(PrometheusMiddleware)
+    if profiling:
+        app.add_middleware(ProfilingMiddleware)
 
     # Assemble the constituent APIs:
-    app.include_router(sbd_router, prefix=API_PREFIX)
-    app.include_router(sbi_router, prefix=API_PREFIX)
-    app.include_router(eb_router, prefix=API_PREFIX)
-    app.include_router(prj_router, prefix=API_PREFIX)
+    for descriptor in entity_descriptors.values():
+        add_entity_routes(app.router, descriptor, prefix=API_PREFIX)
     app.include_router(status_router, prefix=API_PREFIX)
+    app.include_router(health_router, prefix=API_PREFIX)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    if profiling:
+        # Only imported when profiling is enabled
+        from ska_oso_ptt_services.routers.profiles import (  # pylint: disable=C0415
+            profile_router,
+        )
+
+        app.include_router(profile_router, prefix=API_PREFIX)
 
     # Add handles for different types of error
     app.exception_handler(ODANotFound)(oda_not_found_handler)
@@ -73,8 +111,36 @@ def create_app(production=PRODUCTION) -> FastAPI:
 
     if not production:
         app.exception_handler(Exception)(dangerous_internal_server_handler)
+
+    # Event handlers rather than a lifespan, which would replace the handlers
+    # registered by oda.init_app
+    app.add_event_handler("startup", configure_threadpool)
+    app.add_event_handler("shutdown", partial(close_oda, oda))
+    app.add_event_handler("shutdown", mark_worker_dead)
+    return app
+
+
+def create_main_app() -> FastAPI:
+    """
+    Create the application served by uvicorn, with the ODA initialised on startup
+    and the start of the worker timed, see common/startup.py
+    """
+    startup_timer.record_imports()
+    with startup_timer.phase("create_app"):
+        app = create_app()
+
+    app.router.on_startup.insert(0, startup_timer.startup_started)
+    app.add_event_handler("startup", partial(init_oda, oda, app))
+    # Registered after init_oda so that it runs once the ODA has created its pools
+    app.add_event_handler(
+        "startup", partial(configure_oda_pools, oda, ODA_POOL_SETTINGS)
+    )
+    app.add_event_handler(
+        "startup",
+        partial(open_read_replica_pool, ODA_READ_REPLICA_DSN, ODA_POOL_SETTINGS),
+    )
+    app.add_event_handler("startup", startup_timer.startup_completed)
     return app
 
 
-main = create_app()
-oda.init_app(main)
+main = create_main_app()
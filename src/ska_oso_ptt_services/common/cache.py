@@ -0,0 +1,139 @@
+"""
+This module contains the in-process cache of entity statuses read from the ODA.
+
+The cache is bounded (least recently used entries are evicted first) and every
+entry expires after a time to live, which bounds how stale a status can be when it
+is changed by another worker process of the service, or another service writing
+to the ODA.
+
+A status changed through this worker is written through to the cache once the
+change is committed, so the following reads of that entity version in this
+worker get the new status without a lookup in the ODA status history.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+STATUS_CACHE_MAXSIZE = int(os.getenv("STATUS_CACHE_MAXSIZE", "10000"))
+STATUS_CACHE_TTL_SECONDS = float(os.getenv("STATUS_CACHE_TTL_SECONDS", "30"))
+
+
+class TTLCache:
+    """
+    Thread safe LRU cache whose entries expire after a fixed time to live.
+    A maxsize or ttl of zero disables the cache.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Takes a key and returns the cached value, or None when the key is not
+        cached or its entry has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._timer():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Takes a key and a value and caches the value, evicting the least
+        recently used entry when the cache is full
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (self._timer() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Takes a predicate and removes every entry whose key satisfies it
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the counters
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Returns the counters and the sizing of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+            }
+
+
+class EntityStatusCache(TTLCache):
+    """
+    TTLCache of current entity statuses keyed on (entity type, id, version).
+    The version is None for the latest version of the entity.
+    """
+
+    def invalidate_entity(self, entity_type: str, entity_id: str) -> None:
+        """
+        Takes an entity type and identifier and removes the cached status of
+        every version of that entity
+        """
+        self.invalidate(lambda key: key[0] == entity_type and key[1] == entity_id)
+
+    def record_status(
+        self, entity_type: str, entity_id: str, entity_version: Any, status: Any
+    ) -> None:
+        """
+        Takes a committed status history row and caches it for its entity
+        version. The other versions of the entity, and its latest version, are
+        invalidated as the row may change which is current.
+        """
+        self.invalidate_entity(entity_type, entity_id)
+        self.set((entity_type, entity_id, str(entity_version)), status)
+
+
+status_cache = EntityStatusCache(
+    maxsize=STATUS_CACHE_MAXSIZE, ttl=STATUS_CACHE_TTL_SECONDS
+)
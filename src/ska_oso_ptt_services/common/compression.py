@@ -0,0 +1,260 @@
+"""
+This module contains the compression of responses, negotiated with the
+Accept-Encoding header of the request.
+
+gzip is always available. zstd and brotli are used when the client accepts them
+and the zstandard or brotli package of the compression extra, installed in the
+image, is available, the first supported of zstd, br and gzip with the highest q
+value of the client being chosen.
+
+Responses smaller than COMPRESSION_MINIMUM_SIZE are sent uncompressed. Streaming
+responses, e.g. NDJSON listings, are compressed incrementally, every chunk being
+flushed so that the client can decode it as soon as it is received. Server-Sent
+Events are never compressed.
+
+The entity tag of a compressed response gets the content coding appended, e.g.
+"abc-gzip", as the compressed and the uncompressed bodies are different
+representations. A 304 Not Modified answering a client holding the compressed
+representation carries the entity tag of that representation.
+"""
+
+import os
+import zlib
+from typing import Callable, Dict, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ska_oso_ptt_services.common.etag import encoded_etag
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+
+# Media types that must reach the client unbuffered and unencoded
+UNCOMPRESSED_MEDIA_TYPES = ("text/event-stream",)
+
+BODILESS_STATUS_CODES = (204, 304)
+
+
+class _GzipEncoder:
+    def __init__(self) -> None:
+        self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zlib.Z_SYNC_FLUSH
+        )
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+class _ZstdEncoder:
+    def __init__(self) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_BLOCK
+        )
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush(
+            zstandard.COMPRESSOBJ_FLUSH_FINISH
+        )
+
+
+class _BrotliEncoder:
+    def __init__(self) -> None:
+        self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data) + self._compressor.flush()
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.process(data) + self._compressor.finish()
+
+
+def available_encoders() -> Dict[str, Callable]:
+    """
+    Returns the encoders supported by this process keyed by content coding, in
+    order of preference
+    """
+    encoders = {}
+    if zstandard is not None:
+        encoders["zstd"] = _ZstdEncoder
+    if brotli is not None:
+        encoders["br"] = _BrotliEncoder
+    encoders["gzip"] = _GzipEncoder
+    return encoders
+
+
+def negotiate_encoding(accept_encoding: str, supported: List[str]) -> Optional[str]:
+    """
+    Takes an Accept-Encoding header and the supported content codings in order of
+    preference and returns the coding to use, or None to send the response as is
+    :param accept_encoding: Accept-Encoding header of the request
+    :param supported: supported content codings, preferred first
+    """
+    weights: Dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.strip().partition(";")
+        weight = 1.0
+        if params.strip().startswith("q="):
+            try:
+                weight = float(params.strip()[2:])
+            except ValueError:
+                weight = 0.0
+        if name.strip():
+            weights[name.strip().lower()] = weight
+
+    candidates = [
+        (weights.get(coding, weights.get("*", 0.0)), -index, coding)
+        for index, coding in enumerate(supported)
+    ]
+    weight, _, coding = max(candidates, default=(0.0, 0, None))
+    return coding if weight > 0 else None
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing the responses with the content coding negotiated
+    with the client
+    """
+
+    def __init__(
+        self, app: ASGIApp, minimum_size: int = COMPRESSION_MINIMUM_SIZE
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoders = available_encoders()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        coding = negotiate_encoding(
+            request_headers.get("accept-encoding", ""), list(self.encoders)
+        )
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(
+            send,
+            coding,
+            self.encoders[coding],
+            self.minimum_size,
+            if_none_match=request_headers.get("if-none-match", ""),
+        )
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressingResponder:
+    """
+    Wraps the send callable of one response. The response start is held back
+    until the first body message shows whether the response is large enough, or
+    streamed, and so whether it is compressed.
+    """
+
+    def __init__(
+        self,
+        send: Send,
+        coding: str,
+        encoder: Callable,
+        minimum_size: int,
+        if_none_match: str = "",
+    ) -> None:
+        self._send = send
+        self._coding = coding
+        self._if_none_match = if_none_match
+        self._encoder_factory = encoder
+        self._minimum_size = minimum_size
+        self._start: Optional[Message] = None
+        self._encoder = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message.get("headers", []))
+            self._passthrough = (
+                message["status"] in BODILESS_STATUS_CODES
+                or "content-encoding" in headers
+                or headers.get("content-type", "").startswith(UNCOMPRESSED_MEDIA_TYPES)
+            )
+            if self._passthrough:
+                await self._send(self._not_modified_start(message))
+            else:
+                self._start = message
+            return
+
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            if not more_body and len(body) < self._minimum_size:
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            self._encoder = self._encoder_factory()
+            headers = MutableHeaders(raw=list(start.get("headers", [])))
+            headers["Content-Encoding"] = self._coding
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], self._coding)
+            headers.add_vary_header("Accept-Encoding")
+            if "content-length" in headers:
+                del headers["content-length"]
+            if not more_body:
+                body = self._encoder.finish(body)
+                headers["Content-Length"] = str(len(body))
+                await self._send({**start, "headers": headers.raw})
+                await self._send({**message, "body": body})
+                return
+            await self._send({**start, "headers": headers.raw})
+
+        body = self._encoder.compress(body) if more_body else self._encoder.finish(body)
+        await self._send({**message, "body": body})
+
+    def _not_modified_start(self, message: Message) -> Message:
+        """
+        Returns the start of a passed through response, with the entity tag of
+        the compressed representation when it is a 304 Not Modified answering a
+        client that holds that representation
+        """
+        headers = Headers(raw=message.get("headers", []))
+        if message["status"] != 304 or "etag" not in headers:
+            return message
+
+        etag = encoded_etag(headers["etag"], self._coding)
+        client_etags = {
+            client_etag.strip().removeprefix("W/")
+            for client_etag in self._if_none_match.split(",")
+        }
+        if etag.removeprefix("W/") not in client_etags:
+            return message
+
+        mutable_headers = MutableHeaders(raw=list(message.get("headers", [])))
+        mutable_headers["ETag"] = etag
+        mutable_headers.add_vary_header("Accept-Encoding")
+        return {**message, "headers": mutable_headers.raw}
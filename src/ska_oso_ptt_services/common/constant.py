@@ -1,18 +1,145 @@
 from enum import EnumMeta
-from typing import Dict
+from typing import Dict, NamedTuple, Type
 
+from pydantic import BaseModel
+from ska_oso_pdm import OSOExecutionBlock, Project, SBDefinition, SBInstance
 from ska_oso_pdm.entity_status_history import (
     OSOEBStatus,
+    OSOEBStatusHistory,
     ProjectStatus,
+    ProjectStatusHistory,
     SBDStatus,
+    SBDStatusHistory,
     SBIStatus,
+    SBIStatusHistory,
 )
 
+from ska_oso_ptt_services.models.models import (
+    EBStatusModel,
+    ProjectStatusModel,
+    SBDefinitionStatusModel,
+    SBInstanceStatusModel,
+)
+
+
+class StatusHistoryDescriptor(NamedTuple):
+    model: Type[BaseModel]
+    repository: str
+    ref_field: str
+    version_field: str
+    # Table of the status history in the Postgres ODA, see common/oda_sql.py
+    table: str
+
+
+class EntityDescriptor(NamedTuple):
+    """
+    Everything the entity routes need to know about one entity type, see
+    routers/entities.py
+    """
+
+    # Key of the entity type, e.g. sbd
+    entity_type: str
+    # Name used in the route summaries, e.g. SB Definition
+    display_name: str
+    # OpenAPI tag of the routes, e.g. SBD
+    tag: str
+    # PDM model of the entity
+    model: Type[BaseModel]
+    # Response model of the entity with its status appended
+    status_model: Type[BaseModel]
+    status_enum: EnumMeta
+    # ODA repository of the entity, e.g. sbds
+    repository: str
+    # Identifier attribute of the entity, e.g. sbd_id
+    id_field: str
+    # Table of the entity in the Postgres ODA, see common/oda_sql.py
+    table: str
+    status_history: StatusHistoryDescriptor
+
+
+entity_descriptors: Dict[str, EntityDescriptor] = {
+    "sbi": EntityDescriptor(
+        entity_type="sbi",
+        display_name="SB Instance",
+        tag="SBI",
+        model=SBInstance,
+        status_model=SBInstanceStatusModel,
+        status_enum=SBIStatus,
+        repository="sbis",
+        id_field="sbi_id",
+        table="tab_oda_sbi",
+        status_history=StatusHistoryDescriptor(
+            SBIStatusHistory,
+            "sbis_status_history",
+            "sbi_ref",
+            "sbi_version",
+            "tab_oda_sbi_status_history",
+        ),
+    ),
+    "eb": EntityDescriptor(
+        entity_type="eb",
+        display_name="Execution Block",
+        tag="EB",
+        model=OSOExecutionBlock,
+        status_model=EBStatusModel,
+        status_enum=OSOEBStatus,
+        repository="ebs",
+        id_field="eb_id",
+        table="tab_oda_eb",
+        status_history=StatusHistoryDescriptor(
+            OSOEBStatusHistory,
+            "ebs_status_history",
+            "eb_ref",
+            "eb_version",
+            "tab_oda_eb_status_history",
+        ),
+    ),
+    "prj": EntityDescriptor(
+        entity_type="prj",
+        display_name="Project",
+        tag="PRJ",
+        model=Project,
+        status_model=ProjectStatusModel,
+        status_enum=ProjectStatus,
+        repository="prjs",
+        id_field="prj_id",
+        table="tab_oda_prj",
+        status_history=StatusHistoryDescriptor(
+            ProjectStatusHistory,
+            "prjs_status_history",
+            "prj_ref",
+            "prj_version",
+            "tab_oda_prj_status_history",
+        ),
+    ),
+    "sbd": EntityDescriptor(
+        entity_type="sbd",
+        display_name="SB Definition",
+        tag="SBD",
+        model=SBDefinition,
+        status_model=SBDefinitionStatusModel,
+        status_enum=SBDStatus,
+        repository="sbds",
+        id_field="sbd_id",
+        table="tab_oda_sbd",
+        status_history=StatusHistoryDescriptor(
+            SBDStatusHistory,
+            "sbds_status_history",
+            "sbd_ref",
+            "sbd_version",
+            "tab_oda_sbd_status_history",
+        ),
+    ),
+}
+
 entity_map: Dict[str, EnumMeta] = {
-    "sbi": SBIStatus,
-    "eb": OSOEBStatus,
-    "prj": ProjectStatus,
-    "sbd": SBDStatus,
+    entity_type: descriptor.status_enum
+    for entity_type, descriptor in entity_descriptors.items()
+}
+
+status_history_map: Dict[str, StatusHistoryDescriptor] = {
+    entity_type: descriptor.status_history
+    for entity_type, descriptor in entity_descriptors.items()
 }
 
 API_RESPONSE_RESULT_STATUS_SUCCESS = "success"
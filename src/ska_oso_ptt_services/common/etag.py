@@ -0,0 +1,115 @@
+"""
+This module contains the helpers for conditional GET requests: building entity tags
+and answering If-None-Match requests with 304 Not Modified.
+
+A compressed response is a different representation from the uncompressed one, so
+CompressionMiddleware appends the content coding to its entity tag, e.g.
+"abc-gzip". is_not_modified ignores that suffix, a client holding either
+representation being answered with 304.
+"""
+
+import hashlib
+from http import HTTPStatus
+from typing import Dict, Optional
+
+from fastapi import Request, Response
+
+# Conditional GET resources may be stored, but must be revalidated before reuse
+REVALIDATE_HEADERS = {"Cache-Control": "no-cache"}
+
+# Content codings CompressionMiddleware may append to an entity tag
+ETAG_CODINGS = ("gzip", "br", "zstd")
+
+
+def make_etag(*parts) -> str:
+    """
+    Takes the values identifying a representation and returns a strong entity tag
+    :param parts: values identifying the representation, e.g. versions and dates
+
+    Returns quoted entity tag
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def body_etag(body: bytes) -> str:
+    """
+    Takes a response body and returns a strong entity tag derived from its content
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def metadata_etag(*entities) -> str:
+    """
+    Takes entities, as PDM objects or their JSON dictionaries, and returns an entity
+    tag derived from the version and last modified date of each of them
+    :param entities: e.g. an entity and its current status
+
+    Returns quoted entity tag, which changes whenever one of the entities is
+    modified or gets a new version
+    """
+    parts = []
+    for entity in entities:
+        metadata = entity["metadata"] if isinstance(entity, dict) else entity.metadata
+        if isinstance(metadata, dict):
+            parts.extend((metadata.get("version"), metadata.get("last_modified_on")))
+        else:
+            parts.extend((metadata.version, metadata.last_modified_on))
+
+    return make_etag(*parts)
+
+
+def encoded_etag(etag: str, coding: str) -> str:
+    """
+    Takes the entity tag of a representation and a content coding and returns the
+    entity tag of the representation encoded with that coding
+    :param etag: quoted entity tag, strong or weak
+    :param coding: content coding, e.g. gzip
+
+    Returns quoted entity tag with the coding appended, e.g. "abc-gzip"
+    """
+    return f'{etag[:-1]}-{coding}"' if etag.endswith('"') else etag
+
+
+def decoded_etag(etag: str) -> str:
+    """
+    Takes an entity tag, possibly weak or carrying a content coding, and returns
+    the strong entity tag of the unencoded representation
+    """
+    etag = etag.strip().removeprefix("W/")
+    for coding in ETAG_CODINGS:
+        if etag.endswith(f'-{coding}"'):
+            return f'{etag[: -len(coding) - 2]}"'
+    return etag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Takes the incoming request and the entity tag of the current representation
+    and returns whether the client already holds that representation
+    :param request: incoming request
+    :param etag: entity tag of the current representation
+
+    Returns True when an If-None-Match header matches the entity tag, using the
+    weak comparison RFC 9110 prescribes for If-None-Match, whatever content coding
+    the client received the representation with
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+
+    client_etags = {
+        decoded_etag(client_etag) for client_etag in if_none_match.split(",")
+    }
+    return "*" in client_etags or decoded_etag(etag) in client_etags
+
+
+def not_modified_response(
+    etag: str, headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """
+    Takes an entity tag and returns the 304 Not Modified response for it
+    """
+    return Response(
+        status_code=HTTPStatus.NOT_MODIFIED, headers={**(headers or {}), "ETag": etag}
+    )
@@ -0,0 +1,118 @@
+"""
+This module contains the in-process broker of status change events, published by
+the put_*_history routes once their commit succeeds and consumed by the
+Server-Sent Events feed at /status/stream.
+
+Only status changes made through this process are published, so with several
+worker processes a client sees the changes made through the worker it is
+connected to.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from pydantic import BaseModel
+
+LOGGER = logging.getLogger(__name__)
+
+# Events kept for a subscriber that does not keep up, older events are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+@dataclass
+class _Subscriber:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue
+    entity_type: Optional[str]
+    entity_id: Optional[str]
+
+    def matches(self, entity_type: str, entity_id: str) -> bool:
+        return (self.entity_type is None or self.entity_type == entity_type) and (
+            self.entity_id is None or self.entity_id == entity_id
+        )
+
+
+def _put_dropping_oldest(queue: asyncio.Queue, event: str) -> None:
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+class StatusEventBroker:
+    """
+    Fans status change events out to the subscribed event loops. publish may be
+    called from any thread, e.g. from the threadpool running sync routes.
+    """
+
+    def __init__(self, queue_size: int = SUBSCRIBER_QUEUE_SIZE) -> None:
+        self._queue_size = queue_size
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def subscribe(
+        self, entity_type: Optional[str] = None, entity_id: Optional[str] = None
+    ) -> Iterator[asyncio.Queue]:
+        """
+        Takes optional entity type and identifier filters and yields a queue
+        receiving the matching events, serialised to JSON. Must be entered from
+        a running event loop.
+        """
+        subscriber = _Subscriber(
+            loop=asyncio.get_running_loop(),
+            queue=asyncio.Queue(maxsize=self._queue_size),
+            entity_type=entity_type,
+            entity_id=entity_id,
+        )
+        with self._lock:
+            self._subscribers.append(subscriber)
+        try:
+            yield subscriber.queue
+        finally:
+            with self._lock:
+                self._subscribers.remove(subscriber)
+
+    def publish(self, entity_type: str, entity_id: str, status: BaseModel) -> None:
+        """
+        Takes a committed status change and delivers it to every subscriber whose
+        filters match
+        :param entity_type: key of the entity in entity_map
+        :param entity_id: identifier of the entity
+        :param status: persisted status history of the entity
+        """
+        with self._lock:
+            subscribers = [
+                subscriber
+                for subscriber in self._subscribers
+                if subscriber.matches(entity_type, entity_id)
+            ]
+        if not subscribers:
+            return
+
+        event = json.dumps(
+            {
+                "entity_type": entity_type,
+                "entity_id": entity_id,
+                "status": status.model_dump(mode="json"),
+            }
+        )
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(
+                    _put_dropping_oldest, subscriber.queue, event
+                )
+            except RuntimeError:
+                LOGGER.debug("Dropping status event for a closed event loop")
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+status_events = StatusEventBroker()
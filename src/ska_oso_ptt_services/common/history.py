@@ -0,0 +1,214 @@
+"""
+This module contains the bounded queries of the status history routes.
+
+``since`` and ``until`` select the rows modified in a time range, ``limit`` and
+``cursor`` page through them, newest first, with the keyset pagination of the
+list routes, and ``latest`` returns only the newest rows. Without any of them
+every row is returned in the order of the ODA, as before.
+
+The ODA status history query takes no time range or limit, so the rows are still
+read in full and bounded in the service, which keeps the responses small. The
+current status of an entity version, ``latest=1`` with a version, is resolved
+from the status cache instead, without querying the history at all.
+
+Several rows can share a last modified date, so the rows are ordered, and the
+cursor keyed, by last modified date and then by a key unique to the row: its
+identifier in the status history table on a Postgres ODA, read with
+query_status_history_rows, and its position in the order of the ODA query, to
+which rows are only appended, otherwise.
+"""
+
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import Query
+from ska_db_oda.persistence.domain.errors import ODANotFound as ODARepositoryNotFound
+
+from ska_oso_ptt_services.common.constant import status_history_map
+from ska_oso_ptt_services.common.error_handling import ODANotFound
+from ska_oso_ptt_services.common.oda_sql import query_status_history_rows
+from ska_oso_ptt_services.common.pagination import (
+    MAX_PAGE_SIZE,
+    PaginationParameters,
+    paginate_by_key,
+)
+from ska_oso_ptt_services.common.utils import common_get_entity_status
+
+
+@dataclass
+class StatusHistoryParameters:
+    since: Optional[datetime] = None
+    until: Optional[datetime] = None
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+    latest: Optional[int] = None
+
+    @property
+    def bounded(self) -> bool:
+        return any(
+            value is not None
+            for value in (self.since, self.until, self.limit, self.cursor, self.latest)
+        )
+
+
+def get_status_history_params(
+    since: Optional[datetime] = Query(
+        default=None,
+        description="Only return the statuses modified at or after this date.",
+    ),
+    until: Optional[datetime] = Query(
+        default=None,
+        description="Only return the statuses modified before this date.",
+    ),
+    limit: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of statuses to return, newest first, with the "
+        "cursor of the next page in next_cursor.",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque next_cursor value returned with the previous page.",
+    ),
+    latest: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Only return this many of the newest statuses.",
+    ),
+) -> StatusHistoryParameters:
+    """
+    FastAPI dependency collecting the status history query parameters
+
+    :param since: start of the time range, inclusive
+    :param until: end of the time range, exclusive
+    :param limit: page size
+    :param cursor: next_cursor of the previous page
+    :param latest: number of newest statuses to return
+    :return: StatusHistoryParameters for the request
+    """
+    return StatusHistoryParameters(
+        since=since, until=until, limit=limit, cursor=cursor, latest=latest
+    )
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def select_status_history(
+    rows: List[Any],
+    history: StatusHistoryParameters,
+    row_keys: Optional[Sequence[int]] = None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Takes the status history rows of an entity and returns the requested ones
+    :param rows: rows returned by the ODA status history query
+    :param history: requested time range, page or number of newest rows
+    :param row_keys: key unique to each row, its position in rows when None
+
+    Returns the selected rows, newest first, and the cursor of the next page,
+    which is None when there are no more rows. Without any parameter the rows are
+    returned unchanged.
+    """
+    if not history.bounded:
+        return rows, None
+
+    def modified_on(row: Any) -> datetime:
+        return _aware(row.metadata.last_modified_on)
+
+    keyed_rows = list(zip(row_keys if row_keys is not None else range(len(rows)), rows))
+    if history.since is not None:
+        keyed_rows = [
+            (key, row)
+            for key, row in keyed_rows
+            if modified_on(row) >= _aware(history.since)
+        ]
+    if history.until is not None:
+        keyed_rows = [
+            (key, row)
+            for key, row in keyed_rows
+            if modified_on(row) < _aware(history.until)
+        ]
+
+    def sort_key(keyed_row: Tuple[int, Any]) -> Tuple[datetime, int]:
+        key, row = keyed_row
+        return modified_on(row), key
+
+    if history.latest is not None:
+        selected = heapq.nlargest(history.latest, keyed_rows, key=sort_key)
+        next_cursor = None
+    elif history.limit is None and history.cursor is None:
+        selected = sorted(keyed_rows, key=sort_key, reverse=True)
+        next_cursor = None
+    else:
+        selected, next_cursor = paginate_by_key(
+            keyed_rows,
+            sort_key=sort_key,
+            pagination=PaginationParameters(
+                page_size=history.limit, cursor=history.cursor
+            ),
+        )
+    return [row for _, row in selected], next_cursor
+
+
+def query_status_history(
+    entity_object,
+    entity_type: str,
+    query_params,
+    entity_version: Optional[int],
+    history: StatusHistoryParameters,
+    connection=None,
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Takes a status history repository and the query of a status history route and
+    returns the requested rows and the cursor of the next page
+    :param entity_object: status history repository of the entity type
+    :param entity_type: key of the entity in status_history_map
+    :param query_params: ODA status query of the entity
+    :param entity_version: version requested, None for every version
+    :param history: requested time range, page or number of newest rows
+    :param connection: psycopg connection of a Postgres ODA unit of work, None
+        on the filesystem ODA
+
+    The current status of one entity version is served by
+    common_get_entity_status, sharing status_cache, rather than by reading its
+    whole history.
+    """
+    if (
+        history.latest == 1
+        and entity_version is not None
+        and history.since is None
+        and history.until is None
+    ):
+        try:
+            return [
+                common_get_entity_status(
+                    entity_object=entity_object,
+                    entity_id=query_params.entity_id,
+                    entity_version=entity_version,
+                    entity_type=entity_type,
+                )
+            ], None
+        except (ODANotFound, ODARepositoryNotFound):
+            return [], None
+
+    if connection is not None and history.bounded:
+        keyed_rows = query_status_history_rows(
+            connection,
+            status_history_map[entity_type],
+            entity_id=query_params.entity_id,
+            entity_version=entity_version,
+        )
+        return select_status_history(
+            [row for _, row in keyed_rows],
+            history,
+            row_keys=[key for key, _ in keyed_rows],
+        )
+
+    return select_status_history(
+        entity_object.query(query_params, is_status_history=True), history
+    )
@@ -0,0 +1,72 @@
+"""
+This module contains the startup and shutdown handlers of the application, run
+once per worker process.
+
+On startup the AnyIO thread pool, which runs the sync routes, is sized to
+THREADPOOL_SIZE and the ODA is initialised, rather than when the application is
+imported, so that a worker creates its application without connecting to the
+ODA. On shutdown, once the server has stopped accepting requests and
+the in-flight ones have completed or timed out, the ODA and read replica
+connection pools are closed, so that Postgres sees the connections closed cleanly
+rather than dropped when the process exits.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+
+from anyio import to_thread
+
+from ska_oso_ptt_services.common.oda_pool import oda_connection_pool
+from ska_oso_ptt_services.common.read_only_uow import close_read_replica_pool
+from ska_oso_ptt_services.common.startup import startup_timer
+
+LOGGER = logging.getLogger(__name__)
+
+# Tokens of the AnyIO thread limiter, i.e. sync routes run at the same time
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "40"))
+
+
+async def configure_threadpool() -> None:
+    """
+    Startup handler sizing the AnyIO thread pool of the worker
+    """
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+
+
+async def init_oda(oda, app) -> None:
+    """
+    Startup handler initialising the ODA of the application. The startup
+    handlers registered by oda.init_app are run here, in the order they were
+    registered, so that they run before the handlers registered after this one.
+    """
+    on_startup = app.router.on_startup
+    registered = len(on_startup)
+    with startup_timer.phase("oda_init"):
+        oda.init_app(app)
+
+    oda_handlers = on_startup[registered:]
+    del on_startup[registered:]
+    for handler in oda_handlers:
+        result = handler()
+        if inspect.isawaitable(result):
+            await result
+
+
+async def close_oda(oda) -> None:
+    """
+    Shutdown handler closing the ODA and read replica connection pools of the
+    worker
+    """
+    await asyncio.get_running_loop().run_in_executor(None, close_read_replica_pool)
+
+    pool = oda_connection_pool(oda)
+    if pool is None:
+        return
+
+    LOGGER.info("Closing ODA connection pool %s", getattr(pool, "name", pool))
+    if inspect.iscoroutinefunction(pool.close):
+        await pool.close()
+    else:
+        await asyncio.get_running_loop().run_in_executor(None, pool.close)
@@ -0,0 +1,229 @@
+"""
+This module contains the Prometheus metrics of the service, the middleware
+recording the request latencies and the unit of work timing the ODA calls.
+
+The metrics are served by GET /metrics in the Prometheus text exposition format.
+With several worker processes, PROMETHEUS_MULTIPROC_DIR is set to a directory
+shared by the workers, where prometheus_client keeps the values of each worker,
+and every worker serves the metrics of all of them.
+
+Together the metrics split the latency of a request between the ODA
+(ptt_oda_operation_duration_seconds) and the service code, serialisation
+included, which accounts for the rest of ptt_http_request_duration_seconds.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Directory shared by the worker processes, see above
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+# Route label of the requests not matching any route, so that unknown paths do not
+# create new series
+UNMATCHED_ROUTE = "unmatched"
+
+# Repository methods timed by TimedUnitOfWork
+TIMED_REPOSITORY_METHODS = ("get", "query", "add")
+
+HTTP_REQUEST_DURATION = Histogram(
+    "ptt_http_request_duration_seconds",
+    "Time taken to handle a request, by route template.",
+    ("method", "route", "status_code"),
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "ptt_http_requests_in_progress",
+    "Requests being handled, by route template.",
+    ("method", "route"),
+    multiprocess_mode="livesum",
+)
+ODA_OPERATION_DURATION = Histogram(
+    "ptt_oda_operation_duration_seconds",
+    "Time taken by ODA unit of work and repository operations.",
+    ("operation", "repository"),
+)
+ODA_OPERATION_ERRORS = Counter(
+    "ptt_oda_operation_errors",
+    "ODA unit of work and repository operations that raised an error.",
+    ("operation", "repository"),
+)
+# One series per worker process, labelled by pid, with several workers
+STARTUP_PHASE_DURATION = Gauge(
+    "ptt_startup_phase_seconds",
+    "Time taken by each phase of the start of the worker process.",
+    ("phase",),
+    multiprocess_mode="liveall",
+)
+STARTUP_TIME_TO_READY = Gauge(
+    "ptt_startup_time_to_ready_seconds",
+    "Time from the start of the worker process to the end of its startup " "handlers.",
+    multiprocess_mode="liveall",
+)
+
+
+@contextmanager
+def time_oda_operation(operation: str, repository: str = "") -> Iterator[None]:
+    """
+    Context manager timing an ODA operation and counting its errors
+    :param operation: name of the operation, e.g. uow_open or query
+    :param repository: name of the repository, empty for unit of work operations
+    """
+    with ODA_OPERATION_DURATION.labels(operation, repository).time():
+        try:
+            yield
+        except Exception:
+            ODA_OPERATION_ERRORS.labels(operation, repository).inc()
+            raise
+
+
+class TimedRepository:
+    """
+    Proxy of an ODA repository timing its get, query and add calls
+    """
+
+    def __init__(self, repository, name: str) -> None:
+        self.sync = repository
+        self._name = name
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.sync, name)
+        if name not in TIMED_REPOSITORY_METHODS:
+            return attribute
+
+        def call(*args, **kwargs):
+            with time_oda_operation(name, self._name):
+                return attribute(*args, **kwargs)
+
+        return call
+
+
+class TimedUnitOfWork:
+    """
+    Context manager wrapping an ODA unit of work, timing its opening, closing and
+    commit and the calls to its repositories, which are returned as
+    TimedRepository proxies.
+
+    Example::
+
+        with TimedUnitOfWork(oda.uow()) as uow:
+            uow.sbds_status_history.add(sbd_status_history)
+            uow.commit()
+    """
+
+    def __init__(self, uow) -> None:
+        self._context = uow
+        self._uow = None
+
+    def __enter__(self) -> "TimedUnitOfWork":
+        with time_oda_operation("uow_open"):
+            self._uow = self._context.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        with time_oda_operation("uow_close"):
+            return self._context.__exit__(exc_type, exc_value, traceback)
+
+    def __getattr__(self, name: str) -> Any:
+        if self._uow is None:
+            raise AttributeError(name)
+        return TimedRepository(getattr(self._uow, name), name)
+
+    @property
+    def oda_uow(self) -> Any:
+        """
+        The entered ODA unit of work, unwrapped from a ReadOnlyUnitOfWork
+        """
+        return getattr(self._uow, "oda_uow", self._uow)
+
+    def commit(self) -> None:
+        with time_oda_operation("commit"):
+            self._uow.commit()
+
+
+def _route_template(scope: Scope) -> str:
+    for route in scope["app"].router.routes:
+        match, _ = route.matches(scope)
+        if match == Match.FULL:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """
+    ASGI middleware recording the duration of every HTTP request and the number of
+    requests in progress, labelled by route template rather than by path
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        route = _route_template(scope)
+        status_code = "500"
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = str(message["status"])
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method, route)
+        in_progress.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method, route, status_code).observe(
+                time.perf_counter() - started
+            )
+            in_progress.dec()
+
+
+def _collecting_registry() -> CollectorRegistry:
+    if PROMETHEUS_MULTIPROC_DIR is None:
+        return REGISTRY
+    # The values of every worker, read from PROMETHEUS_MULTIPROC_DIR
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+async def metrics_endpoint(_: Request) -> Response:
+    """
+    Function that a GET /metrics request is routed to.
+
+    :return: The metrics of the worker processes in the Prometheus text format
+    """
+    return Response(
+        generate_latest(_collecting_registry()), media_type=CONTENT_TYPE_LATEST
+    )
+
+
+def mark_worker_dead() -> None:
+    """
+    Shutdown handler removing the live gauges of the worker process from
+    PROMETHEUS_MULTIPROC_DIR
+    """
+    if PROMETHEUS_MULTIPROC_DIR is not None:
+        multiprocess.mark_process_dead(os.getpid())
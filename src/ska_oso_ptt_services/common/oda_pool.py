@@ -0,0 +1,121 @@
+"""
+This module contains the configuration and the statistics of the ODA connection
+pools.
+
+The Postgres ODA holds its connections in a psycopg pool that it creates in
+oda.init_app with fixed settings and exposes no accessor for. The pool is read
+from the attribute of the ODA holding it, resized and configured from the
+ODA_POOL_* environment variables once the ODA is initialised, and its statistics
+are reported by GET /health/ready. The filesystem ODA has no pool, so nothing is
+configured and the service is always reported ready.
+"""
+
+import inspect
+import logging
+import os
+from typing import Any, NamedTuple, Optional
+
+from ska_db_oda.persistence.unitofwork.postgresunitofwork import PostgresUnitOfWork
+
+from ska_oso_ptt_services.models.models import ODAPoolStatus
+
+LOGGER = logging.getLogger(__name__)
+
+ODA_BACKEND_TYPE = os.getenv("ODA_BACKEND_TYPE", "postgres")
+
+# Attributes of ska-db-oda holding the connection pool of the ODA, once
+# initialised, and the connection of an entered PostgresUnitOfWork
+CONNECTION_POOL_ATTRIBUTE = "_connection_pool"
+CONNECTION_ATTRIBUTE = "_conn"
+
+
+class ODAPoolSettings(NamedTuple):
+    """
+    Settings applied to every ODA connection pool
+    """
+
+    min_size: int
+    max_size: int
+    # Time a request waits for a connection before failing
+    timeout_seconds: float
+    # Age after which a connection is closed and replaced
+    max_lifetime_seconds: float
+
+
+def uses_postgres() -> bool:
+    """
+    Returns whether the ODA is the Postgres one, rather than the filesystem one
+    """
+    return ODA_BACKEND_TYPE == "postgres"
+
+
+def oda_connection_pool(oda) -> Optional[Any]:
+    """
+    Takes the ODA and returns its psycopg connection pool, or None when it has
+    none, which is logged as an error on the Postgres backend as the pool can
+    then be neither configured nor monitored
+    """
+    pool = getattr(oda, CONNECTION_POOL_ATTRIBUTE, None)
+    if pool is None and uses_postgres():
+        LOGGER.error(
+            "The Postgres ODA has no connection pool in its %s attribute",
+            CONNECTION_POOL_ATTRIBUTE,
+        )
+    return pool
+
+
+def uow_connection(uow) -> Optional[Any]:
+    """
+    Takes an entered ODA unit of work and returns the psycopg connection it
+    holds, or None when it is not a PostgresUnitOfWork
+    """
+    if not isinstance(uow, PostgresUnitOfWork):
+        return None
+    return getattr(uow, CONNECTION_ATTRIBUTE)
+
+
+async def configure_oda_pools(oda, settings: ODAPoolSettings) -> None:
+    """
+    Startup handler applying the settings to the connection pool of the ODA,
+    registered after oda.init_app so that the pool exists
+    :param oda: the ODA of the application
+    :param settings: pool sizes and timeouts to apply
+    """
+    pool = oda_connection_pool(oda)
+    if pool is None:
+        return
+
+    LOGGER.info(
+        "Configuring ODA connection pool %s with %s",
+        getattr(pool, "name", pool),
+        settings,
+    )
+    resized = pool.resize(settings.min_size, settings.max_size)
+    if inspect.isawaitable(resized):
+        await resized
+    pool.timeout = settings.timeout_seconds
+    pool.max_lifetime = settings.max_lifetime_seconds
+
+
+def oda_pool_status(pool) -> ODAPoolStatus:
+    """
+    Takes a psycopg connection pool and returns its sizes and utilisation
+
+    A pool is exhausted when every connection it can open is in use and requests
+    are waiting for one, in which case new requests wait up to the pool timeout.
+    """
+    stats = pool.get_stats()
+    max_size = stats.get("pool_max", 0)
+    in_use = stats.get("pool_size", 0) - stats.get("pool_available", 0)
+    waiting = stats.get("requests_waiting", 0)
+    return ODAPoolStatus(
+        name=str(getattr(pool, "name", "")),
+        min_size=stats.get("pool_min", 0),
+        max_size=max_size,
+        size=stats.get("pool_size", 0),
+        available=stats.get("pool_available", 0),
+        waiting=waiting,
+        utilisation=in_use / max_size if max_size else 0.0,
+        exhausted=in_use >= max_size and waiting > 0,
+        closed=bool(getattr(pool, "closed", False)),
+    )
@@ -0,0 +1,316 @@
+"""
+This module contains the queries run on the connection of a Postgres ODA unit
+of work, for the reads the ODA repositories can only make one entity at a time.
+
+The current statuses of several entity versions are read from the status
+history table of their entity type in one query, instead of one status history
+lookup per entity version, and the latest versions of several entities from the
+table of their entity type in one query, instead of one get per identifier. The
+number of entities in each status is counted by the database, grouping the
+current statuses of the latest entity versions. The status history of an
+entity is read with the identifiers of its rows, which the status history routes
+page through.
+
+The table and column names come from the EntityDescriptor of the entity type,
+never from a request. The callers fall back to the ODA repositories when the
+unit of work is not a PostgresUnitOfWork, i.e. on the filesystem ODA.
+"""
+
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ska_db_oda.persistence.domain.query import DateQuery, UserQuery
+
+from ska_oso_ptt_services.common.constant import (
+    EntityDescriptor,
+    StatusHistoryDescriptor,
+)
+from ska_oso_ptt_services.common.error_handling import QueryParameterError
+from ska_oso_ptt_services.common.metrics import time_oda_operation
+from ska_oso_ptt_services.common.oda_pool import uow_connection
+
+# Columns of the ODA tables holding the metadata of a row
+METADATA_COLUMNS = ("created_by", "created_on", "last_modified_by", "last_modified_on")
+
+CURRENT_STATUSES_QUERY = """
+SELECT DISTINCT ON ({ref}, {version})
+    {ref}, {version}, current_status, previous_status, {metadata}
+FROM {table}
+WHERE ({ref}, {version}) IN (SELECT * FROM unnest(%s::text[], %s::integer[]))
+ORDER BY {ref}, {version}, last_modified_on DESC, id DESC
+"""
+
+LATEST_ENTITIES_QUERY = """
+SELECT DISTINCT ON ({id}) {id}, info, version, {metadata}
+FROM {table}
+WHERE {id} = ANY(%s::text[])
+ORDER BY {id}, version DESC
+"""
+
+STATUS_HISTORY_QUERY = """
+SELECT id, {ref}, {version}, current_status, previous_status, {metadata}
+FROM {table}
+WHERE {ref} = %s{version_filter}
+ORDER BY id
+"""
+
+STATUS_COUNTS_QUERY = """
+SELECT status.current_status, count(*) AS count
+FROM (
+    SELECT DISTINCT ON ({id}) {id}, version
+    FROM {table}
+    {where}
+    ORDER BY {id}, version DESC
+) AS entity
+JOIN LATERAL (
+    SELECT current_status
+    FROM {status_table}
+    WHERE {ref} = entity.{id} AND {version} = entity.version
+    ORDER BY last_modified_on DESC, id DESC
+    LIMIT 1
+) AS status ON true
+GROUP BY status.current_status
+"""
+
+# LIKE patterns of the user of a UserQuery, by match type
+USER_PATTERNS = {
+    "equals": "{}",
+    "starts_with": "{}%",
+    "contains": "%{}%",
+}
+
+# Columns filtered by a DateQuery, by query type
+DATE_COLUMNS = {
+    "created_between": "created_on",
+    "modified_between": "last_modified_on",
+}
+
+
+def oda_connection(uow) -> Optional[Any]:
+    """
+    Takes a unit of work, an ODA one or one wrapped in TimedUnitOfWork or
+    ReadOnlyUnitOfWork, and returns the psycopg connection of the ODA unit of
+    work, or None when it is not a PostgresUnitOfWork
+    """
+    return uow_connection(getattr(uow, "oda_uow", uow))
+
+
+def fetch_rows(
+    connection, query: str, params: Tuple, repository: str
+) -> List[Dict[str, Any]]:
+    """
+    Takes a connection, a query and its parameters and returns the rows of the
+    result as dictionaries keyed by column, timing the query as a query of the
+    repository
+    """
+    with time_oda_operation("query", repository):
+        cursor = connection.execute(query, params)
+        columns = [column.name for column in cursor.description]
+        return [
+            row if isinstance(row, dict) else dict(zip(columns, row))
+            for row in cursor.fetchall()
+        ]
+
+
+def _metadata(row: Dict[str, Any]) -> Dict[str, Any]:
+    return {column: row[column] for column in METADATA_COLUMNS}
+
+
+def _status_history_model(
+    status_history: StatusHistoryDescriptor, row: Dict[str, Any]
+) -> Any:
+    return status_history.model.model_validate(
+        {
+            status_history.ref_field: row[status_history.ref_field],
+            status_history.version_field: row[status_history.version_field],
+            "current_status": row["current_status"],
+            "previous_status": row["previous_status"],
+            "metadata": _metadata(row),
+        }
+    )
+
+
+def query_current_statuses(
+    connection,
+    status_history: StatusHistoryDescriptor,
+    entity_refs: Iterable[Tuple[str, int]],
+) -> Dict[Tuple[str, int], Any]:
+    """
+    Takes (entity ID, version) pairs and returns the newest status history row of
+    each pair that has one, read in a single query
+    :param connection: psycopg connection of a Postgres ODA unit of work
+    :param status_history: StatusHistoryDescriptor of the entity type
+    :param entity_refs: (entity ID, entity version) pairs to resolve
+
+    Returns status history models keyed by (entity ID, entity version)
+    """
+    entity_refs = list(entity_refs)
+    rows = fetch_rows(
+        connection,
+        CURRENT_STATUSES_QUERY.format(
+            ref=status_history.ref_field,
+            version=status_history.version_field,
+            metadata=", ".join(METADATA_COLUMNS),
+            table=status_history.table,
+        ),
+        (
+            [entity_id for entity_id, _ in entity_refs],
+            [int(entity_version) for _, entity_version in entity_refs],
+        ),
+        repository=status_history.repository,
+    )
+    return {
+        (row[status_history.ref_field], row[status_history.version_field]): (
+            _status_history_model(status_history, row)
+        )
+        for row in rows
+    }
+
+
+def query_status_history_rows(
+    connection,
+    status_history: StatusHistoryDescriptor,
+    entity_id: str,
+    entity_version: Optional[int] = None,
+) -> List[Tuple[int, Any]]:
+    """
+    Takes an entity ID and returns its status history rows with their
+    identifiers, which are unique and increase as rows are added
+    :param connection: psycopg connection of a Postgres ODA unit of work
+    :param status_history: StatusHistoryDescriptor of the entity type
+    :param entity_id: ID of the entity
+    :param entity_version: version of the entity, None for every version
+
+    Returns (row ID, status history model) pairs in the order rows were added
+    """
+    params: Tuple = (entity_id,)
+    version_filter = ""
+    if entity_version is not None:
+        version_filter = f" AND {status_history.version_field} = %s"
+        params += (int(entity_version),)
+
+    rows = fetch_rows(
+        connection,
+        STATUS_HISTORY_QUERY.format(
+            ref=status_history.ref_field,
+            version=status_history.version_field,
+            metadata=", ".join(METADATA_COLUMNS),
+            table=status_history.table,
+            version_filter=version_filter,
+        ),
+        params,
+        repository=status_history.repository,
+    )
+    return [(row["id"], _status_history_model(status_history, row)) for row in rows]
+
+
+def query_latest_entities(
+    connection, descriptor: EntityDescriptor, entity_ids: Iterable[str]
+) -> Dict[str, Any]:
+    """
+    Takes entity IDs and returns the latest version of each entity that exists,
+    read in a single query
+    :param connection: psycopg connection of a Postgres ODA unit of work
+    :param descriptor: EntityDescriptor of the entity type
+    :param entity_ids: IDs of the entities to read
+
+    Returns PDM entities keyed by entity ID
+    """
+    rows = fetch_rows(
+        connection,
+        LATEST_ENTITIES_QUERY.format(
+            id=descriptor.id_field,
+            metadata=", ".join(METADATA_COLUMNS),
+            table=descriptor.table,
+        ),
+        (list(entity_ids),),
+        repository=descriptor.repository,
+    )
+
+    entities = {}
+    for row in rows:
+        info = row["info"]
+        if isinstance(info, str):
+            info = json.loads(info)
+        entities[row[descriptor.id_field]] = descriptor.model.model_validate(
+            {
+                **info,
+                "metadata": {
+                    **info.get("metadata", {}),
+                    "version": row["version"],
+                    **_metadata(row),
+                },
+            }
+        )
+    return entities
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+def _query_filter(query_params) -> Tuple[str, Tuple]:
+    """
+    Takes the ODA query parameters of a request and returns the WHERE clause
+    selecting the same rows as the query of the ODA repositories, and its
+    parameters
+    """
+    if query_params is None:
+        return "", ()
+
+    if isinstance(query_params, UserQuery):
+        user = (
+            query_params.user.replace("\\", "\\\\")
+            .replace("%", "\\%")
+            .replace("_", "\\_")
+        )
+        pattern = USER_PATTERNS[_enum_value(query_params.match_type)]
+        return "WHERE created_by LIKE %s", (pattern.format(user),)
+
+    if isinstance(query_params, DateQuery):
+        column = DATE_COLUMNS[_enum_value(query_params.query_type)]
+        conditions, params = [], []
+        if query_params.start is not None:
+            conditions.append(f"{column} >= %s")
+            params.append(query_params.start)
+        if query_params.end is not None:
+            conditions.append(f"{column} <= %s")
+            params.append(query_params.end)
+        if not conditions:
+            return "", ()
+        return "WHERE " + " AND ".join(conditions), tuple(params)
+
+    raise QueryParameterError(qry_params=query_params)
+
+
+def query_status_counts(
+    connection, descriptor: EntityDescriptor, query_params
+) -> Dict[str, int]:
+    """
+    Takes ODA query parameters and returns the number of matching entities in
+    each current status, counted in a single query
+    :param connection: psycopg connection of a Postgres ODA unit of work
+    :param descriptor: EntityDescriptor of the entity type
+    :param query_params: ODA query parameters of the request, or None for every
+        entity
+
+    Returns the number of entities keyed by status value, only the statuses of
+    at least one entity included. The latest version of each entity is counted,
+    in its newest status, and an entity version without any status is not.
+    """
+    where, params = _query_filter(query_params)
+    status_history = descriptor.status_history
+    rows = fetch_rows(
+        connection,
+        STATUS_COUNTS_QUERY.format(
+            id=descriptor.id_field,
+            table=descriptor.table,
+            where=where,
+            status_table=status_history.table,
+            ref=status_history.ref_field,
+            version=status_history.version_field,
+        ),
+        params,
+        repository=status_history.repository,
+    )
+    return {row["current_status"]: row["count"] for row in rows}
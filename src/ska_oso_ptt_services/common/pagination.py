@@ -0,0 +1,149 @@
+"""
+This module contains the keyset (cursor) pagination used by the entity list routes.
+
+Entities are ordered by last modified date and then by identifier, newest first, and
+a page ends with an opaque cursor encoding the sort key of its last entity. The next
+page contains only the entities that sort after that key, so pages stay stable while
+new entities are being added. The key must be unique, so that no entity shares the
+key a page ends with; paginate_by_key takes the sort key of rows that have no
+unique identifier, e.g. the status history rows.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Tuple, TypeVar
+
+from fastapi import Query
+
+from ska_oso_ptt_services.common.error_handling import QueryParameterError
+
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 1000
+
+
+@dataclass
+class PaginationParameters:
+    page_size: Optional[int] = None
+    cursor: Optional[str] = None
+
+
+def get_pagination_params(
+    page_size: Optional[int] = Query(
+        default=None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Maximum number of entities to return. All matching entities "
+        "are returned when omitted.",
+    ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Opaque next_cursor value returned with the previous page.",
+    ),
+) -> PaginationParameters:
+    """
+    FastAPI dependency collecting the pagination query parameters
+
+    :param page_size: Maximum number of entities in the page
+    :param cursor: next_cursor of the previous page
+    :return: PaginationParameters for the request
+
+    Raises QueryParameterError, answered with 422, when the cursor is invalid,
+    before the ODA is queried
+    """
+    if cursor is not None:
+        decode_cursor(cursor)
+    return PaginationParameters(page_size=page_size, cursor=cursor)
+
+
+def encode_cursor(last_modified_on: datetime, *tiebreakers: Any) -> str:
+    """
+    Takes the sort key of an entity and returns it as an opaque cursor
+    :param last_modified_on: last modified date of the entity
+    :param tiebreakers: rest of the sort key, e.g. the identifier of the entity
+
+    Returns url safe cursor string
+    """
+    key = json.dumps([last_modified_on.isoformat(), *tiebreakers])
+    return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ...]:
+    """
+    Takes a cursor created by encode_cursor and returns the sort key it encodes
+    :param cursor: cursor string
+
+    Returns (last modified date, *tiebreakers) tuple
+    """
+    try:
+        last_modified_on, *tiebreakers = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        if not tiebreakers:
+            raise ValueError("Cursor without tiebreaker")
+        return (datetime.fromisoformat(last_modified_on), *tiebreakers)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as err:
+        raise QueryParameterError(
+            message=f"Invalid pagination cursor {cursor}"
+        ) from err
+
+
+def paginate(
+    entities: List[T],
+    entity_id: Callable[[T], str],
+    pagination: PaginationParameters,
+) -> Tuple[List[T], Optional[str]]:
+    """
+    Takes the entities returned by an ODA query and returns the requested page
+    :param entities: entities matching the query
+    :param entity_id: function returning the identifier of an entity
+    :param pagination: requested page size and cursor
+
+    Returns the entities of the page and the cursor of the next page, which is None
+    when there are no more entities. Without a page size the entities are returned
+    unchanged.
+    """
+    if pagination.page_size is None and pagination.cursor is None:
+        return entities, None
+
+    return paginate_by_key(
+        entities,
+        sort_key=lambda entity: (entity.metadata.last_modified_on, entity_id(entity)),
+        pagination=pagination,
+    )
+
+
+def paginate_by_key(
+    rows: List[T],
+    sort_key: Callable[[T], Tuple[Any, ...]],
+    pagination: PaginationParameters,
+) -> Tuple[List[T], Optional[str]]:
+    """
+    Takes rows and their sort key and returns the requested page, newest first
+    :param rows: rows to page through
+    :param sort_key: function returning the last modified date of a row followed
+        by tiebreakers making the key unique among the rows
+    :param pagination: requested page size and cursor
+
+    Returns the rows of the page and the cursor of the next page, which is None
+    when there are no more rows
+    """
+    ordered = sorted(rows, key=sort_key, reverse=True)
+
+    if pagination.cursor:
+        after = decode_cursor(pagination.cursor)
+        try:
+            ordered = [row for row in ordered if sort_key(row) < after]
+        except TypeError as err:
+            raise QueryParameterError(
+                message=f"Invalid pagination cursor {pagination.cursor}"
+            ) from err
+
+    if pagination.page_size is None or len(ordered) <= pagination.page_size:
+        return ordered, None
+
+    page = ordered[: pagination.page_size]
+    return page, encode_cursor(*sort_key(page[-1]))
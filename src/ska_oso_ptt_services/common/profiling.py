@@ -0,0 +1,149 @@
+"""
+This module contains the opt-in profiling of single requests.
+
+When the service is started with PROFILING_ENABLED=true, a request sent with the
+X-Profile header is run under cProfile, on the event loop and on the thread its
+sync endpoint runs on, and the merged profile is stored under PROFILE_DIR. The
+response carries the identifier of the profile in its X-Profile-Id header and the
+profile can then be downloaded from GET /profiles/{profile_id}, as a pstats file
+or as text.
+
+Without PROFILING_ENABLED the middleware and the route are not installed, and
+the only cost left is the context variable lookup of profiled_endpoint.
+
+cProfile records everything the event loop runs while the request is in
+progress, so the profile of a request served concurrently with others also
+includes their work on the event loop. Only one request is profiled at a time, a
+request sent with the header while another one is profiled is served without
+being profiled.
+"""
+
+import cProfile
+import os
+import pstats
+import tempfile
+import threading
+import uuid
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, List, Optional, TypeVar
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+R = TypeVar("R")
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+
+PROFILE_DIR = os.getenv(
+    "PROFILE_DIR", os.path.join(tempfile.gettempdir(), "ska-oso-ptt-profiles")
+)
+# Profiles kept on disk, the oldest ones are deleted first
+PROFILE_MAX_FILES = int(os.getenv("PROFILE_MAX_FILES", "20"))
+
+# Profiles of the calls made on other threads for the request being profiled
+_thread_profiles: ContextVar[Optional[List[cProfile.Profile]]] = ContextVar(
+    "thread_profiles", default=None
+)
+_files_lock = threading.Lock()
+
+
+def profiled(func: Callable[..., R], *args, **kwargs) -> R:
+    """
+    Takes a blocking function and its arguments and calls it, under cProfile when
+    the calling request is being profiled. Used by profiled_endpoint, the
+    function being run in the context of the request.
+    """
+    thread_profiles = _thread_profiles.get()
+    if thread_profiles is None:
+        return func(*args, **kwargs)
+
+    profile = cProfile.Profile()
+    thread_profiles.append(profile)
+    return profile.runcall(func, *args, **kwargs)
+
+
+def profiled_endpoint(endpoint: Callable[..., R]) -> Callable[..., R]:
+    """
+    Decorator of the sync endpoints reading the ODA, which FastAPI runs on the
+    AnyIO thread pool with the context of the request, so that they are
+    profiled with the request
+    """
+
+    @wraps(endpoint)
+    def wrapper(*args, **kwargs) -> R:
+        return profiled(endpoint, *args, **kwargs)
+
+    return wrapper
+
+
+def profile_path(profile_id: str) -> str:
+    """
+    Takes the identifier of a profile and returns the path it is stored at
+    """
+    return os.path.join(PROFILE_DIR, f"{profile_id}.prof")
+
+
+def _save_profile(profile_id: str, profiles: List[cProfile.Profile]) -> None:
+    stats = pstats.Stats(profiles[0])
+    for profile in profiles[1:]:
+        stats.add(profile)
+
+    with _files_lock:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        stats.dump_stats(profile_path(profile_id))
+        saved = sorted(
+            (
+                entry
+                for entry in os.scandir(PROFILE_DIR)
+                if entry.name.endswith(".prof")
+            ),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in saved[: max(0, len(saved) - PROFILE_MAX_FILES)]:
+            os.remove(entry.path)
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware profiling the requests sent with the X-Profile header
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Only accessed from the event loop thread
+        self._profiling = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or self._profiling
+            or PROFILE_HEADER not in Headers(scope=scope)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append(
+                    (PROFILE_ID_HEADER.lower().encode(), profile_id.encode())
+                )
+                message = {**message, "headers": headers}
+            await send(message)
+
+        profile = cProfile.Profile()
+        thread_profiles = [profile]
+        token = _thread_profiles.set(thread_profiles)
+        self._profiling = True
+        profile.enable()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profile.disable()
+            self._profiling = False
+            _thread_profiles.reset(token)
+            _save_profile(profile_id, thread_profiles)
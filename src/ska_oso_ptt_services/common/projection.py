@@ -0,0 +1,114 @@
+"""
+This module contains the sparse fieldsets of the entity list routes, selected with
+the ``fields`` query parameter.
+
+``fields`` is a comma separated list of entity attributes, by name or by alias,
+where nested attributes are separated by dots, e.g.
+``fields=sbd_id,name,metadata.version,metadata.last_modified_on``. Only those
+attributes and the status are serialised for every entity.
+"""
+
+import typing
+from typing import Any, Dict, Optional, Type
+
+from fastapi import Query
+from pydantic import BaseModel
+
+from ska_oso_ptt_services.common.error_handling import QueryParameterError
+
+# Value of pydantic include arguments: True for a whole attribute, or a dict of
+# the included nested attributes
+IncludeDict = Dict[Any, Any]
+
+
+def get_fields_param(
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma separated attributes to return for every entity, "
+        "nested attributes separated by dots, e.g. metadata.version. The status is "
+        "always returned. All attributes are returned when omitted.",
+    ),
+) -> Optional[str]:
+    """
+    FastAPI dependency collecting the sparse fieldset query parameter
+
+    :param fields: comma separated attributes requested
+    :return: fields query parameter of the request
+    """
+    return fields
+
+
+def _nested_model(annotation: Any) -> tuple[Optional[Type[BaseModel]], bool]:
+    """
+    Takes a field annotation and returns the pydantic model it holds, unwrapping
+    Optional, Union and list annotations, and whether it holds a list of them
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+
+    origin = typing.get_origin(annotation)
+    for argument in typing.get_args(annotation):
+        if argument is type(None):
+            continue
+        model, is_list = _nested_model(argument)
+        if model is not None:
+            return model, is_list or origin in (list, tuple, set)
+    return None, False
+
+
+def _field_name(model: Type[BaseModel], name: str) -> str:
+    for field_name, field in model.model_fields.items():
+        if name in (field_name, field.alias):
+            return field_name
+    raise QueryParameterError(
+        message=f"Unknown field {name} of {model.__name__} in the fields parameter"
+    )
+
+
+def _path_include(model: Type[BaseModel], path: str) -> IncludeDict:
+    name, _, rest = path.partition(".")
+    field_name = _field_name(model, name)
+    if not rest:
+        return {field_name: True}
+
+    nested_model, is_list = _nested_model(model.model_fields[field_name].annotation)
+    if nested_model is None:
+        raise QueryParameterError(
+            message=f"Field {name} of {model.__name__} has no nested fields"
+        )
+    nested_include = _path_include(nested_model, rest)
+    return {field_name: {"__all__": nested_include} if is_list else nested_include}
+
+
+def _merge(include: IncludeDict, other: IncludeDict) -> IncludeDict:
+    for key, value in other.items():
+        if include.get(key) is True or value is True:
+            include[key] = True
+        elif key in include:
+            include[key] = _merge(include[key], value)
+        else:
+            include[key] = value
+    return include
+
+
+def field_projection(
+    model: Type[BaseModel], fields: Optional[str]
+) -> Optional[IncludeDict]:
+    """
+    Takes an entity model and the fields query parameter and returns the
+    projection to pass as include to entity_with_status_json
+    :param model: PDM model of the listed entities
+    :param fields: comma separated attributes requested, or None
+
+    Returns pydantic include dictionary, or None when every attribute is requested
+
+    Raises QueryParameterError when an attribute is not one of the model
+    """
+    if not fields:
+        return None
+
+    include: IncludeDict = {}
+    for path in fields.split(","):
+        if path.strip():
+            _merge(include, _path_include(model, path.strip()))
+    return include or None
@@ -0,0 +1,130 @@
+"""
+This module contains the read-only unit of work used by the GET routes.
+
+ReadOnlyUnitOfWork wraps an ODA unit of work so that it cannot be committed and,
+when it is a PostgresUnitOfWork, so that its transaction is started as READ
+ONLY. Postgres then takes no transaction ID and no write locks
+for it, and the transaction is rolled back when the unit of work closes, which
+costs no round trip for a read-only transaction.
+
+When ODA_READ_REPLICA_DSN is set, a second connection pool is opened on that
+replica at startup and read-only units of work are PostgresUnitOfWork of their
+own on that pool instead of the ODA unit of work, so that reads can be scaled
+with replicas while writes go to the primary.
+"""
+
+import logging
+from typing import Any, List, Optional
+
+from ska_db_oda.persistence.unitofwork.postgresunitofwork import PostgresUnitOfWork
+
+from ska_oso_ptt_services.common.error_handling import ODAError
+from ska_oso_ptt_services.common.oda_pool import ODAPoolSettings, uow_connection
+
+LOGGER = logging.getLogger(__name__)
+
+# Connection pool on the read replica, when one is configured
+_replica_pool = None
+
+
+def _set_read_only(connection) -> None:
+    connection.read_only = True
+
+
+def open_read_replica_pool(dsn: Optional[str], settings: ODAPoolSettings) -> None:
+    """
+    Startup handler opening the connection pool of the read replica, if any
+    :param dsn: connection string of the read replica, or None
+    :param settings: sizes and timeouts of the pool, as for the ODA pools
+    """
+    global _replica_pool  # pylint: disable=global-statement
+    if not dsn:
+        return
+
+    # Installed with the Postgres ODA, only needed when a replica is configured
+    from psycopg_pool import ConnectionPool  # pylint: disable=import-outside-toplevel
+
+    LOGGER.info("Opening the ODA read replica connection pool")
+    _replica_pool = ConnectionPool(
+        dsn,
+        min_size=settings.min_size,
+        max_size=settings.max_size,
+        timeout=settings.timeout_seconds,
+        max_lifetime=settings.max_lifetime_seconds,
+        configure=_set_read_only,
+        name="oda-read-replica",
+        open=True,
+    )
+
+
+def read_replica_pools() -> List[Any]:
+    """
+    Returns the connection pool of the read replica, or no pool when reads go to
+    the ODA pool
+    """
+    return [_replica_pool] if _replica_pool is not None else []
+
+
+def close_read_replica_pool() -> None:
+    """
+    Closes the connection pool of the read replica, if any
+    """
+    global _replica_pool  # pylint: disable=global-statement
+    if _replica_pool is not None:
+        _replica_pool.close()
+        _replica_pool = None
+
+
+class ReadOnlyUnitOfWork:
+    """
+    Context manager wrapping an ODA unit of work for reads only. Repositories are
+    available as attributes, as on the ODA unit of work, and commit raises.
+
+    Example::
+
+        with ReadOnlyUnitOfWork(oda.uow()) as uow:
+            sbd = uow.sbds.get(sbd_id)
+    """
+
+    def __init__(self, uow) -> None:
+        # A unit of work of its own on the replica pool, leaving the pool of the
+        # ODA unit of work alone
+        if _replica_pool is not None and isinstance(uow, PostgresUnitOfWork):
+            uow = PostgresUnitOfWork(_replica_pool)
+
+        self._context = uow
+        self._uow = None
+        self._connection = None
+        self._previous_read_only = None
+
+    def __enter__(self) -> "ReadOnlyUnitOfWork":
+        self._uow = self._context.__enter__()
+        connection = uow_connection(self._uow)
+        # The transaction mode can only be changed before the transaction begins
+        if connection is not None and connection.info.transaction_status.name == "IDLE":
+            self._connection = connection
+            self._previous_read_only = connection.read_only
+            connection.read_only = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> Optional[bool]:
+        if self._connection is not None:
+            self._connection.rollback()
+            self._connection.read_only = self._previous_read_only
+            self._connection = None
+        return self._context.__exit__(exc_type, exc_value, traceback)
+
+    def __getattr__(self, name: str) -> Any:
+        if self._uow is None:
+            raise AttributeError(name)
+        return getattr(self._uow, name)
+
+    @property
+    def oda_uow(self) -> Any:
+        """
+        The entered ODA unit of work
+        """
+        return self._uow
+
+    def commit(self) -> None:
+        raise ODAError("A read-only unit of work cannot be committed")
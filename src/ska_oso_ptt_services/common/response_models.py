@@ -0,0 +1,96 @@
+"""
+This module contains the registry of the response models of the entity routes.
+
+The entity routes declare parametrised generic response models, e.g.
+``PaginatedApiResponse[SBDefinitionStatusModel]``. They are parametrised once, at
+import, for every entity type of entity_descriptors, and shared by the route
+declarations and by the responses the routes build, rather than parametrised
+again in every decorator.
+
+The routes returning pydantic objects are serialised with serialise_response,
+which validates them against the response model with a TypeAdapter built once
+per model, instead of FastAPI dumping them to dictionaries, validating them
+again and serialising the result.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Type
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from ska_oso_ptt_services.common.constant import EntityDescriptor, entity_descriptors
+from ska_oso_ptt_services.models.models import (
+    ApiResponse,
+    BatchApiResponse,
+    PaginatedApiResponse,
+)
+
+
+class EntityResponseModels(NamedTuple):
+    # GET /<entities>
+    entities: Type[PaginatedApiResponse]
+    # POST /<entities>/batch_get
+    batch: Type[BatchApiResponse]
+    # GET /<entities>/{<entity>_id}
+    entity: Type[ApiResponse]
+    # GET and PUT /<entities>/{<entity>_id}/status
+    status: Type[ApiResponse]
+    # GET /<entities>/status/history
+    status_history: Type[PaginatedApiResponse]
+
+
+def _entity_response_models(descriptor: EntityDescriptor) -> EntityResponseModels:
+    status_model = descriptor.status_model
+    history_model = descriptor.status_history.model
+    return EntityResponseModels(
+        entities=PaginatedApiResponse[status_model],
+        batch=BatchApiResponse[status_model],
+        entity=ApiResponse[status_model],
+        status=ApiResponse[history_model],
+        status_history=PaginatedApiResponse[history_model],
+    )
+
+
+entity_response_models: Dict[str, EntityResponseModels] = {
+    entity_type: _entity_response_models(descriptor)
+    for entity_type, descriptor in entity_descriptors.items()
+}
+
+
+@lru_cache(maxsize=None)
+def response_adapter(response_model: Type[Any]) -> TypeAdapter:
+    """
+    Takes a response model and returns the TypeAdapter validating and
+    serialising it, built on the first call and reused by every later one
+    :param response_model: response_model of a route
+    """
+    return TypeAdapter(response_model)
+
+
+def serialise_response(
+    response_model: Type[Any],
+    content: Any,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Takes the response model of a route and the object returned by it and
+    returns the response FastAPI would produce once it has validated and
+    serialised the object
+    :param response_model: response_model of the route
+    :param content: ApiResponse or dictionary returned by the route
+    :param headers: headers of the response
+
+    Returns Response with the serialised response model as body
+
+    The object is validated from its attributes, so entities already validated,
+    e.g. read from the ODA, are not dumped and validated again.
+    """
+    adapter = response_adapter(response_model)
+    return Response(
+        content=adapter.dump_json(
+            adapter.validate_python(content, from_attributes=True), by_alias=True
+        ),
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,107 @@
+"""
+This module contains the cold start instrumentation of the worker processes.
+
+The start of a worker is split in phases: the imports of the application, from
+the start of the process, create_app and the startup handlers, including the
+initialisation of the ODA, timed on its own as oda_init. Their durations are logged once the worker is ready to serve
+requests and served by GET /metrics as ptt_startup_phase_seconds, with the time
+from the start of the process to the end of the startup handlers as
+ptt_startup_time_to_ready_seconds.
+
+benchmarks/cold_start.py breaks the import phase down by package.
+"""
+
+import logging
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from ska_oso_ptt_services.common.metrics import (
+    STARTUP_PHASE_DURATION,
+    STARTUP_TIME_TO_READY,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def process_uptime_seconds() -> Optional[float]:
+    """
+    Returns the time since the start of the current process, read from /proc, or
+    None where /proc is not available
+    """
+    try:
+        with open("/proc/self/stat", "r", encoding="utf-8") as stat_file:
+            stat = stat_file.read()
+        with open("/proc/uptime", "r", encoding="utf-8") as uptime_file:
+            uptime = float(uptime_file.read().split()[0])
+    except OSError:
+        return None
+
+    # starttime, the 22nd field, counted after the parenthesised command name
+    start_ticks = int(stat.rsplit(")", 1)[1].split()[19])
+    return uptime - start_ticks / os.sysconf("SC_CLK_TCK")
+
+
+class StartupTimer:
+    """
+    Records the durations of the phases of the start of the worker process
+    """
+
+    def __init__(self) -> None:
+        self._phases: Dict[str, float] = {}
+        self._startup_started: Optional[float] = None
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        return dict(self._phases)
+
+    def record(self, phase: str, seconds: float) -> None:
+        self._phases[phase] = seconds
+        STARTUP_PHASE_DURATION.labels(phase).set(seconds)
+
+    def record_imports(self) -> None:
+        """
+        Records the time from the start of the process, the imports of the
+        application included, as the import phase
+        """
+        uptime = process_uptime_seconds()
+        if uptime is not None:
+            self.record("import", uptime)
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started)
+
+    async def startup_started(self) -> None:
+        """
+        Startup handler registered before every other one
+        """
+        self._startup_started = time.perf_counter()
+
+    async def startup_completed(self) -> None:
+        """
+        Startup handler registered after every other one, logging the phases
+        """
+        if self._startup_started is not None:
+            self.record("startup", time.perf_counter() - self._startup_started)
+
+        uptime = process_uptime_seconds()
+        if uptime is not None:
+            STARTUP_TIME_TO_READY.set(uptime)
+
+        LOGGER.info(
+            "Worker %s ready in %s, %s",
+            os.getpid(),
+            f"{uptime:.2f}s" if uptime is not None else "unknown time",
+            ", ".join(
+                f"{phase} {seconds:.2f}s" for phase, seconds in self._phases.items()
+            ),
+        )
+
+
+startup_timer = StartupTimer()
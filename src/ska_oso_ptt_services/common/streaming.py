@@ -0,0 +1,159 @@
+"""
+This module contains the newline delimited JSON (NDJSON) streaming mode of the
+entity list routes, selected by a client sending ``Accept: application/x-ndjson``.
+
+Each entity is written as one JSON line as soon as it is serialised, so the
+response never holds the whole serialised listing in memory and the first entity
+reaches the client before the statuses of the last ones have been resolved.
+
+The ODA query runs before the response is returned, so query errors are reported
+as a normal error response. The statuses are then resolved in chunks of
+STREAM_CHUNK_SIZE entities as the client reads the lines, in the read-only unit
+of work of the query. The unit of work, and so its ODA connection, is only held
+for STREAM_UOW_SECONDS: past that the statuses of the remaining entities are
+resolved at once and the unit of work closed before their lines are written, so
+a slow client does not hold a connection for as long as it reads.
+"""
+
+import os
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from ska_oso_ptt_services.common.metrics import TimedUnitOfWork
+from ska_oso_ptt_services.common.pagination import PaginationParameters, paginate
+from ska_oso_ptt_services.common.projection import IncludeDict
+from ska_oso_ptt_services.common.read_only_uow import ReadOnlyUnitOfWork
+from ska_oso_ptt_services.common.utils import (
+    entity_with_status_json,
+    get_entities_status,
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Number of entities whose statuses are resolved together while streaming
+STREAM_CHUNK_SIZE = 100
+# Time a stream holds its unit of work after the ODA query
+STREAM_UOW_SECONDS = float(os.getenv("STREAM_UOW_SECONDS", "5"))
+
+
+def accepts_ndjson(request: Request) -> bool:
+    """
+    Takes the incoming request and returns whether the client asked for NDJSON
+    :param request: incoming request
+
+    Returns True when the Accept header names the NDJSON media type
+    """
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def stream_entities_with_status(
+    uow_factory: Callable,
+    repository: str,
+    id_field: str,
+    entity_type: str,
+    query_params,
+    pagination: PaginationParameters,
+    include: Optional[IncludeDict] = None,
+) -> StreamingResponse:
+    """
+    Takes the query of a list route and returns a response streaming the matching
+    entities with status appended, one JSON document per line
+    :param uow_factory: callable opening an ODA unit of work, e.g. oda.uow
+    :param repository: name of the entity repository on the unit of work
+    :param id_field: name of the identifier attribute of the entity
+    :param entity_type: key of the entity in entity_map
+    :param query_params: Parameters to query the ODA by.
+    :param pagination: Page size and cursor of the requested page.
+    :param include: projection of the entities returned by field_projection
+
+    Returns StreamingResponse, with the cursor of the next page in the
+    X-Next-Cursor header when there is one
+    """
+    lines = _entity_lines(
+        uow_factory=uow_factory,
+        repository=repository,
+        id_field=id_field,
+        entity_type=entity_type,
+        query_params=query_params,
+        pagination=pagination,
+        include=include,
+    )
+    next_cursor = next(lines)
+
+    return StreamingResponse(
+        lines,
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"X-Next-Cursor": next_cursor} if next_cursor else None,
+    )
+
+
+def _entities_status(
+    uow, entity_type: str, id_field: str, entities: List[Any]
+) -> Dict[Tuple[str, int], Any]:
+    return get_entities_status(
+        uow,
+        entity_type=entity_type,
+        entity_refs=[
+            (getattr(entity, id_field), entity.metadata.version) for entity in entities
+        ],
+    )
+
+
+def _lines(
+    entities: List[Any],
+    entity_statuses: Dict[Tuple[str, int], Any],
+    id_field: str,
+    include: Optional[IncludeDict] = None,
+) -> Iterator[bytes]:
+    for entity in entities:
+        entity_status = entity_statuses[
+            (getattr(entity, id_field), entity.metadata.version)
+        ].current_status
+        yield (
+            entity_with_status_json(entity, entity_status, include=include) + "\n"
+        ).encode("utf-8")
+
+
+def _entity_lines(
+    uow_factory: Callable,
+    repository: str,
+    id_field: str,
+    entity_type: str,
+    query_params,
+    pagination: PaginationParameters,
+    include: Optional[IncludeDict] = None,
+) -> Iterator[Optional[str] | bytes]:
+    """
+    Generator yielding the cursor of the next page first and then one encoded
+    JSON line per entity. The unit of work stays open until the statuses of
+    every entity are resolved, at most STREAM_UOW_SECONDS after the query, or
+    until the generator is closed.
+    """
+    with TimedUnitOfWork(ReadOnlyUnitOfWork(uow_factory())) as uow:
+        entities, next_cursor = paginate(
+            getattr(uow, repository).query(query_params),
+            entity_id=lambda entity: getattr(entity, id_field),
+            pagination=pagination,
+        )
+        yield next_cursor
+
+        deadline = time.monotonic() + STREAM_UOW_SECONDS
+        streamed = 0
+        while streamed < len(entities) and time.monotonic() <= deadline:
+            chunk = entities[streamed : streamed + STREAM_CHUNK_SIZE]
+            yield from _lines(
+                chunk,
+                _entities_status(uow, entity_type, id_field, chunk),
+                id_field=id_field,
+                include=include,
+            )
+            streamed += len(chunk)
+
+        # Left when the client reads slower than STREAM_UOW_SECONDS allows
+        entities = entities[streamed:]
+        entity_statuses = _entities_status(uow, entity_type, id_field, entities)
+
+    yield from _lines(entities, entity_statuses, id_field=id_field, include=include)
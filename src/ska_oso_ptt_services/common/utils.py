@@ -1,13 +1,25 @@
+import json
+from enum import Enum
 from http import HTTPStatus
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar
 
-from fastapi import status
+from fastapi import Response
+from ska_db_oda.persistence.domain.errors import ODANotFound as ODARepositoryNotFound
 from ska_db_oda.rest.api import check_for_mismatch
 from ska_db_oda.rest.errors import UnprocessableEntityError
 
+from ska_oso_ptt_services.common.cache import status_cache
 from ska_oso_ptt_services.common.constant import (
     API_RESPONSE_RESULT_STATUS_FAILED,
     API_RESPONSE_RESULT_STATUS_SUCCESS,
+    entity_descriptors,
+)
+from ska_oso_ptt_services.common.error_handling import ODANotFound
+from ska_oso_ptt_services.common.oda_sql import (
+    oda_connection,
+    query_current_statuses,
+    query_latest_entities,
+    query_status_counts,
 )
 from ska_oso_ptt_services.models.models import ApiResponse
 
@@ -15,42 +27,254 @@ T = TypeVar("T")
 
 
 def common_get_entity_status(
-    entity_object, entity_id: str, entity_version: str = None
+    entity_object,
+    entity_id: str,
+    entity_version: str = None,
+    entity_type: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Takes an entity ID and version and returns status
     :param: entity_object: entity_object
     :param entity_id: Execution Block ID
     :param entity_version: entity_version
+    :param entity_type: key of the entity in entity_map, statuses are cached in
+        status_cache when it is given
 
     Returns retrieved entity status in Dictionary format
 
     """
 
+    cache_key = None
+    if entity_type is not None:
+        cache_key = (
+            entity_type,
+            entity_id,
+            str(entity_version) if entity_version is not None else None,
+        )
+        cached_entity = status_cache.get(cache_key)
+        if cached_entity is not None:
+            return cached_entity
+
     retrieved_entity = entity_object.get(
         entity_id=entity_id, version=entity_version, is_status_history=False
     )
 
+    if cache_key is not None:
+        status_cache.set(cache_key, retrieved_entity)
+
     return retrieved_entity
 
 
-def get_responses(response_model) -> Dict[str, Any]:
+def get_entities_status(
+    uow, entity_type: str, entity_refs: Iterable[Tuple[str, int]]
+) -> Dict[Tuple[str, int], Any]:
     """
-    Takes response_model as argument and returns responses dict
-    :param: response_model: entity_object
+    Takes (entity ID, version) pairs and returns the current status of each of them
+    :param uow: ODA unit of work, possibly wrapped in TimedUnitOfWork or
+        ReadOnlyUnitOfWork
+    :param entity_type: key of the entity in entity_map
+    :param entity_refs: (entity ID, entity version) pairs to resolve
 
-    Returns formatted response dictionary
+    Returns retrieved entity statuses keyed by (entity ID, entity version)
+
+    The pairs not held by status_cache are resolved in one query of the status
+    history table on a Postgres ODA, and one status history lookup each on the
+    filesystem ODA. A pair without any status raises ODANotFound, as
+    common_get_entity_status does.
 
     """
 
-    responses = {
-        status.HTTP_200_OK: {
-            "description": "Successful Response",
-            "model": response_model,
+    status_history = entity_descriptors[entity_type].status_history
+    entity_statuses = {}
+    uncached_refs = []
+    for entity_id, entity_version in dict.fromkeys(entity_refs):
+        entity_ref = (entity_id, int(entity_version))
+        cached_entity = status_cache.get((entity_type, entity_id, str(entity_version)))
+        if cached_entity is not None:
+            entity_statuses[entity_ref] = cached_entity
+        else:
+            uncached_refs.append(entity_ref)
+
+    if not uncached_refs:
+        return entity_statuses
+
+    connection = oda_connection(uow)
+    if connection is not None:
+        retrieved_entities = query_current_statuses(
+            connection, status_history, uncached_refs
+        )
+    else:
+        retrieved_entities = {
+            (entity_id, entity_version): getattr(uow, status_history.repository).get(
+                entity_id=entity_id, version=entity_version, is_status_history=False
+            )
+            for entity_id, entity_version in uncached_refs
         }
-    }
 
-    return responses
+    for entity_id, entity_version in uncached_refs:
+        retrieved_entity = retrieved_entities.get((entity_id, entity_version))
+        if retrieved_entity is None:
+            raise ODANotFound(identifier=entity_id)
+        status_cache.set(
+            (entity_type, entity_id, str(entity_version)), retrieved_entity
+        )
+        entity_statuses[(entity_id, entity_version)] = retrieved_entity
+
+    return entity_statuses
+
+
+def count_entities_by_status(uow, entity_type: str, query_params) -> Dict[str, int]:
+    """
+    Takes an entity type and ODA query parameters and returns the number of
+    matching entities in each status
+    :param uow: ODA unit of work
+    :param entity_type: key of the entity in entity_map
+    :param query_params: parameters to query the ODA by
+
+    Returns count of entities keyed by status value, every status of the entity
+    type included
+
+    On a Postgres ODA the entities are counted by the database, grouped by
+    status, see query_status_counts. The ODA repositories offer no aggregate
+    query, so on the filesystem ODA the entities are queried and their statuses
+    resolved by get_entities_status.
+
+    """
+
+    descriptor = entity_descriptors[entity_type]
+    counts = {status.value: 0 for status in descriptor.status_enum}
+
+    connection = oda_connection(uow)
+    if connection is not None:
+        counts.update(query_status_counts(connection, descriptor, query_params))
+        return counts
+
+    entities = getattr(uow, descriptor.repository).query(query_params)
+    entity_statuses = get_entities_status(
+        uow,
+        entity_type=entity_type,
+        entity_refs=[
+            (getattr(entity, descriptor.id_field), entity.metadata.version)
+            for entity in entities
+        ],
+    )
+
+    for entity in entities:
+        current_status = entity_statuses[
+            (getattr(entity, descriptor.id_field), entity.metadata.version)
+        ].current_status
+        if isinstance(current_status, Enum):
+            current_status = current_status.value
+        counts[current_status] = counts.get(current_status, 0) + 1
+
+    return counts
+
+
+def get_entities_by_id(
+    uow, entity_type: str, entity_ids: Iterable[str]
+) -> Tuple[List[Any], List[str]]:
+    """
+    Takes entity IDs and returns the entities found and the IDs that were not
+    :param uow: ODA unit of work, possibly wrapped in TimedUnitOfWork or
+        ReadOnlyUnitOfWork
+    :param entity_type: key of the entity in entity_map
+    :param entity_ids: requested entity IDs, duplicates are looked up once
+
+    Returns (entities in request order, IDs not found in request order) tuple
+
+    The entities are read in one query of the entity table on a Postgres ODA,
+    and one get each on the filesystem ODA. An ID that cannot be found is
+    reported instead of failing the whole request.
+
+    """
+
+    descriptor = entity_descriptors[entity_type]
+    entity_ids = list(dict.fromkeys(entity_ids))
+
+    connection = oda_connection(uow)
+    if connection is not None:
+        retrieved_entities = query_latest_entities(connection, descriptor, entity_ids)
+    else:
+        retrieved_entities = {}
+        for entity_id in entity_ids:
+            try:
+                retrieved_entities[entity_id] = getattr(uow, descriptor.repository).get(
+                    entity_id
+                )
+            except (ODANotFound, ODARepositoryNotFound):
+                pass
+
+    entities = [
+        retrieved_entities[entity_id]
+        for entity_id in entity_ids
+        if entity_id in retrieved_entities
+    ]
+    missing_ids = [
+        entity_id for entity_id in entity_ids if entity_id not in retrieved_entities
+    ]
+    return entities, missing_ids
+
+
+def entity_with_status_json(entity, entity_status, include=None) -> str:
+    """
+    Takes an entity and its current status and returns the JSON document of the
+    entity with the status appended, as served by the routes returning entities
+    with status
+    :param entity: PDM entity
+    :param entity_status: current status of the entity
+    :param include: projection of the entity returned by field_projection, all
+        attributes are serialised when None
+
+    Returns serialised entity with status
+
+    """
+
+    if isinstance(entity_status, Enum):
+        entity_status = entity_status.value
+
+    entity_json = entity.model_dump_json(by_alias=True, include=include)
+    if entity_json == "{}":
+        return f'{{"status":{json.dumps(entity_status)}}}'
+
+    return f'{entity_json[:-1]},"status":{json.dumps(entity_status)}}}'
+
+
+def convert_to_json_response(
+    entities_json: List[str],
+    result_code: HTTPStatus,
+    next_cursor: Optional[str] = None,
+    paginated: bool = False,
+    missing_ids: Optional[List[str]] = None,
+) -> Response:
+    """
+    Takes entities already serialised to JSON, e.g. by entity_with_status_json, and
+    returns the response convert_to_response_object would produce once FastAPI has
+    serialised it
+    :param entities_json: serialised entities
+    :param result_code: result code of the response
+    :param next_cursor: cursor of the next page, for paginated list responses
+    :param paginated: whether the response model of the route is PaginatedApiResponse
+    :param missing_ids: identifiers not found, for BatchApiResponse responses
+
+    Returns Response with the serialised ApiResponse as body
+
+    Returning a Response makes FastAPI skip validating the entities against the
+    response_model of the route and serialising them again, so each entity is only
+    serialised once. The response_model is still used to document the route.
+
+    """
+
+    body = (
+        f'{{"result_data":[{",".join(entities_json)}],'
+        f'"result_status":{json.dumps(API_RESPONSE_RESULT_STATUS_SUCCESS)},'
+        f'"result_code":{int(result_code)}'
+    )
+    if paginated:
+        body += f',"next_cursor":{json.dumps(next_cursor)}'
+    if missing_ids is not None:
+        body += f',"missing_ids":{json.dumps(missing_ids)}'
+
+    return Response(content=body + "}", media_type="application/json")
 
 
 def check_entity_id_mismatch(entity_id, request_entity_id):
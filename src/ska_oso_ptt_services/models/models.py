@@ -1,17 +1,24 @@
 from http import HTTPStatus
-from typing import Dict, Generic, List, Literal, TypeVar
+from typing import Any, Dict, Generic, List, Literal, Optional, TypeVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from ska_oso_pdm import OSOExecutionBlock, Project, SBDefinition, SBInstance
 from ska_oso_pdm.entity_status_history import (
     OSOEBStatus,
+    OSOEBStatusHistory,
     ProjectStatus,
+    ProjectStatusHistory,
     SBDStatus,
+    SBDStatusHistory,
     SBIStatus,
+    SBIStatusHistory,
 )
 
 T = TypeVar("T")
 
+# Identifiers accepted by a single batch_get request
+MAX_BATCH_GET_IDS = 1000
+
 
 class EBStatusModel(OSOExecutionBlock):
     status: OSOEBStatus
@@ -34,7 +41,64 @@ class EntityStatusResponse(BaseModel):
     statuses: Dict[str, str]
 
 
+EntityStatusHistory = (
+    SBDStatusHistory | SBIStatusHistory | OSOEBStatusHistory | ProjectStatusHistory
+)
+
+
+class BulkStatusUpdateResult(BaseModel):
+    entity_type: Literal["sbi", "eb", "prj", "sbd"]
+    entity_id: str
+    result_status: str
+    result_code: HTTPStatus
+    result_data: Dict[str, Any] | str | None = None
+
+
+class EntityStatusSummary(BaseModel):
+    entity_type: Literal["sbi", "eb", "prj", "sbd"]
+    total: int
+    counts: Dict[str, int]
+
+
+class BatchGetRequest(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=MAX_BATCH_GET_IDS)
+
+
+class StatusCacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+    ttl_seconds: float
+
+
+class ODAPoolStatus(BaseModel):
+    name: str
+    min_size: int
+    max_size: int
+    size: int
+    available: int
+    waiting: int
+    utilisation: float
+    exhausted: bool
+    closed: bool
+
+
+class ReadinessResponse(BaseModel):
+    ready: bool
+    oda_pools: List[ODAPoolStatus]
+
+
 class ApiResponse(BaseModel, Generic[T]):
     result_data: List[T] | Dict[str, T] | str
     result_status: str
     result_code: HTTPStatus = HTTPStatus.OK
+
+
+class PaginatedApiResponse(ApiResponse[T], Generic[T]):
+    next_cursor: Optional[str] = None
+
+
+class BatchApiResponse(ApiResponse[T], Generic[T]):
+    missing_ids: List[str] = []
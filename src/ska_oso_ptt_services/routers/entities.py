@@ -0,0 +1,529 @@
+"""
+This module contains the factory of the entity routes, adding the same routes
+for every entity type of entity_descriptors:
+
+    GET  /<entities>                      entities with status, paginated or NDJSON
+    POST /<entities>/batch_get            entities with status by identifier
+    GET  /<entities>/{<entity>_id}        one entity with status
+    GET  /<entities>/{<entity>_id}/status current status of an entity
+    PUT  /<entities>/{<entity>_id}/status status update of an entity
+    GET  /<entities>/status/history       status history of an entity
+
+A new entity type only needs an EntityDescriptor in common/constant.py. The
+requests are handled by module level functions taking the EntityDescriptor, the
+factory only declaring the endpoints.
+
+The routes are added by create_app straight to the router of the application,
+rather than to a router of their own then copied by include_router, so that the
+response fields of every route, validators of the large PDM models, are only
+built once when a worker starts.
+"""
+
+import inspect
+import logging
+from functools import wraps
+from http import HTTPStatus
+from typing import Callable, Optional
+
+from fastapi import APIRouter, Depends, Request
+from ska_db_oda.persistence import oda
+from ska_db_oda.rest.api import get_qry_params
+from ska_db_oda.rest.model import ApiQueryParameters, ApiStatusQueryParameters
+
+from ska_oso_ptt_services.common.cache import status_cache
+from ska_oso_ptt_services.common.constant import (
+    API_RESPONSE_RESULT_STATUS_SUCCESS,
+    EntityDescriptor,
+)
+from ska_oso_ptt_services.common.error_handling import ODANotFound, QueryParameterError
+from ska_oso_ptt_services.common.etag import (
+    REVALIDATE_HEADERS,
+    is_not_modified,
+    metadata_etag,
+    not_modified_response,
+)
+from ska_oso_ptt_services.common.events import status_events
+from ska_oso_ptt_services.common.history import (
+    StatusHistoryParameters,
+    get_status_history_params,
+    query_status_history,
+)
+from ska_oso_ptt_services.common.metrics import TimedUnitOfWork
+from ska_oso_ptt_services.common.oda_sql import oda_connection
+from ska_oso_ptt_services.common.pagination import (
+    PaginationParameters,
+    get_pagination_params,
+    paginate,
+)
+from ska_oso_ptt_services.common.profiling import profiled_endpoint
+from ska_oso_ptt_services.common.projection import field_projection, get_fields_param
+from ska_oso_ptt_services.common.read_only_uow import ReadOnlyUnitOfWork
+from ska_oso_ptt_services.common.response_models import (
+    entity_response_models,
+    serialise_response,
+)
+from ska_oso_ptt_services.common.streaming import (
+    accepts_ndjson,
+    stream_entities_with_status,
+)
+from ska_oso_ptt_services.common.utils import (
+    check_entity_id_mismatch,
+    common_get_entity_status,
+    convert_to_json_response,
+    convert_to_response_object,
+    entity_with_status_json,
+    get_entities_by_id,
+    get_entities_status,
+)
+from ska_oso_ptt_services.models.models import BatchGetRequest
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _entity_id_path_param(id_field: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator exposing the entity_id parameter of an endpoint under the name of
+    the path parameter of the entity type, e.g. sbd_id, which FastAPI matches
+    path parameters by, so that the routes keep their documented parameters
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        @wraps(endpoint)
+        def wrapper(**kwargs):
+            return endpoint(entity_id=kwargs.pop(id_field), **kwargs)
+
+        signature = inspect.signature(endpoint)
+        wrapper.__signature__ = signature.replace(
+            parameters=[
+                (
+                    parameter.replace(name=id_field)
+                    if parameter.name == "entity_id"
+                    else parameter
+                )
+                for parameter in signature.parameters.values()
+            ]
+        )
+        return wrapper
+
+    return decorator
+
+
+def _entities_with_status(
+    uow,
+    descriptor: EntityDescriptor,
+    entities: list,
+    include: Optional[set] = None,
+) -> list:
+    """
+    Takes entities read in a unit of work and returns their JSON dictionaries
+    with the current status of each of them appended
+    """
+    entity_refs = [
+        (getattr(entity, descriptor.id_field), entity.metadata.version)
+        for entity in entities
+    ]
+    entity_statuses = get_entities_status(
+        uow, entity_type=descriptor.entity_type, entity_refs=entity_refs
+    )
+    return [
+        entity_with_status_json(
+            entity, entity_statuses[entity_ref].current_status, include=include
+        )
+        for entity, entity_ref in zip(entities, entity_refs)
+    ]
+
+
+def _get_entities_with_status(
+    descriptor: EntityDescriptor,
+    request: Request,
+    query_params: ApiQueryParameters,
+    pagination: PaginationParameters,
+    fields: Optional[str],
+):
+    """
+    GET /<entities> for the entity type of descriptor
+    """
+    include = field_projection(descriptor.model, fields)
+
+    try:
+
+        query_params = get_qry_params(query_params)
+        if accepts_ndjson(request):
+            return stream_entities_with_status(
+                oda.uow,
+                repository=descriptor.repository,
+                id_field=descriptor.id_field,
+                entity_type=descriptor.entity_type,
+                query_params=query_params,
+                pagination=pagination,
+                include=include,
+            )
+
+        with TimedUnitOfWork(ReadOnlyUnitOfWork(oda.uow())) as uow:
+            entities, next_cursor = paginate(
+                getattr(uow, descriptor.repository).query(query_params),
+                entity_id=lambda entity: getattr(entity, descriptor.id_field),
+                pagination=pagination,
+            )
+            return convert_to_json_response(
+                _entities_with_status(uow, descriptor, entities, include=include),
+                result_code=HTTPStatus.OK,
+                next_cursor=next_cursor,
+                paginated=True,
+            )
+
+    except QueryParameterError:
+        # A client error, answered with 422 by the handler registered in
+        # create_app
+        raise
+
+    except Exception as error_msg:  # pylint: disable=W0718
+
+        return convert_to_response_object(error_msg, result_code=HTTPStatus.NOT_FOUND)
+
+
+def _get_entities_batch_with_status(
+    descriptor: EntityDescriptor, batch_get: BatchGetRequest
+):
+    """
+    POST /<entities>/batch_get for the entity type of descriptor
+    """
+    try:
+        with TimedUnitOfWork(ReadOnlyUnitOfWork(oda.uow())) as uow:
+            entities, missing_ids = get_entities_by_id(
+                uow, entity_type=descriptor.entity_type, entity_ids=batch_get.ids
+            )
+            return convert_to_json_response(
+                _entities_with_status(uow, descriptor, entities),
+                result_code=HTTPStatus.OK,
+                missing_ids=missing_ids,
+            )
+
+    except Exception as error_msg:  # pylint: disable=W0718
+
+        return convert_to_response_object(error_msg, result_code=HTTPStatus.NOT_FOUND)
+
+
+def _get_entity_with_status(
+    descriptor: EntityDescriptor, entity_id: str, request: Request
+):
+    """
+    GET /<entities>/{<entity>_id} for the entity type of descriptor
+    """
+    try:
+
+        with TimedUnitOfWork(ReadOnlyUnitOfWork(oda.uow())) as uow:
+
+            entity = getattr(uow, descriptor.repository).get(entity_id)
+            entity_status = common_get_entity_status(
+                entity_object=getattr(uow, descriptor.status_history.repository),
+                entity_id=entity_id,
+                entity_version=entity.metadata.version,
+                entity_type=descriptor.entity_type,
+            )
+
+            etag = metadata_etag(entity, entity_status)
+            if is_not_modified(request, etag):
+                return not_modified_response(etag, headers=REVALIDATE_HEADERS)
+
+            response = convert_to_json_response(
+                [entity_with_status_json(entity, entity_status.current_status)],
+                result_code=HTTPStatus.OK,
+            )
+            response.headers.update({**REVALIDATE_HEADERS, "ETag": etag})
+            return response
+
+    except Exception as error_msg:  # pylint: disable=W0718
+
+        return convert_to_response_object(error_msg, result_code=HTTPStatus.NOT_FOUND)
+
+
+def _get_entity_status(
+    descriptor: EntityDescriptor,
+    entity_id: str,
+    request: Request,
+    version: Optional[int],
+):
+    """
+    GET /<entities>/{<entity>_id}/status for the entity type of descriptor
+    """
+    try:
+        with TimedUnitOfWork(ReadOnlyUnitOfWork(oda.uow())) as uow:
+
+            entity_status = common_get_entity_status(
+                entity_object=getattr(uow, descriptor.status_history.repository),
+                entity_id=entity_id,
+                entity_version=version,
+                entity_type=descriptor.entity_type,
+            )
+
+            etag = metadata_etag(entity_status)
+            if is_not_modified(request, etag):
+                return not_modified_response(etag, headers=REVALIDATE_HEADERS)
+
+            return serialise_response(
+                entity_response_models[descriptor.entity_type].status,
+                convert_to_response_object(entity_status, result_code=HTTPStatus.OK),
+                headers={**REVALIDATE_HEADERS, "ETag": etag},
+            )
+
+    except Exception as error_msg:  # pylint: disable=W0718
+
+        return convert_to_response_object(error_msg, result_code=HTTPStatus.NOT_FOUND)
+
+
+def _put_entity_history(
+    descriptor: EntityDescriptor, entity_id: str, entity_status_history
+):
+    """
+    PUT /<entities>/{<entity>_id}/status for the entity type of descriptor
+    """
+    status_history = descriptor.status_history
+
+    try:
+        response = check_entity_id_mismatch(
+            entity_id,
+            getattr(entity_status_history, status_history.ref_field),
+        )
+
+        if response:
+
+            return response
+
+        with TimedUnitOfWork(oda.uow()) as uow:
+
+            persisted = getattr(uow, status_history.repository).add(
+                entity_status_history
+            )
+
+            uow.commit()
+            status_cache.record_status(
+                descriptor.entity_type,
+                entity_id,
+                getattr(persisted, status_history.version_field),
+                persisted,
+            )
+            status_events.publish(descriptor.entity_type, entity_id, persisted)
+
+            return serialise_response(
+                entity_response_models[descriptor.entity_type].status,
+                convert_to_response_object([persisted], result_code=HTTPStatus.OK),
+            )
+
+    except Exception as error_msg:  # pylint: disable=W0718
+
+        return convert_to_response_object(error_msg, result_code=HTTPStatus.NOT_FOUND)
+
+
+def _get_entity_status_history(
+    descriptor: EntityDescriptor,
+    query_params: ApiStatusQueryParameters,
+    history: StatusHistoryParameters,
+):
+    """
+    GET /<entities>/status/history for the entity type of descriptor
+    """
+    response_model = entity_response_models[descriptor.entity_type].status_history
+    entity_version = query_params.version
+    query_params = get_qry_params(query_params)
+
+    with TimedUnitOfWork(ReadOnlyUnitOfWork(oda.uow())) as uow:
+
+        status_histories, next_cursor = query_status_history(
+            entity_object=getattr(uow, descriptor.status_history.repository),
+            entity_type=descriptor.entity_type,
+            query_params=query_params,
+            entity_version=entity_version,
+            history=history,
+            connection=oda_connection(uow),
+        )
+
+        if not status_histories:
+
+            return convert_to_response_object(
+                ODANotFound(identifier=query_params.entity_id),
+                result_code=HTTPStatus.NOT_FOUND,
+            )
+
+    return serialise_response(
+        response_model,
+        response_model(
+            result_data=status_histories,
+            result_status=API_RESPONSE_RESULT_STATUS_SUCCESS,
+            result_code=HTTPStatus.OK,
+            next_cursor=next_cursor,
+        ),
+    )
+
+
+def add_entity_routes(
+    router: APIRouter, descriptor: EntityDescriptor, prefix: str = ""
+) -> None:
+    """
+    Takes a router and the descriptor of an entity type and adds the routes of
+    the entity type to the router
+    :param router: router to add the routes to, e.g. the router of the application
+    :param descriptor: EntityDescriptor of the entity type
+    :param prefix: path prefix of the routes, e.g. API_PREFIX
+
+    The endpoints only declare the parameters and response models of the entity
+    type, the requests being handled by the module level functions above.
+    """
+    entity_type = descriptor.entity_type
+    name = descriptor.display_name
+    history_model = descriptor.status_history.model
+    response_models = entity_response_models[entity_type]
+
+    path = f"{prefix}/{descriptor.repository}"
+    tags = [descriptor.tag]
+
+    @router.get(
+        path,
+        tags=tags,
+        name=f"get_{descriptor.repository}_with_status",
+        summary=f"Get All {name} with status appended, filter by the query parameter"
+        " like created_before, created_after and user name",
+        response_model=response_models.entities,
+    )
+    @profiled_endpoint
+    def get_entities_with_status(
+        request: Request,
+        query_params: ApiQueryParameters = Depends(),
+        pagination: PaginationParameters = Depends(get_pagination_params),
+        fields: Optional[str] = Depends(get_fields_param),
+    ) -> response_models.entities:
+        """
+        Function that a GET /<entities> request is routed to.
+
+        :param request: Incoming request, an Accept header of application/x-ndjson
+            streams the entities one JSON document per line.
+        :param query_params: Parameters to query the ODA by.
+        :param pagination: Page size and cursor of the requested page.
+        :param fields: Comma separated attributes to return, with the status, for
+            every entity.
+        :return: All entities present with status wrapped in a Response, or
+            appropriate error Response
+
+        """
+        return _get_entities_with_status(
+            descriptor, request, query_params, pagination, fields
+        )
+
+    @router.post(
+        f"{path}/batch_get",
+        tags=tags,
+        name=f"get_{descriptor.repository}_batch_with_status",
+        summary=f"Get several {name}s by identifier with status appended",
+        response_model=response_models.batch,
+    )
+    @profiled_endpoint
+    def get_entities_batch_with_status(
+        batch_get: BatchGetRequest,
+    ) -> response_models.batch:
+        """
+        Function that a POST /<entities>/batch_get request is routed to.
+
+        :param batch_get: Identifiers of the requested entities
+        :return: The entities found with status wrapped in a Response, with the
+            identifiers that could not be found in missing_ids,
+            or appropriate error Response
+
+        """
+        return _get_entities_batch_with_status(descriptor, batch_get)
+
+    @router.get(
+        f"{path}/{{{descriptor.id_field}}}",
+        tags=tags,
+        name=f"get_{entity_type}_with_status",
+        summary=f"Get specific {name} by identifier with status appended",
+        response_model=response_models.entity,
+    )
+    @profiled_endpoint
+    @_entity_id_path_param(descriptor.id_field)
+    def get_entity_with_status(
+        entity_id: str, request: Request
+    ) -> response_models.entity:
+        """
+        Function that a GET /<entities>/<entity_id> request is routed to.
+
+        :param entity_id: Requested identifier from the path parameter
+        :param request: Incoming request, a matching If-None-Match header gets 304
+            Not Modified.
+        :return: The entity with status wrapped in a Response, or appropriate
+            error Response
+
+        """
+        return _get_entity_with_status(descriptor, entity_id, request)
+
+    @router.get(
+        f"{path}/{{{descriptor.id_field}}}/status",
+        tags=tags,
+        name=f"get_{entity_type}_status",
+        summary=f"Get specific {name} status by the identifier",
+        response_model=response_models.status,
+    )
+    @profiled_endpoint
+    @_entity_id_path_param(descriptor.id_field)
+    def get_entity_status(
+        entity_id: str, request: Request, version: int = None
+    ) -> response_models.status:
+        """
+        Function that a GET /<entities>/<entity_id>/status request is routed to.
+        This method is used to GET the current status for the given entity
+
+        :param entity_id: Requested identifier from the path parameter
+        :param request: Incoming request, a matching If-None-Match header gets 304
+            Not Modified.
+        :param version: Requested version of the entity, the latest by default
+        :return: The current entity status wrapped in a Response, or appropriate
+            error Response
+
+        """
+        return _get_entity_status(descriptor, entity_id, request, version)
+
+    @router.put(
+        f"{path}/{{{descriptor.id_field}}}/status",
+        tags=tags,
+        name=f"put_{entity_type}_history",
+        summary=f"Update specific {name} status by identifier",
+        response_model=response_models.status,
+    )
+    @profiled_endpoint
+    @_entity_id_path_param(descriptor.id_field)
+    def put_entity_history(
+        entity_id: str, entity_status_history: history_model
+    ) -> response_models.status:
+        """
+        Function that a PUT /<entities>/<entity_id>/status request is routed to.
+
+        :param entity_id: Requested identifier from the path parameter
+        :param entity_status_history: Status history of the entity to add
+        :return: The added status wrapped in a Response, or appropriate error
+            Response
+
+        """
+        return _put_entity_history(descriptor, entity_id, entity_status_history)
+
+    @router.get(
+        f"{path}/status/history",
+        tags=tags,
+        name=f"get_{entity_type}_status_history",
+        summary=f"Get specific {name} status history by identifier and version",
+        response_model=response_models.status_history,
+    )
+    @profiled_endpoint
+    def get_entity_status_history(
+        query_params: ApiStatusQueryParameters = Depends(),
+        history: StatusHistoryParameters = Depends(get_status_history_params),
+    ) -> response_models.status_history:
+        """
+        Function that a GET /<entities>/status/history request is routed to.
+        This method is used to GET status history for the given entity
+
+        :param query_params: Parameters to query the ODA by.
+        :param history: Time range, page or number of newest statuses to return.
+        :return: The status history wrapped in a Response, or appropriate error
+            Response
+
+        """
+        return _get_entity_status_history(descriptor, query_params, history)
@@ -0,0 +1,77 @@
+"""
+This module contains the readiness route of the service, used as the Kubernetes
+readiness probe.
+"""
+
+import logging
+from http import HTTPStatus
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+from ska_db_oda.persistence import oda
+
+from ska_oso_ptt_services.common.constant import (
+    API_RESPONSE_RESULT_STATUS_FAILED,
+    API_RESPONSE_RESULT_STATUS_SUCCESS,
+)
+from ska_oso_ptt_services.common.oda_pool import (
+    oda_connection_pool,
+    oda_pool_status,
+    uses_postgres,
+)
+from ska_oso_ptt_services.common.read_only_uow import read_replica_pools
+from ska_oso_ptt_services.models.models import ApiResponse, ReadinessResponse
+
+LOGGER = logging.getLogger(__name__)
+
+health_router = APIRouter(prefix="/health")
+
+
+@health_router.get(
+    "/ready",
+    tags=["Health"],
+    summary="Check that the service can serve requests",
+    response_model=ApiResponse[ReadinessResponse],
+    responses={
+        HTTPStatus.SERVICE_UNAVAILABLE: {
+            "description": "An ODA connection pool is exhausted, closed or missing",
+            "model": ApiResponse[ReadinessResponse],
+        },
+    },
+)
+async def get_readiness() -> JSONResponse:
+    """
+    Function that a GET /health/ready request is routed to.
+
+    Reports the size and utilisation of every ODA connection pool, the read
+    replica one included, from the pool statistics, without acquiring a
+    connection, so it answers at once even when the pools are exhausted.
+
+    Returns:
+        ReadinessResponse wrapped in a Response, with status 503 when an ODA
+        connection pool is exhausted or closed, or when the Postgres ODA has no
+        connection pool
+
+    """
+    oda_pool = oda_connection_pool(oda)
+    pools = [
+        oda_pool_status(pool)
+        for pool in ([oda_pool] if oda_pool is not None else []) + read_replica_pools()
+    ]
+    ready = not any(pool.exhausted or pool.closed for pool in pools) and (
+        oda_pool is not None or not uses_postgres()
+    )
+    if not ready:
+        LOGGER.warning("Not ready, ODA connection pools: %s", pools)
+
+    result_code = HTTPStatus.OK if ready else HTTPStatus.SERVICE_UNAVAILABLE
+    response = ApiResponse(
+        result_data=[ReadinessResponse(ready=ready, oda_pools=pools).model_dump()],
+        result_status=(
+            API_RESPONSE_RESULT_STATUS_SUCCESS
+            if ready
+            else API_RESPONSE_RESULT_STATUS_FAILED
+        ),
+        result_code=result_code,
+    )
+    return JSONResponse(response.model_dump(mode="json"), status_code=result_code)
@@ -0,0 +1,47 @@
+"""
+This module contains the route serving the profiles of the requests profiled by
+ProfilingMiddleware. It is only included when PROFILING_ENABLED is set.
+"""
+
+import io
+import os
+import pstats
+
+from fastapi import APIRouter
+from fastapi.responses import FileResponse, PlainTextResponse, Response
+
+from ska_oso_ptt_services.common.error_handling import ODANotFound
+from ska_oso_ptt_services.common.profiling import profile_path
+
+profile_router = APIRouter(prefix="/profiles")
+
+
+@profile_router.get(
+    "/{profile_id}",
+    tags=["Profiling"],
+    summary="Download the profile of a request sent with the X-Profile header",
+    response_class=Response,
+)
+def get_profile(profile_id: str, output_format: str = "pstats") -> Response:
+    """
+    Function that a GET /profiles/<profile_id> request is routed to.
+
+    :param profile_id: X-Profile-Id header of the profiled response
+    :param output_format: pstats for the profile file, text for the functions
+        sorted by cumulative time
+    :return: The profile, or a 404 response when it is unknown or was deleted
+    """
+    path = profile_path(os.path.basename(profile_id))
+    if not os.path.isfile(path):
+        raise ODANotFound(message=f"The requested profile {profile_id} was not found.")
+
+    if output_format == "text":
+        text = io.StringIO()
+        pstats.Stats(path, stream=text).sort_stats("cumulative").print_stats(100)
+        return PlainTextResponse(text.getvalue())
+
+    return FileResponse(
+        path,
+        media_type="application/octet-stream",
+        filename=f"{profile_id}.prof",
+    )
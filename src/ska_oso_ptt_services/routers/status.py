@@ -1,31 +1,104 @@
+import asyncio
 import logging
+from enum import EnumMeta
 from http import HTTPStatus
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from ska_db_oda.persistence import oda
+from ska_db_oda.rest.api import get_qry_params
+from ska_db_oda.rest.model import ApiQueryParameters
 
-from ska_oso_ptt_services.common.constant import entity_map
+from ska_oso_ptt_services.common.cache import status_cache
+from ska_oso_ptt_services.common.constant import (
+    API_RESPONSE_RESULT_STATUS_FAILED,
+    API_RESPONSE_RESULT_STATUS_SUCCESS,
+    entity_map,
+    status_history_map,
+)
 from ska_oso_ptt_services.common.error_handling import EntityNotFound
-from ska_oso_ptt_services.common.utils import convert_to_response_object, get_responses
-from ska_oso_ptt_services.models.models import ApiResponse, EntityStatusResponse
+from ska_oso_ptt_services.common.etag import (
+    body_etag,
+    is_not_modified,
+    not_modified_response,
+)
+from ska_oso_ptt_services.common.events import status_events
+from ska_oso_ptt_services.common.metrics import TimedUnitOfWork
+from ska_oso_ptt_services.common.profiling import profiled_endpoint
+from ska_oso_ptt_services.common.read_only_uow import ReadOnlyUnitOfWork
+from ska_oso_ptt_services.common.utils import (
+    convert_to_response_object,
+    count_entities_by_status,
+)
+from ska_oso_ptt_services.models.models import (
+    ApiResponse,
+    BulkStatusUpdateResult,
+    EntityStatusHistory,
+    EntityStatusResponse,
+    EntityStatusSummary,
+    StatusCacheStatsResponse,
+)
 
 LOGGER = logging.getLogger(__name__)
 
 status_router = APIRouter(prefix="/status")
 
 
+def _render_entity_status_catalogue(
+    entity_name: str, entity_class: EnumMeta
+) -> Tuple[bytes, str]:
+    """
+    Takes an entity type and its status enum and returns the serialised
+    get_entity_status response for it together with its entity tag
+    """
+    body = (
+        convert_to_response_object(
+            EntityStatusResponse(
+                entity_type=entity_name,
+                statuses={status.name: status.value for status in entity_class},
+            ).model_dump(mode="json"),
+            result_code=HTTPStatus.OK,
+        )
+        .model_dump_json()
+        .encode("utf-8")
+    )
+    return body, body_etag(body)
+
+
+# The status enums cannot change while the process runs, so every response of
+# /status/get_entity is rendered once at import.
+ENTITY_STATUS_CATALOGUE: Dict[str, Tuple[bytes, str]] = {
+    entity_name: _render_entity_status_catalogue(entity_name, entity_class)
+    for entity_name, entity_class in entity_map.items()
+}
+
+ENTITY_STATUS_CACHE_CONTROL = "public, max-age=86400"
+
+# Idle Server-Sent Events streams get a comment line this often, which keeps
+# proxies from closing them and lets the route notice disconnected clients
+STATUS_STREAM_KEEPALIVE_SECONDS = 15
+
+
 @status_router.get(
     "/get_entity",
     tags=["Status"],
     summary="Get status dictionary by the entity parameter",
     response_model=ApiResponse[EntityStatusResponse],
-    responses=get_responses(ApiResponse[EntityStatusResponse]),
 )
-def get_entity_status(entity_name: str) -> ApiResponse[EntityStatusResponse]:
+async def get_entity_status(
+    entity_name: str, request: Request
+) -> ApiResponse[EntityStatusResponse]:
     """
     Function that returns the status dictionary for a given entity type.
 
+    The dictionaries are served from ENTITY_STATUS_CATALOGUE with a strong ETag and
+    a long Cache-Control max-age, and a request whose If-None-Match matches the ETag
+    gets 304 Not Modified.
+
     Args:
         entity_name: The name of the entity type (sbi, eb, prj, or sbd)
+        request: The incoming request
 
     Returns:
         Tuple containing dictionary of status names and values, and HTTP status code
@@ -35,16 +108,283 @@ def get_entity_status(entity_name: str) -> ApiResponse[EntityStatusResponse]:
 
     """
 
-    entity_class = entity_map.get(entity_name.lower())
-    if not entity_class:
+    catalogue = ENTITY_STATUS_CATALOGUE.get(entity_name.lower())
+    if not catalogue:
+        return convert_to_response_object(
+            EntityNotFound(entity=entity_name).message, result_code=HTTPStatus.NOT_FOUND
+        )
+
+    body, etag = catalogue
+    headers = {"Cache-Control": ENTITY_STATUS_CACHE_CONTROL}
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, headers=headers)
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={**headers, "ETag": etag},
+    )
+
+
+@status_router.get(
+    "/summary",
+    tags=["Status"],
+    summary="Get the number of entities in each status, filter by the query "
+    "parameter like created_before, created_after and user name",
+    response_model=ApiResponse[EntityStatusSummary],
+)
+@profiled_endpoint
+def get_status_summary(
+    query_params: ApiQueryParameters = Depends(),
+    entity_name: Optional[str] = None,
+) -> ApiResponse[EntityStatusSummary]:
+    """
+    Function that a GET /status/summary request is routed to.
+
+    Counts the entities matching the query parameters in each status, for every
+    entity type of entity_map, without returning the entities themselves.
+
+    Args:
+        query_params: Parameters to query the ODA by
+        entity_name: Only count entities of this type (sbi, eb, prj, or sbd)
+
+    Returns:
+        EntityStatusSummary for each entity type wrapped in a Response, or
+        appropriate error Response
+
+    """
+
+    if entity_name is not None and entity_name.lower() not in entity_map:
         return convert_to_response_object(
             EntityNotFound(entity=entity_name).message, result_code=HTTPStatus.NOT_FOUND
         )
+    entity_types = [entity_name.lower()] if entity_name else list(entity_map)
+
+    try:
+        query_params = get_qry_params(query_params)
+        summaries = []
+        with TimedUnitOfWork(ReadOnlyUnitOfWork(oda.uow())) as uow:
+            for entity_type in entity_types:
+                counts = count_entities_by_status(
+                    uow,
+                    entity_type=entity_type,
+                    query_params=query_params,
+                )
+                summaries.append(
+                    EntityStatusSummary(
+                        entity_type=entity_type,
+                        total=sum(counts.values()),
+                        counts=counts,
+                    ).model_dump(mode="json")
+                )
+
+        return convert_to_response_object(summaries, result_code=HTTPStatus.OK)
+
+    except Exception as error_msg:  # pylint: disable=W0718
+
+        return convert_to_response_object(error_msg, result_code=HTTPStatus.NOT_FOUND)
+
+
+@status_router.get(
+    "/cache",
+    tags=["Status"],
+    summary="Get the hit and miss counters of the entity status cache",
+    response_model=ApiResponse[StatusCacheStatsResponse],
+)
+async def get_status_cache_stats() -> ApiResponse[StatusCacheStatsResponse]:
+    """
+    Function that returns the counters and sizing of the in-process cache of
+    current entity statuses, used to tune STATUS_CACHE_MAXSIZE and
+    STATUS_CACHE_TTL_SECONDS.
+
+    Returns:
+        StatusCacheStatsResponse wrapped in a Response
+
+    """
 
     return convert_to_response_object(
-        EntityStatusResponse(
-            entity_type=entity_name.lower(),
-            statuses={status.name: status.value for status in entity_class},
-        ).model_dump(mode="json"),
+        StatusCacheStatsResponse(**status_cache.stats()).model_dump(mode="json"),
         result_code=HTTPStatus.OK,
     )
+
+
+async def _status_event_stream(
+    request: Request, entity_type: Optional[str], entity_id: Optional[str]
+) -> AsyncIterator[str]:
+    with status_events.subscribe(entity_type=entity_type, entity_id=entity_id) as queue:
+        yield ": connected\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(), timeout=STATUS_STREAM_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: status\ndata: {event}\n\n"
+
+
+@status_router.get(
+    "/stream",
+    tags=["Status"],
+    summary="Stream status changes of entities as Server-Sent Events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def stream_status_events(
+    request: Request,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[str] = None,
+):
+    """
+    Function that a GET /status/stream request is routed to.
+
+    Pushes a ``status`` event, whose data is a JSON document with entity_type,
+    entity_id and the persisted status history, every time a PUT
+    /{entity}/{id}/status request is committed.
+
+    Args:
+        request: The incoming request
+        entity_type: Only stream changes of this entity type (sbi, eb, prj, or sbd)
+        entity_id: Only stream changes of this entity identifier
+
+    Returns:
+        StreamingResponse of text/event-stream, or an error Response for an
+        unknown entity type
+
+    """
+
+    if entity_type is not None:
+        entity_type = entity_type.lower()
+        if entity_type not in entity_map:
+            return convert_to_response_object(
+                EntityNotFound(entity=entity_type).message,
+                result_code=HTTPStatus.NOT_FOUND,
+            )
+
+    return StreamingResponse(
+        _status_event_stream(request, entity_type=entity_type, entity_id=entity_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@status_router.put(
+    "/bulk",
+    tags=["Status"],
+    summary="Update the status of several SBDs, SBIs, EBs and Projects at once",
+    response_model=ApiResponse[BulkStatusUpdateResult],
+)
+def put_bulk_status_history(
+    status_histories: List[EntityStatusHistory],
+) -> ApiResponse[BulkStatusUpdateResult]:
+    """
+    Function that a PUT /status/bulk request is routed to.
+
+    Adds every status history in one unit of work and commits them together, so
+    either all of them are persisted or none is. The first status the ODA
+    rejects stops the update, that item reports the error, the preceding items
+    are reported as rolled back and the following items as not attempted.
+
+    Args:
+        status_histories: SBDStatusHistory, SBIStatusHistory, OSOEBStatusHistory
+            and ProjectStatusHistory objects, in any order
+
+    Returns:
+        BulkStatusUpdateResult for each item, in request order, wrapped in a
+        Response
+
+    """
+
+    items = [
+        (entity_type, getattr(status_history, descriptor.ref_field), status_history)
+        for status_history in status_histories
+        for entity_type, descriptor in status_history_map.items()
+        if isinstance(status_history, descriptor.model)
+    ]
+    results = []
+    persisted_histories = []
+    rejected = False
+
+    with TimedUnitOfWork(oda.uow()) as uow:
+
+        for entity_type, entity_id, status_history in items:
+            if rejected:
+                results.append(
+                    BulkStatusUpdateResult(
+                        entity_type=entity_type,
+                        entity_id=entity_id,
+                        result_status=API_RESPONSE_RESULT_STATUS_FAILED,
+                        result_code=HTTPStatus.FAILED_DEPENDENCY,
+                        result_data="Not attempted, an earlier status was rejected",
+                    )
+                )
+                continue
+
+            try:
+                persisted = getattr(
+                    uow, status_history_map[entity_type].repository
+                ).add(status_history)
+                persisted_histories.append(persisted)
+                results.append(
+                    BulkStatusUpdateResult(
+                        entity_type=entity_type,
+                        entity_id=entity_id,
+                        result_status=API_RESPONSE_RESULT_STATUS_SUCCESS,
+                        result_code=HTTPStatus.OK,
+                        result_data=persisted.model_dump(mode="json"),
+                    )
+                )
+            except Exception as error_msg:  # pylint: disable=W0718
+                rejected = True
+                results.append(
+                    BulkStatusUpdateResult(
+                        entity_type=entity_type,
+                        entity_id=entity_id,
+                        result_status=API_RESPONSE_RESULT_STATUS_FAILED,
+                        result_code=HTTPStatus.UNPROCESSABLE_ENTITY,
+                        result_data=getattr(error_msg, "message", str(error_msg)),
+                    )
+                )
+
+        committed = not rejected
+        if committed:
+            uow.commit()
+
+    if not committed:
+        # Nothing was committed, the statuses added before the rejected one
+        # were discarded with the unit of work
+        results = [
+            (
+                result.model_copy(
+                    update={
+                        "result_status": API_RESPONSE_RESULT_STATUS_FAILED,
+                        "result_code": HTTPStatus.FAILED_DEPENDENCY,
+                        "result_data": "Rolled back, a later status was rejected",
+                    }
+                )
+                if result.result_code == HTTPStatus.OK
+                else result
+            )
+            for result in results
+        ]
+
+    if committed:
+        for (entity_type, entity_id, _), persisted in zip(items, persisted_histories):
+            status_cache.record_status(
+                entity_type,
+                entity_id,
+                getattr(persisted, status_history_map[entity_type].version_field),
+                persisted,
+            )
+            status_events.publish(entity_type, entity_id, persisted)
+
+    return ApiResponse(
+        result_data=[result.model_dump(mode="json") for result in results],
+        result_status=(
+            API_RESPONSE_RESULT_STATUS_SUCCESS
+            if committed
+            else API_RESPONSE_RESULT_STATUS_FAILED
+        ),
+        result_code=HTTPStatus.OK if committed else HTTPStatus.UNPROCESSABLE_ENTITY,
+    )
@@ -0,0 +1,70 @@
+"""
+Production entry point of the PTT services, running the application in
+WEB_CONCURRENCY uvicorn worker processes.
+
+Run with::
+
+    python -m ska_oso_ptt_services.server
+
+and configured with the environment variables below, set by the Helm chart from
+rest.server in values.yaml.
+
+The Helm chart runs one worker per core of the CPU limit of the pod. The status
+cache is held in the memory of each worker process and a status update only
+refreshes the cache of the worker handling it, so the other workers may serve the
+previous status for up to STATUS_CACHE_TTL_SECONDS, see common/cache.py.
+/status/stream receives the updates made through its own worker, see
+common/events.py. The /metrics values of the workers are shared through
+PROMETHEUS_MULTIPROC_DIR, see common/metrics.py.
+"""
+
+import os
+from pathlib import Path
+
+import uvicorn
+
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "5000"))
+# Worker processes, see above
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+KEEP_ALIVE_TIMEOUT_SECONDS = int(os.getenv("KEEP_ALIVE_TIMEOUT_SECONDS", "5"))
+BACKLOG = int(os.getenv("BACKLOG", "2048"))
+# Time in-flight requests are given to complete on SIGTERM before the workers
+# shut down
+GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS = int(
+    os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS", "30")
+)
+# Directory where the workers keep their metrics, see common/metrics.py
+PROMETHEUS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+
+
+def clear_metrics_dir() -> None:
+    """
+    Creates PROMETHEUS_MULTIPROC_DIR, or removes the metrics of the workers of a
+    previous run of the container from it
+    """
+    if PROMETHEUS_MULTIPROC_DIR is None:
+        return
+    metrics_dir = Path(PROMETHEUS_MULTIPROC_DIR)
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    for metrics_file in metrics_dir.glob("*.db"):
+        metrics_file.unlink()
+
+
+def main() -> None:
+    clear_metrics_dir()
+    uvicorn.run(
+        "ska_oso_ptt_services.app:main",
+        host=HOST,
+        port=PORT,
+        workers=WEB_CONCURRENCY,
+        backlog=BACKLOG,
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT_SECONDS,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT_SECONDS,
+        # Trust TLS headers set by nginx ingress:
+        proxy_headers=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
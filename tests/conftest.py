@@ -6,6 +6,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from ska_oso_ptt_services.app import create_app
+from ska_oso_ptt_services.common.cache import status_cache
 
 TEST_FILES_PATH = "unit/ska_oso_ptt_services/routers/test_data_files"
 
@@ -20,6 +21,16 @@ def load_json_from_file(filename):
         return json.load(json_file)
 
 
+@pytest.fixture(autouse=True)
+def clear_status_cache():
+    """
+    Make sure statuses cached by one test are not served to the next one
+    """
+    status_cache.clear()
+    yield
+    status_cache.clear()
+
+
 @pytest.fixture(scope="session")
 def client_get():
 
@@ -38,6 +49,15 @@ def client_put():
     return partial(client.put)
 
 
+@pytest.fixture(scope="session")
+def client_post():
+
+    app = create_app()
+    client = TestClient(app)
+
+    return partial(client.post)
+
+
 @pytest.fixture
 def create_entity_object():
 
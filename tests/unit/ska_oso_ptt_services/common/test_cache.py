@@ -0,0 +1,69 @@
+from ska_oso_ptt_services.common.cache import EntityStatusCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_entries_expire_after_ttl():
+    """Verifying that a cached status is served until its time to live passes"""
+
+    timer = FakeTimer()
+    cache = EntityStatusCache(maxsize=10, ttl=5, timer=timer)
+    cache.set(("sbd", "sbd-1", "1"), "Draft")
+
+    assert cache.get(("sbd", "sbd-1", "1")) == "Draft"
+    timer.now = 6
+    assert cache.get(("sbd", "sbd-1", "1")) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_evicts_least_recently_used():
+    """Verifying that the least recently used status is evicted when full"""
+
+    cache = EntityStatusCache(maxsize=2, ttl=60)
+    cache.set(("sbd", "sbd-1", "1"), "Draft")
+    cache.set(("sbd", "sbd-2", "1"), "Draft")
+    cache.get(("sbd", "sbd-1", "1"))
+    cache.set(("sbd", "sbd-3", "1"), "Draft")
+
+    assert cache.get(("sbd", "sbd-2", "1")) is None
+    assert cache.get(("sbd", "sbd-1", "1")) == "Draft"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_invalidate_entity_removes_every_version():
+    """Verifying that invalidate_entity drops all versions of one entity only"""
+
+    cache = EntityStatusCache(maxsize=10, ttl=60)
+    cache.set(("sbi", "sbi-1", "1"), "Created")
+    cache.set(("sbi", "sbi-1", None), "Executing")
+    cache.set(("sbi", "sbi-2", "1"), "Created")
+    cache.set(("eb", "sbi-1", "1"), "Created")
+
+    cache.invalidate_entity("sbi", "sbi-1")
+
+    assert cache.get(("sbi", "sbi-1", "1")) is None
+    assert cache.get(("sbi", "sbi-1", None)) is None
+    assert cache.get(("sbi", "sbi-2", "1")) == "Created"
+    assert cache.get(("eb", "sbi-1", "1")) == "Created"
+
+
+def test_cache_record_status_writes_the_committed_status_through():
+    """Verifying that a committed status replaces the cached one of its version"""
+
+    cache = EntityStatusCache(maxsize=10, ttl=60)
+    cache.set(("sbi", "sbi-1", "1"), "Created")
+    cache.set(("sbi", "sbi-1", "2"), "Created")
+    cache.set(("sbi", "sbi-1", None), "Created")
+
+    cache.record_status("sbi", "sbi-1", 1, "Executing")
+
+    assert cache.get(("sbi", "sbi-1", "1")) == "Executing"
+    assert cache.get(("sbi", "sbi-1", "2")) is None
+    assert cache.get(("sbi", "sbi-1", None)) is None
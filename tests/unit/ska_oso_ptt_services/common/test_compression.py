@@ -0,0 +1,166 @@
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from ska_oso_ptt_services.common.compression import (
+    CompressionMiddleware,
+    negotiate_encoding,
+)
+from ska_oso_ptt_services.common.etag import (
+    decoded_etag,
+    is_not_modified,
+    not_modified_response,
+)
+
+LARGE_BODY = '{"sbd_id":"sbd-t0001-20240702-00002","status":"Draft"}\n' * 100
+
+
+@pytest.fixture(scope="module")
+def compressing_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_BODY)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("small")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            iter(LARGE_BODY.splitlines(keepends=True)),
+            media_type="application/x-ndjson",
+        )
+
+    @app.get("/etagged")
+    def etagged(request: Request):
+        if is_not_modified(request, '"abc"'):
+            return not_modified_response('"abc"')
+        return PlainTextResponse(LARGE_BODY, headers={"ETag": '"abc"'})
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(iter([LARGE_BODY]), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        ("gzip, deflate", "gzip"),
+        ("zstd;q=0.5, gzip", "gzip"),
+        ("gzip;q=0", None),
+        ("identity", None),
+        ("*", "gzip"),
+        ("", None),
+    ],
+)
+def test_negotiate_encoding(accept_encoding, expected):
+    """Verifying that the content coding with the highest q value is chosen"""
+
+    assert negotiate_encoding(accept_encoding, ["gzip"]) == expected
+
+
+def test_negotiate_encoding_prefers_server_order_on_ties():
+    """Verifying that the server preference breaks ties between codings"""
+
+    assert negotiate_encoding("gzip, br, zstd", ["zstd", "br", "gzip"]) == "zstd"
+    assert negotiate_encoding("gzip, br;q=0.9", ["zstd", "br", "gzip"]) == "gzip"
+
+
+def test_large_response_is_compressed(compressing_client):
+    """Verifying that responses above the minimum size are gzip compressed"""
+
+    response = compressing_client.get("/large", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(LARGE_BODY)
+    assert response.text == LARGE_BODY
+
+
+def test_small_response_is_not_compressed(compressing_client):
+    """Verifying that responses below the minimum size are sent as is"""
+
+    response = compressing_client.get("/small", headers={"accept-encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert response.text == "small"
+
+
+def test_streaming_response_is_compressed_incrementally(compressing_client):
+    """Verifying that every chunk of a streaming response can be decoded as
+    soon as it is received"""
+
+    with compressing_client.stream(
+        "GET", "/stream", headers={"accept-encoding": "gzip"}
+    ) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        chunks = list(response.iter_raw())
+
+    assert zlib.decompressobj(31).decompress(chunks[0]).startswith(b'{"sbd_id"')
+    assert gzip.decompress(b"".join(chunks)).decode() == LARGE_BODY
+
+
+def test_server_sent_events_are_not_compressed(compressing_client):
+    """Verifying that Server-Sent Events are never compressed"""
+
+    response = compressing_client.get("/events", headers={"accept-encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+
+
+def test_compressed_response_etag_carries_coding(compressing_client):
+    """Verifying that the entity tag of a compressed response differs from the
+    one of the uncompressed representation"""
+
+    compressed = compressing_client.get("/etagged", headers={"accept-encoding": "gzip"})
+    uncompressed = compressing_client.get(
+        "/etagged", headers={"accept-encoding": "identity"}
+    )
+
+    assert compressed.headers["etag"] == '"abc-gzip"'
+    assert uncompressed.headers["etag"] == '"abc"'
+
+
+@pytest.mark.parametrize("etag", ['"abc-gzip"', 'W/"abc-gzip"'])
+def test_not_modified_for_compressed_representation(compressing_client, etag):
+    """Verifying that a client holding the compressed representation is answered
+    with 304 carrying its entity tag"""
+
+    response = compressing_client.get(
+        "/etagged", headers={"accept-encoding": "gzip", "if-none-match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"abc-gzip"'
+
+
+def test_not_modified_for_uncompressed_representation(compressing_client):
+    """Verifying that a client holding the uncompressed representation keeps its
+    entity tag when it now accepts gzip"""
+
+    response = compressing_client.get(
+        "/etagged", headers={"accept-encoding": "gzip", "if-none-match": '"abc"'}
+    )
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"abc"'
+
+
+@pytest.mark.parametrize(
+    "etag, expected",
+    [('"abc"', '"abc"'), ('W/"abc"', '"abc"'), ('"abc-br"', '"abc"'), ("*", "*")],
+)
+def test_decoded_etag(etag, expected):
+    """Verifying that the weak prefix and content coding are removed"""
+
+    assert decoded_etag(etag) == expected
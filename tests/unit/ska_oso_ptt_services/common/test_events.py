@@ -0,0 +1,77 @@
+import asyncio
+import json
+import threading
+
+from pydantic import BaseModel
+
+from ska_oso_ptt_services.common.events import StatusEventBroker
+
+
+class FakeStatus(BaseModel):
+    current_status: str
+
+
+def test_status_events_are_filtered_and_delivered_across_threads():
+    """Verifying that a status published from a worker thread reaches only the
+    subscribers whose filters match"""
+
+    broker = StatusEventBroker()
+
+    async def receive():
+        with (
+            broker.subscribe(entity_type="sbi") as sbi_events,
+            broker.subscribe(entity_id="eb-t0001-20240702-00002") as eb_events,
+        ):
+            publisher = threading.Thread(
+                target=lambda: (
+                    broker.publish(
+                        "sbi",
+                        "sbi-t0001-20240702-00002",
+                        FakeStatus(current_status="Executing"),
+                    ),
+                    broker.publish(
+                        "eb",
+                        "eb-t0001-20240702-00002",
+                        FakeStatus(current_status="Created"),
+                    ),
+                )
+            )
+            publisher.start()
+            publisher.join()
+
+            received = (
+                json.loads(await asyncio.wait_for(sbi_events.get(), timeout=1)),
+                json.loads(await asyncio.wait_for(eb_events.get(), timeout=1)),
+            )
+            assert sbi_events.empty()
+            assert eb_events.empty()
+            return received
+
+    sbi_event, eb_event = asyncio.run(receive())
+
+    assert sbi_event["entity_id"] == "sbi-t0001-20240702-00002"
+    assert sbi_event["status"]["current_status"] == "Executing"
+    assert eb_event["entity_type"] == "eb"
+    assert broker.subscriber_count == 0
+
+
+def test_slow_subscriber_keeps_latest_events():
+    """Verifying that a full subscriber queue drops its oldest events"""
+
+    broker = StatusEventBroker(queue_size=2)
+
+    async def receive():
+        with broker.subscribe() as events:
+            for status in ("Created", "Executing", "Observed"):
+                broker.publish(
+                    "sbi", "sbi-t0001-20240702-00002", FakeStatus(current_status=status)
+                )
+            await asyncio.sleep(0)
+            return [json.loads(events.get_nowait()) for _ in range(events.qsize())]
+
+    received = asyncio.run(receive())
+
+    assert [event["status"]["current_status"] for event in received] == [
+        "Executing",
+        "Observed",
+    ]
@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from ska_oso_ptt_services.common.history import (
+    StatusHistoryParameters,
+    query_status_history,
+    select_status_history,
+)
+from ska_oso_ptt_services.common.pagination import decode_cursor
+
+STARTED = datetime(2024, 7, 2, tzinfo=timezone.utc)
+
+
+def status_rows(count):
+    return [
+        SimpleNamespace(
+            sbi_version=1,
+            current_status=f"status-{index}",
+            metadata=SimpleNamespace(last_modified_on=STARTED + timedelta(hours=index)),
+        )
+        for index in range(count)
+    ]
+
+
+def current_statuses(rows):
+    return [row.current_status for row in rows]
+
+
+def test_select_status_history_without_parameters_returns_every_row():
+    """Verifying that the history is unchanged when no bound is requested"""
+
+    rows = status_rows(3)
+
+    assert select_status_history(rows, StatusHistoryParameters()) == (
+        rows,
+        None,
+    )
+
+
+def test_select_status_history_filters_by_time_range():
+    """Verifying that since is inclusive, until exclusive, newest first"""
+
+    selected, _ = select_status_history(
+        status_rows(5),
+        StatusHistoryParameters(
+            since=STARTED + timedelta(hours=1),
+            until=datetime(2024, 7, 2, 4),
+        ),
+    )
+
+    assert current_statuses(selected) == ["status-3", "status-2", "status-1"]
+
+
+def test_select_status_history_pages_with_cursor():
+    """Verifying that limit and cursor page through the history"""
+
+    rows = status_rows(5)
+
+    first, cursor = select_status_history(rows, StatusHistoryParameters(limit=2))
+    second, _ = select_status_history(
+        rows, StatusHistoryParameters(limit=2, cursor=cursor)
+    )
+
+    assert current_statuses(first) == ["status-4", "status-3"]
+    assert current_statuses(second) == ["status-2", "status-1"]
+
+
+def test_select_status_history_returns_latest_rows():
+    """Verifying that latest returns only the newest rows"""
+
+    selected, cursor = select_status_history(
+        status_rows(5), StatusHistoryParameters(latest=2)
+    )
+
+    assert current_statuses(selected) == ["status-4", "status-3"]
+    assert cursor is None
+
+
+@mock.patch("ska_oso_ptt_services.common.history.common_get_entity_status")
+def test_query_status_history_serves_current_status_without_history(
+    mock_get_entity_status,
+):
+    """Verifying that latest=1 for one version reads the current status only"""
+
+    entity_object = mock.MagicMock()
+    query_params = SimpleNamespace(entity_id="sbi-t0001-20240702-00002")
+
+    rows, _ = query_status_history(
+        entity_object,
+        "sbi",
+        query_params,
+        entity_version=1,
+        history=StatusHistoryParameters(latest=1),
+    )
+
+    assert rows == [mock_get_entity_status.return_value]
+    entity_object.query.assert_not_called()
+
+
+def test_select_status_history_pages_through_rows_modified_together():
+    """Verifying that rows sharing a last modified date and version are each
+    returned once when paging"""
+
+    rows = [
+        SimpleNamespace(
+            sbi_version=1,
+            current_status=f"status-{index}",
+            metadata=SimpleNamespace(last_modified_on=STARTED),
+        )
+        for index in range(3)
+    ]
+    seen = []
+    cursor = None
+
+    while True:
+        page, cursor = select_status_history(
+            rows, StatusHistoryParameters(limit=1, cursor=cursor)
+        )
+        seen.extend(current_statuses(page))
+        if cursor is None:
+            break
+
+    assert seen == ["status-2", "status-1", "status-0"]
+
+
+def test_query_status_history_keys_postgres_rows_by_identifier():
+    """Verifying that on a Postgres ODA the history is read with the row
+    identifiers, which break the ties between rows modified together"""
+
+    columns = (
+        "id",
+        "sbi_ref",
+        "sbi_version",
+        "current_status",
+        "previous_status",
+        "created_by",
+        "created_on",
+        "last_modified_by",
+        "last_modified_on",
+    )
+    connection = mock.MagicMock()
+    cursor = connection.execute.return_value
+    cursor.description = [SimpleNamespace(name=column) for column in columns]
+    cursor.fetchall.return_value = [
+        (row_id, "sbi-1", 1, status, status, "user", STARTED, "user", STARTED)
+        for row_id, status in ((7, "Created"), (3, "Executing"), (12, "Observed"))
+    ]
+    entity_object = mock.MagicMock()
+
+    rows, next_cursor = query_status_history(
+        entity_object,
+        "sbi",
+        SimpleNamespace(entity_id="sbi-1"),
+        entity_version=1,
+        history=StatusHistoryParameters(limit=2),
+        connection=connection,
+    )
+
+    assert connection.execute.call_args.args[1] == ("sbi-1", 1)
+    entity_object.query.assert_not_called()
+    assert current_statuses(rows) == ["Observed", "Created"]
+    assert decode_cursor(next_cursor) == (STARTED, 7)
@@ -0,0 +1,54 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from anyio import to_thread
+
+from ska_oso_ptt_services.common import lifecycle
+
+
+class FakePool:
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_configure_threadpool_sets_the_thread_limiter():
+    async def configure():
+        await lifecycle.configure_threadpool()
+        return to_thread.current_default_thread_limiter().total_tokens
+
+    with mock.patch.object(lifecycle, "THREADPOOL_SIZE", 7):
+        assert asyncio.run(configure()) == 7
+
+
+def test_close_oda_closes_the_pools():
+    pool = FakePool()
+
+    asyncio.run(lifecycle.close_oda(SimpleNamespace(_connection_pool=pool)))
+
+    assert pool.closed
+
+
+def test_init_oda_runs_the_startup_handlers_of_the_oda_in_place():
+    """Verifying that the startup handlers registered by oda.init_app run within
+    init_oda, before the handlers registered after it, and only once"""
+
+    calls = []
+
+    async def oda_startup():
+        calls.append("oda_startup")
+
+    app = SimpleNamespace(router=SimpleNamespace(on_startup=[]))
+    oda = mock.MagicMock()
+    oda.init_app.side_effect = lambda app: app.router.on_startup.extend(
+        [oda_startup, lambda: calls.append("oda_sync_startup")]
+    )
+
+    asyncio.run(lifecycle.init_oda(oda, app))
+
+    oda.init_app.assert_called_once_with(app)
+    assert calls == ["oda_startup", "oda_sync_startup"]
+    assert not app.router.on_startup
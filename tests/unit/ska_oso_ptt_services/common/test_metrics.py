@@ -0,0 +1,105 @@
+import subprocess
+import sys
+from unittest import mock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from ska_oso_ptt_services.app import API_PREFIX
+from ska_oso_ptt_services.common import metrics
+from ska_oso_ptt_services.common.metrics import TimedUnitOfWork
+
+TIME_ODA_GET = """
+from ska_oso_ptt_services.common.metrics import time_oda_operation
+
+with time_oda_operation("get", "sbis"):
+    pass
+"""
+
+
+def sample_value(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_timed_uow_times_repository_calls_and_commit():
+    """Verifying that TimedUnitOfWork times the ODA operations and counts the
+    failed ones"""
+
+    uow_mock = mock.MagicMock()
+    uow_mock.sbis.get.side_effect = KeyError("sbi-mvp01-20240426-5007")
+    oda_mock = mock.MagicMock()
+    oda_mock.uow().__enter__.return_value = uow_mock
+
+    gets = sample_value(
+        "ptt_oda_operation_duration_seconds_count", operation="get", repository="sbis"
+    )
+    failed_gets = sample_value(
+        "ptt_oda_operation_errors_total", operation="get", repository="sbis"
+    )
+    commits = sample_value(
+        "ptt_oda_operation_duration_seconds_count", operation="commit", repository=""
+    )
+
+    with TimedUnitOfWork(oda_mock.uow()) as uow:
+        with pytest.raises(KeyError):
+            uow.sbis.get("sbi-mvp01-20240426-5007")
+        uow.commit()
+
+    assert (
+        sample_value(
+            "ptt_oda_operation_duration_seconds_count",
+            operation="get",
+            repository="sbis",
+        )
+        == gets + 1
+    )
+    assert (
+        sample_value(
+            "ptt_oda_operation_errors_total", operation="get", repository="sbis"
+        )
+        == failed_gets + 1
+    )
+    assert (
+        sample_value(
+            "ptt_oda_operation_duration_seconds_count",
+            operation="commit",
+            repository="",
+        )
+        == commits + 1
+    )
+    uow_mock.commit.assert_called_once()
+
+
+def test_metrics_endpoint_labels_requests_by_route_template(client_get):
+    """Verifying that /metrics exposes request latencies by route template
+    rather than by path"""
+
+    client_get(f"{API_PREFIX}/status/get_entity?entity_name=sbd")
+
+    metrics = client_get("/metrics").text
+
+    assert (
+        'ptt_http_request_duration_seconds_count{method="GET",'
+        f'route="{API_PREFIX}/status/get_entity",status_code="200"}}'
+    ) in metrics
+    assert "ptt_http_requests_in_progress" in metrics
+
+
+def test_metrics_are_aggregated_over_worker_processes(tmp_path, monkeypatch):
+    """Verifying that with PROMETHEUS_MULTIPROC_DIR the metrics of every worker
+    process are served"""
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", TIME_ODA_GET], check=True)
+
+    with mock.patch.object(metrics, "PROMETHEUS_MULTIPROC_DIR", str(tmp_path)):
+        registry = metrics._collecting_registry()  # pylint: disable=protected-access
+
+    assert (
+        registry.get_sample_value(
+            "ptt_oda_operation_duration_seconds_count",
+            {"operation": "get", "repository": "sbis"},
+        )
+        == 2
+    )
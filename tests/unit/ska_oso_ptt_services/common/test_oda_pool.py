@@ -0,0 +1,93 @@
+import asyncio
+from types import SimpleNamespace
+from unittest import mock
+
+from ska_oso_ptt_services.common.oda_pool import (
+    ODAPoolSettings,
+    configure_oda_pools,
+    oda_connection_pool,
+    oda_pool_status,
+)
+
+
+class FakePool:
+    def __init__(self, stats=None):
+        self.name = "pool-1"
+        self.closed = False
+        self.stats = stats or {}
+        self.sizes = None
+        self.timeout = 30.0
+        self.max_lifetime = 3600.0
+
+    def resize(self, min_size, max_size):
+        self.sizes = (min_size, max_size)
+
+    def get_stats(self):
+        return self.stats
+
+
+def test_oda_connection_pool_is_read_from_the_oda():
+    pool = FakePool()
+
+    assert oda_connection_pool(SimpleNamespace(_connection_pool=pool)) is pool
+
+
+def test_missing_oda_connection_pool_is_logged_as_an_error(caplog):
+    with mock.patch(
+        "ska_oso_ptt_services.common.oda_pool.ODA_BACKEND_TYPE", "postgres"
+    ):
+        assert oda_connection_pool(SimpleNamespace()) is None
+
+    assert "no connection pool" in caplog.text
+
+
+def test_filesystem_oda_has_no_connection_pool(caplog):
+    with mock.patch(
+        "ska_oso_ptt_services.common.oda_pool.ODA_BACKEND_TYPE", "filesystem"
+    ):
+        assert oda_connection_pool(SimpleNamespace()) is None
+
+    assert not caplog.text
+
+
+def test_configure_oda_pools_applies_the_settings():
+    pool = FakePool()
+
+    asyncio.run(
+        configure_oda_pools(
+            SimpleNamespace(_connection_pool=pool),
+            ODAPoolSettings(
+                min_size=2, max_size=8, timeout_seconds=5, max_lifetime_seconds=600
+            ),
+        )
+    )
+
+    assert pool.sizes == (2, 8)
+    assert pool.timeout == 5
+    assert pool.max_lifetime == 600
+
+
+def test_oda_pool_status_reports_utilisation():
+    pool = FakePool({"pool_min": 2, "pool_max": 8, "pool_size": 4, "pool_available": 2})
+
+    status = oda_pool_status(pool)
+
+    assert status.utilisation == 0.25
+    assert not status.exhausted
+
+
+def test_oda_pool_status_is_exhausted_when_requests_wait_for_a_full_pool():
+    pool = FakePool(
+        {
+            "pool_min": 2,
+            "pool_max": 8,
+            "pool_size": 8,
+            "pool_available": 0,
+            "requests_waiting": 3,
+        }
+    )
+
+    status = oda_pool_status(pool)
+
+    assert status.utilisation == 1.0
+    assert status.exhausted
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from ska_oso_ptt_services.common.error_handling import QueryParameterError
+from ska_oso_ptt_services.common.pagination import PaginationParameters, paginate
+
+BASE_DATE = datetime(2024, 7, 2, tzinfo=timezone.utc)
+
+
+def _entities(count):
+    return [
+        SimpleNamespace(
+            sbd_id=f"sbd-t0001-20240702-{index:05}",
+            metadata=SimpleNamespace(last_modified_on=BASE_DATE + timedelta(index % 3)),
+        )
+        for index in range(count)
+    ]
+
+
+def test_paginate_without_page_size_returns_all_entities():
+    """Verifying that paginate leaves the entities untouched when no
+    pagination is requested"""
+
+    entities = _entities(5)
+
+    page, next_cursor = paginate(
+        entities, entity_id=lambda sbd: sbd.sbd_id, pagination=PaginationParameters()
+    )
+
+    assert page == entities
+    assert next_cursor is None
+
+
+def test_paginate_walks_every_entity_exactly_once():
+    """Verifying that following next_cursor returns every entity once, newest first"""
+
+    entities = _entities(7)
+    seen = []
+    next_cursor = None
+
+    while True:
+        page, next_cursor = paginate(
+            entities,
+            entity_id=lambda sbd: sbd.sbd_id,
+            pagination=PaginationParameters(page_size=3, cursor=next_cursor),
+        )
+        seen.extend(page)
+        if next_cursor is None:
+            break
+
+    assert len(seen) == len(entities)
+    assert {sbd.sbd_id for sbd in seen} == {sbd.sbd_id for sbd in entities}
+    assert [sbd.metadata.last_modified_on for sbd in seen] == sorted(
+        (sbd.metadata.last_modified_on for sbd in entities), reverse=True
+    )
+
+
+def test_paginate_invalid_cursor():
+    """Verifying that paginate raises QueryParameterError for a malformed cursor"""
+
+    with pytest.raises(QueryParameterError):
+        paginate(
+            _entities(2),
+            entity_id=lambda sbd: sbd.sbd_id,
+            pagination=PaginationParameters(page_size=1, cursor="not-a-cursor"),
+        )
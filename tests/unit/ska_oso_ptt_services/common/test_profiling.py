@@ -0,0 +1,77 @@
+from http import HTTPStatus
+from unittest import mock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ska_oso_ptt_services.app import API_PREFIX, create_app
+from ska_oso_ptt_services.common import profiling
+
+
+@pytest.fixture
+def profiling_client(tmp_path):
+    with mock.patch.object(profiling, "PROFILE_DIR", str(tmp_path)):
+        yield TestClient(create_app(profiling=True))
+
+
+def test_profiled_request_can_be_downloaded(profiling_client):
+    """Verifying that a request sent with the X-Profile header is profiled and
+    its profile can be downloaded"""
+
+    response = profiling_client.get(
+        f"{API_PREFIX}/status/get_entity?entity_name=sbd",
+        headers={"X-Profile": "1"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    profile_id = response.headers["x-profile-id"]
+
+    profile = profiling_client.get(
+        f"{API_PREFIX}/profiles/{profile_id}", params={"output_format": "text"}
+    )
+
+    assert profile.status_code == HTTPStatus.OK
+    assert "get_entity_status" in profile.text
+
+
+def test_requests_without_header_are_not_profiled(profiling_client):
+    """Verifying that only the requests sent with the X-Profile header are
+    profiled"""
+
+    response = profiling_client.get(f"{API_PREFIX}/status/get_entity?entity_name=sbd")
+
+    assert "x-profile-id" not in response.headers
+
+
+def test_profiling_is_off_by_default(client_get):
+    """Verifying that the X-Profile header is ignored unless profiling is
+    enabled"""
+
+    response = client_get(
+        f"{API_PREFIX}/status/get_entity?entity_name=sbd",
+        headers={"X-Profile": "1"},
+    )
+
+    assert "x-profile-id" not in response.headers
+
+
+def test_profiled_endpoint_profiles_the_calls_of_a_profiled_request():
+    """Verifying that a sync endpoint is profiled only while the request it
+    serves is being profiled"""
+
+    @profiling.profiled_endpoint
+    def endpoint(value):
+        return value * 2
+
+    assert endpoint(2) == 4
+
+    thread_profiles = []
+    token = profiling._thread_profiles.set(  # pylint: disable=protected-access
+        thread_profiles
+    )
+    try:
+        assert endpoint(value=3) == 6
+    finally:
+        profiling._thread_profiles.reset(token)  # pylint: disable=protected-access
+
+    assert len(thread_profiles) == 1
@@ -0,0 +1,79 @@
+from unittest import mock
+
+import pytest
+from ska_db_oda.persistence.unitofwork.postgresunitofwork import PostgresUnitOfWork
+
+from ska_oso_ptt_services.common import read_only_uow
+from ska_oso_ptt_services.common.error_handling import ODAError
+from ska_oso_ptt_services.common.oda_pool import uow_connection
+from ska_oso_ptt_services.common.read_only_uow import ReadOnlyUnitOfWork
+
+
+def connection_pool():
+    """Mock psycopg pool handing out one connection, outside any transaction"""
+    connection = mock.MagicMock()
+    connection.read_only = None
+    connection.info.transaction_status.name = "IDLE"
+
+    pool = mock.MagicMock()
+    pool.getconn.return_value = connection
+    pool.connection.return_value.__enter__.return_value = connection
+    return pool, connection
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.exited = False
+
+    def __enter__(self):
+        self.sbds = mock.MagicMock()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.exited = True
+
+
+def test_read_only_uow_starts_read_only_transactions():
+    """Verifying that the connection of a PostgresUnitOfWork is found and its
+    transaction started as read-only, then rolled back"""
+    pool, connection = connection_pool()
+    uow = PostgresUnitOfWork(pool)
+
+    with ReadOnlyUnitOfWork(uow):
+        assert uow_connection(uow) is connection
+        assert connection.read_only is True
+
+    connection.rollback.assert_called()
+    assert connection.read_only is None
+
+
+def test_read_only_uow_forwards_other_units_of_work():
+    uow = FakeUnitOfWork()
+
+    with ReadOnlyUnitOfWork(uow) as read_only:
+        read_only.sbds.get("sbd-t0001-20240702-00002")
+
+    uow.sbds.get.assert_called_once_with("sbd-t0001-20240702-00002")
+    assert uow.exited
+
+
+def test_read_only_uow_cannot_be_committed():
+    with ReadOnlyUnitOfWork(FakeUnitOfWork()) as read_only:
+        with pytest.raises(ODAError):
+            read_only.commit()
+
+
+def test_read_only_uow_uses_the_read_replica_pool():
+    """Verifying that reads take their connection from the replica pool without
+    changing the pool of the ODA unit of work"""
+    primary_pool, _ = connection_pool()
+    replica_pool, replica_connection = connection_pool()
+    uow = PostgresUnitOfWork(primary_pool)
+
+    with mock.patch.object(read_only_uow, "_replica_pool", replica_pool):
+        with ReadOnlyUnitOfWork(uow):
+            assert replica_connection.read_only is True
+
+    assert not primary_pool.getconn.called
+    assert not primary_pool.connection.called
+    assert uow._connection_pool is primary_pool  # pylint: disable=protected-access
@@ -0,0 +1,52 @@
+import json
+from http import HTTPStatus
+
+from ska_oso_ptt_services.common.constant import entity_descriptors
+from ska_oso_ptt_services.common.response_models import (
+    entity_response_models,
+    response_adapter,
+    serialise_response,
+)
+from ska_oso_ptt_services.common.utils import convert_to_response_object
+from ska_oso_ptt_services.models.models import ApiResponse, PaginatedApiResponse
+from tests.unit.ska_oso_ptt_services.common.constant import MULTIPLE_SBDS_STATUS
+
+
+def test_entity_response_models_are_built_for_every_entity_type():
+    """Verifying that the response models are parametrised once per entity type"""
+
+    assert set(entity_response_models) == set(entity_descriptors)
+    sbd_models = entity_response_models["sbd"]
+    assert sbd_models.entity is ApiResponse[entity_descriptors["sbd"].status_model]
+    assert (
+        sbd_models.status_history
+        is PaginatedApiResponse[entity_descriptors["sbd"].status_history.model]
+    )
+
+
+def test_response_adapter_is_reused():
+    """Verifying that the TypeAdapter of a response model is only built once"""
+
+    response_model = entity_response_models["sbi"].status
+
+    assert response_adapter(response_model) is response_adapter(response_model)
+
+
+def test_serialise_response_matches_response_model_dump(create_entity_object):
+    """Verifying that serialise_response serialises the response as FastAPI would
+    validate and serialise it against the response model"""
+
+    response_model = entity_response_models["sbd"].status_history
+    api_response = convert_to_response_object(
+        create_entity_object(MULTIPLE_SBDS_STATUS), result_code=HTTPStatus.OK
+    )
+
+    response = serialise_response(
+        response_model, api_response, headers={"ETag": '"etag"'}
+    )
+
+    assert response.media_type == "application/json"
+    assert response.headers["ETag"] == '"etag"'
+    assert json.loads(response.body) == response_model.model_validate(
+        api_response.model_dump()
+    ).model_dump(mode="json", by_alias=True)
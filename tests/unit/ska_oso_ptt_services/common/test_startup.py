@@ -0,0 +1,42 @@
+import asyncio
+from unittest import mock
+
+from prometheus_client import REGISTRY
+
+from ska_oso_ptt_services.common.startup import StartupTimer, process_uptime_seconds
+
+
+def test_startup_timer_records_phases():
+    """Verifying that the phases of the start of a worker are recorded and
+    exposed as metrics"""
+
+    timer = StartupTimer()
+
+    with mock.patch(
+        "ska_oso_ptt_services.common.startup.process_uptime_seconds",
+        return_value=1.5,
+    ):
+        timer.record_imports()
+        with timer.phase("create_app"):
+            pass
+        asyncio.run(timer.startup_started())
+        asyncio.run(timer.startup_completed())
+
+    assert list(timer.phases) == ["import", "create_app", "startup"]
+    assert timer.phases["import"] == 1.5
+    assert (
+        REGISTRY.get_sample_value("ptt_startup_phase_seconds", {"phase": "import"})
+        == 1.5
+    )
+    assert (
+        REGISTRY.get_sample_value("ptt_startup_phase_seconds", {"phase": "create_app"})
+        == timer.phases["create_app"]
+    )
+    assert REGISTRY.get_sample_value("ptt_startup_time_to_ready_seconds") == 1.5
+
+
+def test_process_uptime_seconds_without_proc():
+    """Verifying that the uptime is unknown rather than failing without /proc"""
+
+    with mock.patch("builtins.open", side_effect=FileNotFoundError):
+        assert process_uptime_seconds() is None
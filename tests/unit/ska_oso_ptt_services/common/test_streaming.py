@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+from ska_oso_ptt_services.common import streaming
+from ska_oso_ptt_services.common.pagination import PaginationParameters
+from ska_oso_ptt_services.common.streaming import stream_entities_with_status
+
+
+async def read_body(response):
+    return [chunk async for chunk in response.body_iterator]
+
+
+def mock_uow_factory(entity_count):
+    entities = [
+        mock.Mock(
+            sbd_id=f"sbd-{index}",
+            metadata=SimpleNamespace(
+                version=1, last_modified_on=datetime(2024, 7, 2, tzinfo=timezone.utc)
+            ),
+            model_dump_json=mock.Mock(return_value=f'{{"sbd_id":"sbd-{index}"}}'),
+        )
+        for index in range(entity_count)
+    ]
+    uow_mock = mock.MagicMock()
+    uow_mock.sbds.query.return_value = entities
+    uow_mock.sbds_status_history.get.return_value = mock.Mock(current_status="Draft")
+    uow_factory = mock.MagicMock()
+    uow_factory.return_value.__enter__.return_value = uow_mock
+    return uow_factory, uow_mock
+
+
+def entity_lines(uow_factory):
+    return streaming._entity_lines(  # pylint: disable=protected-access
+        uow_factory,
+        repository="sbds",
+        id_field="sbd_id",
+        entity_type="sbd",
+        query_params=mock.Mock(),
+        pagination=PaginationParameters(),
+    )
+
+
+def test_stream_entities_with_status_streams_one_line_per_entity():
+    uow_factory, _ = mock_uow_factory(2)
+
+    response = stream_entities_with_status(
+        uow_factory,
+        repository="sbds",
+        id_field="sbd_id",
+        entity_type="sbd",
+        query_params=mock.Mock(),
+        pagination=PaginationParameters(),
+    )
+
+    assert asyncio.run(read_body(response)) == [
+        b'{"sbd_id":"sbd-0","status":"Draft"}\n',
+        b'{"sbd_id":"sbd-1","status":"Draft"}\n',
+    ]
+    uow_factory.return_value.__exit__.assert_called_once()
+
+
+@mock.patch.object(streaming, "STREAM_CHUNK_SIZE", 2)
+def test_statuses_are_resolved_in_chunks_while_streaming():
+    """Verifying that the statuses of a chunk are only resolved when the client
+    reads its lines, in the unit of work of the query"""
+
+    uow_factory, uow_mock = mock_uow_factory(3)
+    lines = entity_lines(uow_factory)
+
+    assert next(lines) is None
+    uow_mock.sbds_status_history.get.assert_not_called()
+
+    next(lines)
+    assert uow_mock.sbds_status_history.get.call_count == 2
+
+    assert len(list(lines)) == 2
+    assert uow_mock.sbds_status_history.get.call_count == 3
+    uow_factory.return_value.__exit__.assert_called_once()
+
+
+@mock.patch.object(streaming, "STREAM_CHUNK_SIZE", 1)
+@mock.patch.object(streaming, "STREAM_UOW_SECONDS", -1)
+def test_unit_of_work_is_closed_once_the_stream_holds_it_too_long():
+    """Verifying that past STREAM_UOW_SECONDS the remaining statuses are
+    resolved at once and the unit of work closed before the lines are written"""
+
+    uow_factory, uow_mock = mock_uow_factory(3)
+    lines = entity_lines(uow_factory)
+
+    next(lines)
+    uow_factory.return_value.__exit__.assert_not_called()
+
+    assert next(lines) == b'{"sbd_id":"sbd-0","status":"Draft"}\n'
+    assert uow_mock.sbds_status_history.get.call_count == 3
+    uow_factory.return_value.__exit__.assert_called_once()
+    assert len(list(lines)) == 2
+
+
+def test_unit_of_work_is_closed_when_the_client_disconnects():
+    uow_factory, _ = mock_uow_factory(3)
+    lines = entity_lines(uow_factory)
+
+    next(lines)
+    next(lines)
+    lines.close()
+
+    uow_factory.return_value.__exit__.assert_called_once()
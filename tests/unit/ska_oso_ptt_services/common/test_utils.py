@@ -0,0 +1,216 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from ska_db_oda.persistence.domain.query import MatchType, UserQuery
+
+from ska_oso_ptt_services.common import utils
+from ska_oso_ptt_services.common.cache import status_cache
+from ska_oso_ptt_services.common.error_handling import ODANotFound
+from ska_oso_ptt_services.common.utils import (
+    count_entities_by_status,
+    get_entities_by_id,
+    get_entities_status,
+)
+
+
+def test_get_entities_status_keys_statuses_by_pair():
+    """Verifying that, without a Postgres connection, get_entities_status looks
+    up the status of every distinct (id, version) pair, one lookup each, and keys
+    the result by that pair"""
+
+    uow_mock = mock.MagicMock()
+    uow_mock.sbds_status_history.get.side_effect = (
+        lambda entity_id, version, **_: mock.Mock(
+            current_status=f"{entity_id}-{version}"
+        )
+    )
+
+    with mock.patch.object(utils, "oda_connection", return_value=None):
+        entity_statuses = get_entities_status(
+            uow_mock,
+            entity_type="sbd",
+            entity_refs=[("sbd-1", 1), ("sbd-2", 1), ("sbd-1", 1), ("sbd-1", 2)],
+        )
+
+    assert uow_mock.sbds_status_history.get.call_count == 3
+    assert {
+        entity_ref: entity_status.current_status
+        for entity_ref, entity_status in entity_statuses.items()
+    } == {
+        ("sbd-1", 1): "sbd-1-1",
+        ("sbd-2", 1): "sbd-2-1",
+        ("sbd-1", 2): "sbd-1-2",
+    }
+
+
+def status_history_cursor(rows):
+    columns = (
+        "sbd_ref",
+        "sbd_version",
+        "current_status",
+        "previous_status",
+        "created_by",
+        "created_on",
+        "last_modified_by",
+        "last_modified_on",
+    )
+    cursor = mock.MagicMock()
+    cursor.description = [SimpleNamespace(name=column) for column in columns]
+    cursor.fetchall.return_value = rows
+    return cursor
+
+
+def status_history_row(sbd_ref, sbd_version):
+    modified_on = datetime(2024, 7, 2, 18, 1, 47, tzinfo=timezone.utc)
+    return (
+        sbd_ref,
+        sbd_version,
+        "Draft",
+        "Draft",
+        "DefaultUser",
+        modified_on,
+        "DefaultUser",
+        modified_on,
+    )
+
+
+def test_get_entities_status_queries_postgres_once():
+    """Verifying that on a Postgres ODA the statuses of every pair are read in a
+    single query and cached"""
+
+    connection = mock.MagicMock()
+    connection.execute.return_value = status_history_cursor(
+        [status_history_row("sbd-1", 1), status_history_row("sbd-2", 1)]
+    )
+
+    with mock.patch.object(utils, "oda_connection", return_value=connection):
+        entity_statuses = get_entities_status(
+            mock.MagicMock(),
+            entity_type="sbd",
+            entity_refs=[("sbd-1", 1), ("sbd-2", 1), ("sbd-1", 1)],
+        )
+
+    connection.execute.assert_called_once()
+    _, params = connection.execute.call_args.args
+    assert params == (["sbd-1", "sbd-2"], [1, 1])
+    assert entity_statuses[("sbd-2", 1)].sbd_ref == "sbd-2"
+    assert entity_statuses[("sbd-2", 1)].sbd_version == 1
+    assert status_cache.get(("sbd", "sbd-1", "1")) is entity_statuses[("sbd-1", 1)]
+
+
+def test_get_entities_status_raises_for_pairs_without_status():
+    """Verifying that an entity version without any status is reported as not
+    found, as for a single entity"""
+
+    connection = mock.MagicMock()
+    connection.execute.return_value = status_history_cursor(
+        [status_history_row("sbd-1", 1)]
+    )
+
+    with mock.patch.object(utils, "oda_connection", return_value=connection):
+        with pytest.raises(ODANotFound):
+            get_entities_status(
+                mock.MagicMock(),
+                entity_type="sbd",
+                entity_refs=[("sbd-1", 1), ("sbd-2", 1)],
+            )
+
+
+def test_get_entities_by_id_reports_missing_ids():
+    """Verifying that, without a Postgres connection, get_entities_by_id looks
+    up every distinct id once and reports the ids that cannot be found instead
+    of failing"""
+
+    def get_entity(entity_id):
+        if entity_id == "sbi-2":
+            raise ODANotFound(identifier=entity_id)
+        return f"entity-{entity_id}"
+
+    uow_mock = mock.MagicMock()
+    uow_mock.sbis.get.side_effect = get_entity
+
+    with mock.patch.object(utils, "oda_connection", return_value=None):
+        entities, missing_ids = get_entities_by_id(
+            uow_mock, entity_type="sbi", entity_ids=["sbi-1", "sbi-2", "sbi-1", "sbi-3"]
+        )
+
+    assert entities == ["entity-sbi-1", "entity-sbi-3"]
+    assert missing_ids == ["sbi-2"]
+    assert uow_mock.sbis.get.call_count == 3
+
+
+def test_get_entities_by_id_queries_postgres_once():
+    """Verifying that on a Postgres ODA the entities are read in a single query,
+    returned in request order with the ids not found"""
+
+    connection = mock.MagicMock()
+    cursor = connection.execute.return_value
+    cursor.description = [
+        SimpleNamespace(name=column)
+        for column in (
+            "sbi_id",
+            "info",
+            "version",
+            "created_by",
+            "created_on",
+            "last_modified_by",
+            "last_modified_on",
+        )
+    ]
+    modified_on = datetime(2024, 7, 2, 18, 1, 47, tzinfo=timezone.utc)
+    cursor.fetchall.return_value = [
+        (sbi_id, {"sbi_id": sbi_id}, 2, "user", modified_on, "user", modified_on)
+        for sbi_id in ("sbi-1", "sbi-3")
+    ]
+    model_mock = mock.MagicMock()
+    model_mock.model_validate.side_effect = lambda entity: entity
+
+    with mock.patch.object(utils, "oda_connection", return_value=connection):
+        with mock.patch.dict(
+            utils.entity_descriptors,
+            sbi=utils.entity_descriptors["sbi"]._replace(model=model_mock),
+        ):
+            entities, missing_ids = get_entities_by_id(
+                mock.MagicMock(),
+                entity_type="sbi",
+                entity_ids=["sbi-3", "sbi-2", "sbi-1", "sbi-3"],
+            )
+
+    connection.execute.assert_called_once()
+    assert connection.execute.call_args.args[1] == (["sbi-3", "sbi-2", "sbi-1"],)
+    assert [entity["sbi_id"] for entity in entities] == ["sbi-3", "sbi-1"]
+    assert entities[0]["metadata"]["version"] == 2
+    assert missing_ids == ["sbi-2"]
+
+
+def test_count_entities_by_status_groups_in_postgres():
+    """Verifying that on a Postgres ODA the entities in each status are counted
+    by a single grouped query filtered like the ODA query"""
+
+    connection = mock.MagicMock()
+    cursor = connection.execute.return_value
+    cursor.description = [
+        SimpleNamespace(name="current_status"),
+        SimpleNamespace(name="count"),
+    ]
+    cursor.fetchall.return_value = [("Draft", 2), ("Submitted", 1)]
+    uow_mock = mock.MagicMock()
+
+    with mock.patch.object(utils, "oda_connection", return_value=connection):
+        counts = count_entities_by_status(
+            uow_mock,
+            entity_type="sbd",
+            query_params=UserQuery(user="Default_", match_type=MatchType.STARTS_WITH),
+        )
+
+    connection.execute.assert_called_once()
+    query, params = connection.execute.call_args.args
+    assert "GROUP BY status.current_status" in query
+    assert "WHERE created_by LIKE %s" in query
+    assert params == ("Default\\_%",)
+    uow_mock.sbds.query.assert_not_called()
+    assert counts["Draft"] == 2
+    assert counts["Submitted"] == 1
+    assert sum(counts.values()) == 3
@@ -20,10 +20,10 @@ class TestExecutionBlockAPI:
     Execution Block.
     """
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
-    @mock.patch("ska_oso_ptt_services.routers.ebs.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.get_entities_status")
     def test_get_multiple_eb_with_status(
-        self, mock_get_eb_status, mock_oda, client_get, create_entity_object
+        self, mock_get_ebs_status, mock_oda, client_get, create_entity_object
     ):
         """Verifying that get_multiple_eb_with_status API returns All EBs with status"""
 
@@ -36,7 +36,10 @@ class TestExecutionBlockAPI:
 
         uow_mock = mock.MagicMock()
         uow_mock.ebs = ebs_mock
-        mock_get_eb_status().current_status = "Fully Observed"
+        mock_get_ebs_status.return_value = {
+            (eb.eb_id, eb.metadata.version): mock.Mock(current_status="Fully Observed")
+            for eb in execution_block
+        }
         mock_oda.uow().__enter__.return_value = uow_mock
 
         query_params = {
@@ -52,8 +55,8 @@ class TestExecutionBlockAPI:
         assert_json_is_equal(result["result_data"], valid_ebs)
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
-    @mock.patch("ska_oso_ptt_services.routers.ebs.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
     def test_get_single_eb_with_status(
         self, mock_get_eb_status, mock_oda, client_get, create_entity_object
     ):
@@ -62,11 +65,8 @@ class TestExecutionBlockAPI:
 
         valid_eb_with_status = create_entity_object(MULTIPLE_EBS)[0]
 
-        eb_mock = mock.MagicMock()
-        eb_mock.model_dump.return_value = valid_eb_with_status
-
         uow_mock = mock.MagicMock()
-        uow_mock.ebs.get.return_value = eb_mock
+        uow_mock.ebs.get.return_value = OSOExecutionBlock(**valid_eb_with_status)
 
         mock_get_eb_status().current_status = "Fully Observed"
         mock_oda.uow.return_value.__enter__.return_value = uow_mock
@@ -81,7 +81,7 @@ class TestExecutionBlockAPI:
 
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_eb_with_status(self, mock_oda, client_get):
         """Verifying that get_single_eb_with_status API returns
         requested EB with status"""
@@ -95,7 +95,7 @@ class TestExecutionBlockAPI:
         assert "eb-mvp01-20240426-5007" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_eb_with_invalid_status(self, mock_oda, client_get):
         """Verifying that get_single_eb_with_invalid_status throws error
         if invalid data passed"""
@@ -111,7 +111,7 @@ class TestExecutionBlockAPI:
         assert invalid_eb_id in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_eb_status_history(
         self, mock_oda, client_get, create_entity_object
     ):
@@ -139,7 +139,7 @@ class TestExecutionBlockAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_eb_status_history(self, mock_oda, client_get):
         """Verifying that get_single_invalid_eb_status_history throws error
         if invalid data passed
@@ -157,8 +157,8 @@ class TestExecutionBlockAPI:
         assert "eb-t0001-00100" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_eb_status(
         self, mock_oda, mock_get_eb_status, client_get, create_entity_object
     ):
@@ -185,8 +185,33 @@ class TestExecutionBlockAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    def test_get_single_eb_status_not_modified(
+        self, mock_oda, mock_get_eb_status, client_get, create_entity_object
+    ):
+        """Verifying that get_single_eb_status API answers a request carrying
+        the current ETag with 304 Not Modified"""
+
+        valid_eb_status = create_entity_object(MULTIPLE_EBS_STATUS)[0]
+
+        mock_oda.uow().__enter__.return_value = mock.MagicMock()
+        mock_get_eb_status.return_value = valid_eb_status
+
+        response = client_get(f"{API_PREFIX}/ebs/eb-mvp01-20240426-5004/status")
+
+        assert response.status_code == HTTPStatus.OK
+        etag = response.headers["etag"]
+
+        not_modified = client_get(
+            f"{API_PREFIX}/ebs/eb-mvp01-20240426-5004/status",
+            headers={"accept": "application/json", "if-none-match": etag},
+        )
+
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_eb_status(
         self, mock_oda, mock_get_eb_status, client_get
     ):
@@ -206,7 +231,7 @@ class TestExecutionBlockAPI:
         assert invalid_eb_id in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.ebs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_put_eb_history(self, mock_oda, client_put, create_entity_object):
         """Verifying that put_eb_history updates the eb status correctly"""
 
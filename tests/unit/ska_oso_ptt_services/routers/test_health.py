@@ -0,0 +1,63 @@
+from http import HTTPStatus
+from types import SimpleNamespace
+from unittest import mock
+
+from ska_oso_ptt_services.app import API_PREFIX
+
+
+class FakePool:
+    closed = False
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    def get_stats(self):
+        return self.stats
+
+
+class TestHealthAPI:
+    @mock.patch("ska_oso_ptt_services.routers.health.oda")
+    def test_ready(self, mock_oda, client_get):
+        mock_oda._connection_pool = FakePool(
+            {"pool_max": 4, "pool_size": 4, "pool_available": 3}
+        )
+
+        response = client_get(f"{API_PREFIX}/health/ready")
+
+        assert response.status_code == HTTPStatus.OK
+        result = response.json()["result_data"][0]
+        assert result["ready"] is True
+        assert result["oda_pools"][0]["utilisation"] == 0.25
+
+    @mock.patch("ska_oso_ptt_services.common.oda_pool.ODA_BACKEND_TYPE", "filesystem")
+    @mock.patch("ska_oso_ptt_services.routers.health.oda", SimpleNamespace())
+    def test_ready_without_pools(self, client_get):
+        response = client_get(f"{API_PREFIX}/health/ready")
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["result_data"][0] == {"ready": True, "oda_pools": []}
+
+    @mock.patch("ska_oso_ptt_services.common.oda_pool.ODA_BACKEND_TYPE", "postgres")
+    @mock.patch("ska_oso_ptt_services.routers.health.oda", SimpleNamespace())
+    def test_not_ready_when_postgres_oda_has_no_pool(self, client_get):
+        response = client_get(f"{API_PREFIX}/health/ready")
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.json()["result_data"][0] == {"ready": False, "oda_pools": []}
+
+    @mock.patch("ska_oso_ptt_services.routers.health.oda")
+    def test_not_ready_when_pool_exhausted(self, mock_oda, client_get):
+        mock_oda._connection_pool = FakePool(
+            {
+                "pool_max": 4,
+                "pool_size": 4,
+                "pool_available": 0,
+                "requests_waiting": 2,
+            }
+        )
+
+        response = client_get(f"{API_PREFIX}/health/ready")
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert response.json()["result_status"] == "failed"
+        assert response.json()["result_data"][0]["ready"] is False
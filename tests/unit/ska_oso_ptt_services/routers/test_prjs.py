@@ -21,10 +21,10 @@ class TestProjectAPI:
     Project.
     """
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
-    @mock.patch("ska_oso_ptt_services.routers.prjs.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.get_entities_status")
     def test_get_multiple_prj_with_status(
-        self, mock_get_prj_status, mock_oda, client_get, create_entity_object
+        self, mock_get_prjs_status, mock_oda, client_get, create_entity_object
     ):
         """Verifying that get_multiple_prj_with_status API returns
         All prjs with status"""
@@ -38,7 +38,10 @@ class TestProjectAPI:
 
         uow_mock = mock.MagicMock()
         uow_mock.prjs = prjs_mock
-        mock_get_prj_status().current_status = "Draft"
+        mock_get_prjs_status.return_value = {
+            (prj.prj_id, prj.metadata.version): mock.Mock(current_status="Draft")
+            for prj in project
+        }
         mock_oda.uow().__enter__.return_value = uow_mock
 
         query_params = {
@@ -54,8 +57,8 @@ class TestProjectAPI:
         assert_json_is_equal(result["result_data"], valid_prjs)
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
-    @mock.patch("ska_oso_ptt_services.routers.prjs.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
     def test_get_single_prj_with_status(
         self, mock_get_prj_status, mock_oda, client_get, create_entity_object
     ):
@@ -64,11 +67,8 @@ class TestProjectAPI:
 
         valid_prj_with_status = create_entity_object(MULTIPLE_PRJS)[0]
 
-        prj_mock = mock.MagicMock()
-        prj_mock.model_dump.return_value = valid_prj_with_status
-
         uow_mock = mock.MagicMock()
-        uow_mock.prjs.get.return_value = prj_mock
+        uow_mock.prjs.get.return_value = Project(**valid_prj_with_status)
         mock_get_prj_status().current_status = "Draft"
         mock_oda.uow().__enter__.return_value = uow_mock
 
@@ -83,7 +83,7 @@ class TestProjectAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_prj_with_status(self, mock_oda, client_get):
         """Verifying that get_single_prj_with_status API returns
         requested prj with status"""
@@ -99,7 +99,7 @@ class TestProjectAPI:
         assert "prj-mvp01-20240426-5007" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_prj_with_invalid_status(self, mock_oda, client_get):
         """Verifying that get_single_prj_with_invalid_status throws error
         if invalid data passed"""
@@ -115,7 +115,7 @@ class TestProjectAPI:
         assert invalid_prj_id in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_prj_status_history(
         self, mock_oda, client_get, create_entity_object
     ):
@@ -143,7 +143,7 @@ class TestProjectAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_prj_status_history(self, mock_oda, client_get):
         """Verifying that test_get_single_invalid_prj_status_history throws error
         if invalid data passed"""
@@ -160,8 +160,8 @@ class TestProjectAPI:
         assert "prj-t0001-00100" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_prj_status(
         self, mock_oda, mock_get_prj_status, client_get, create_entity_object
     ):
@@ -188,8 +188,8 @@ class TestProjectAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_prj_status(
         self, mock_oda, mock_get_prj_status, client_get
     ):
@@ -209,7 +209,7 @@ class TestProjectAPI:
         assert "prj-t0001-20240702-00100" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_put_prj_history(self, mock_oda, client_put, create_entity_object):
         """Verifying that put_prj_history updates the prj status correctly"""
 
@@ -251,7 +251,7 @@ class TestProjectAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.prjs.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_put_prj_history_with_two_version(
         self, mock_oda, client_put, create_entity_object
     ):
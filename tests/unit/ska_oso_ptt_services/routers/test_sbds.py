@@ -21,10 +21,10 @@ class TestSBDefinitionAPI:
     Scheduling Block Definitions.
     """
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
-    @mock.patch("ska_oso_ptt_services.routers.sbds.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.get_entities_status")
     def test_get_multiple_sbd_with_status(
-        self, mock_get_sbd_status, mock_oda, client_get, create_entity_object
+        self, mock_get_sbds_status, mock_oda, client_get, create_entity_object
     ):
         """Verifying that get_multiple_sbd_with_status API returns
         All SBDS with status"""
@@ -38,7 +38,10 @@ class TestSBDefinitionAPI:
 
         uow_mock = mock.MagicMock()
         uow_mock.sbds = sbds_mock
-        mock_get_sbd_status().current_status = "Draft"
+        mock_get_sbds_status.return_value = {
+            (sbd.sbd_id, sbd.metadata.version): mock.Mock(current_status="Draft")
+            for sbd in sbd_definitions
+        }
         mock_oda.uow().__enter__.return_value = uow_mock
 
         query_params = {
@@ -59,8 +62,122 @@ class TestSBDefinitionAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
-    @mock.patch("ska_oso_ptt_services.routers.sbds.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.get_entities_status")
+    def test_get_multiple_sbd_with_status_fields(
+        self, mock_get_sbds_status, mock_oda, client_get, create_entity_object
+    ):
+        """Verifying that get_multiple_sbd_with_status API only returns the
+        requested fields and the status"""
+
+        sbd_definitions = [
+            SBDefinition(**sbd) for sbd in create_entity_object(MULTIPLE_SBDS)
+        ]
+
+        uow_mock = mock.MagicMock()
+        uow_mock.sbds.query.return_value = sbd_definitions
+        mock_get_sbds_status.return_value = {
+            (sbd.sbd_id, sbd.metadata.version): mock.Mock(current_status="Draft")
+            for sbd in sbd_definitions
+        }
+        mock_oda.uow().__enter__.return_value = uow_mock
+
+        result = client_get(
+            f"{API_PREFIX}/sbds",
+            params={
+                "query_type": "created_between",
+                "created_after": "2022-03-28T15:43:53.971548+00:00",
+                "fields": "sbd_id,metadata.version",
+            },
+        ).json()
+
+        assert result["result_data"] == [
+            {
+                "sbd_id": sbd.sbd_id,
+                "metadata": {"version": sbd.metadata.version},
+                "status": "Draft",
+            }
+            for sbd in sbd_definitions
+        ]
+        assert result["result_code"] == HTTPStatus.OK
+
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    def test_get_multiple_sbd_with_status_unknown_field(self, mock_oda, client_get):
+        """Verifying that get_multiple_sbd_with_status API rejects unknown
+        fields as a client error"""
+
+        response = client_get(
+            f"{API_PREFIX}/sbds",
+            params={
+                "query_type": "created_between",
+                "created_after": "2022-03-28T15:43:53.971548+00:00",
+                "fields": "sbd_id,unknown",
+            },
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert "unknown" in response.json()["detail"]
+        mock_oda.uow.assert_not_called()
+
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    def test_get_multiple_sbd_with_status_invalid_cursor(self, mock_oda, client_get):
+        """Verifying that get_multiple_sbd_with_status API rejects an invalid
+        cursor as a client error"""
+
+        response = client_get(
+            f"{API_PREFIX}/sbds",
+            params={
+                "query_type": "created_between",
+                "created_after": "2022-03-28T15:43:53.971548+00:00",
+                "cursor": "not-a-cursor",
+            },
+        )
+
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        assert "not-a-cursor" in response.json()["detail"]
+        mock_oda.uow.assert_not_called()
+
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.common.streaming.get_entities_status")
+    def test_get_multiple_sbd_with_status_ndjson(
+        self, mock_get_sbds_status, mock_oda, client_get, create_entity_object
+    ):
+        """Verifying that get_multiple_sbd_with_status API streams one
+        SBD with status per line when NDJSON is requested"""
+
+        valid_sbds = create_entity_object(MULTIPLE_SBDS)
+
+        sbd_definitions = [SBDefinition(**sbd) for sbd in valid_sbds]
+
+        uow_mock = mock.MagicMock()
+        uow_mock.sbds.query.return_value = sbd_definitions
+        mock_get_sbds_status.return_value = {
+            (sbd.sbd_id, sbd.metadata.version): mock.Mock(current_status="Draft")
+            for sbd in sbd_definitions
+        }
+        mock_oda.uow().__enter__.return_value = uow_mock
+
+        response = client_get(
+            f"{API_PREFIX}/sbds",
+            params={
+                "query_type": "created_between",
+                "created_after": "2022-03-28T15:43:53.971548+00:00",
+            },
+            headers={"accept": "application/x-ndjson"},
+        )
+
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        streamed_sbds = [json.loads(line) for line in response.text.splitlines()]
+
+        assert [sbd["sbd_id"] for sbd in streamed_sbds] == [
+            sbd.sbd_id for sbd in sbd_definitions
+        ]
+        assert all(sbd["status"] == "Draft" for sbd in streamed_sbds)
+
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
     def test_get_single_sbd_with_status(
         self, mock_get_sbd_status, mock_oda, client_get, create_entity_object
     ):
@@ -69,11 +186,8 @@ class TestSBDefinitionAPI:
 
         valid_sbd = create_entity_object(MULTIPLE_SBDS)[0]
 
-        sbd_mock = mock.MagicMock()
-        sbd_mock.model_dump.return_value = valid_sbd
-
         uow_mock = mock.MagicMock()
-        uow_mock.sbds.get.return_value = sbd_mock
+        uow_mock.sbds.get.return_value = SBDefinition(**valid_sbd)
         mock_get_sbd_status().current_status = "Draft"
         mock_oda.uow().__enter__.return_value = uow_mock
 
@@ -90,7 +204,7 @@ class TestSBDefinitionAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_sbd_with_status(self, mock_oda, client_get):
         """Verifying that get_single_sbd_with_status API returns
         requested sbd with status"""
@@ -106,7 +220,7 @@ class TestSBDefinitionAPI:
         assert "sbds-mvp01-20240426-5007" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_sbd_with_invalid_status(self, mock_oda, client_get):
         """Verifying that get_single_sbd_with_invalid_status throws error
         if invalid data passed"""
@@ -122,7 +236,7 @@ class TestSBDefinitionAPI:
         assert "invalid-sbd-id-12345" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_sbd_status_history(
         self, mock_oda, client_get, create_entity_object
     ):
@@ -149,7 +263,7 @@ class TestSBDefinitionAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_sbd_status_history(self, mock_oda, client_get):
         """Verifying that get_single_invalid_sbd_status_history throws error
         if invalid data passed"""
@@ -166,8 +280,8 @@ class TestSBDefinitionAPI:
         assert "sbd-t0001-20240702-00100" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_sbd_status(
         self, mock_oda, mock_get_sbd_status, client_get, create_entity_object
     ):
@@ -193,8 +307,8 @@ class TestSBDefinitionAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_sbd_status(
         self, mock_oda, mock_get_sbd_status, client_get
     ):
@@ -214,7 +328,7 @@ class TestSBDefinitionAPI:
         assert "sbd-t0001-20240702-00100" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_put_sbd_history(self, mock_oda, client_put, create_entity_object):
         """Verifying that put_sbd_history updates the sbd status correctly"""
 
@@ -256,7 +370,7 @@ class TestSBDefinitionAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbds.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_put_sbd_history_version(self, mock_oda, client_put, create_entity_object):
         """Verifying that put_sbd_history updates the sbd status correctly"""
 
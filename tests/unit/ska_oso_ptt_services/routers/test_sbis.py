@@ -21,10 +21,10 @@ class TestSBInstanceAPI:
     Scheduling Block Instances.
     """
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
-    @mock.patch("ska_oso_ptt_services.routers.sbis.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.get_entities_status")
     def test_get_multiple_sbi_with_status(
-        self, mock_get_sbi_status, mock_oda, client_get, create_entity_object
+        self, mock_get_sbis_status, mock_oda, client_get, create_entity_object
     ):
         """Verifying that get_multiple_sbi_with_status API returns
         All SBIs with status"""
@@ -38,7 +38,10 @@ class TestSBInstanceAPI:
 
         uow_mock = mock.MagicMock()
         uow_mock.sbis = sbis_mock
-        mock_get_sbi_status().current_status = "Created"
+        mock_get_sbis_status.return_value = {
+            (sbi.sbi_id, sbi.metadata.version): mock.Mock(current_status="Created")
+            for sbi in sbi_instance
+        }
         mock_oda.uow().__enter__.return_value = uow_mock
 
         query_params = {
@@ -54,8 +57,47 @@ class TestSBInstanceAPI:
         assert_json_is_equal(result["result_data"], valid_sbis)
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
-    @mock.patch("ska_oso_ptt_services.routers.sbis.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.get_entities_status")
+    def test_get_sbis_batch_with_status(
+        self, mock_get_sbis_status, mock_oda, client_post, create_entity_object
+    ):
+        """Verifying that get_sbis_batch_with_status API returns the requested
+        SBIs with status and lists the identifiers that could not be found"""
+
+        valid_sbis = create_entity_object(MULTIPLE_SBIS)
+        sbi_instances = {
+            sbi.sbi_id: sbi for sbi in (SBInstance(**x) for x in valid_sbis)
+        }
+
+        def get_sbi(sbi_id):
+            if sbi_id not in sbi_instances:
+                raise ODANotFound(identifier=sbi_id)
+            return sbi_instances[sbi_id]
+
+        uow_mock = mock.MagicMock()
+        uow_mock.sbis.get.side_effect = get_sbi
+        mock_get_sbis_status.return_value = {
+            (sbi.sbi_id, sbi.metadata.version): mock.Mock(current_status="Created")
+            for sbi in sbi_instances.values()
+        }
+        mock_oda.uow().__enter__.return_value = uow_mock
+
+        requested_ids = [valid_sbis[0]["sbi_id"], "sbi-t0001-20240702-99999"]
+        result = client_post(
+            f"{API_PREFIX}/sbis/batch_get",
+            json={"ids": requested_ids + [valid_sbis[0]["sbi_id"]]},
+        ).json()
+
+        del result["result_data"][0]["metadata"]["pdm_version"]
+
+        assert_json_is_equal(result["result_data"], valid_sbis[:1])
+        assert result["missing_ids"] == ["sbi-t0001-20240702-99999"]
+        assert result["result_code"] == HTTPStatus.OK
+        assert uow_mock.sbis.get.call_count == 2
+
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
     def test_get_single_sbi_with_status(
         self, mock_get_sbi_status, mock_oda, client_get, create_entity_object
     ):
@@ -64,11 +106,8 @@ class TestSBInstanceAPI:
 
         valid_sbi = create_entity_object(MULTIPLE_SBIS)[0]
 
-        sbi_mock = mock.MagicMock()
-        sbi_mock.model_dump.return_value = valid_sbi
-
         uow_mock = mock.MagicMock()
-        uow_mock.sbis.get.return_value = sbi_mock
+        uow_mock.sbis.get.return_value = SBInstance(**valid_sbi)
         mock_get_sbi_status().current_status = "Created"
         mock_oda.uow().__enter__.return_value = uow_mock
 
@@ -83,7 +122,54 @@ class TestSBInstanceAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    def test_get_single_sbi_with_status_not_modified(
+        self, mock_get_sbi_status, mock_oda, client_get, create_entity_object
+    ):
+        """Verifying that get_single_sbi_with_status API answers a request
+        carrying the current ETag with 304 Not Modified"""
+
+        valid_sbi = create_entity_object(MULTIPLE_SBIS)[0]
+        valid_sbi_status = create_entity_object(MULTIPLE_SBIS_STATUS)[0]
+
+        uow_mock = mock.MagicMock()
+        uow_mock.sbis.get.return_value = SBInstance(**valid_sbi)
+        mock_get_sbi_status.return_value = SBIStatusHistory(**valid_sbi_status)
+        mock_oda.uow().__enter__.return_value = uow_mock
+
+        response = client_get(f"{API_PREFIX}/sbis/sbi-mvp01-20240426-5016")
+
+        assert response.status_code == HTTPStatus.OK
+        etag = response.headers["etag"]
+
+        not_modified = client_get(
+            f"{API_PREFIX}/sbis/sbi-mvp01-20240426-5016",
+            headers={"accept": "application/json", "if-none-match": etag},
+        )
+
+        assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+        assert not_modified.content == b""
+
+        mock_get_sbi_status.return_value = SBIStatusHistory(
+            **{
+                **valid_sbi_status,
+                "metadata": {
+                    **valid_sbi_status["metadata"],
+                    "last_modified_on": "2024-04-15T11:51:16.367278+05:30",
+                },
+            }
+        )
+
+        modified = client_get(
+            f"{API_PREFIX}/sbis/sbi-mvp01-20240426-5016",
+            headers={"accept": "application/json", "if-none-match": etag},
+        )
+
+        assert modified.status_code == HTTPStatus.OK
+        assert modified.headers["etag"] != etag
+
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_sbi_with_status(self, mock_oda, client_get):
         """Verifying that get_single_sbi_with_status API returns
         requested sbi with status"""
@@ -99,7 +185,7 @@ class TestSBInstanceAPI:
         assert "sbi-mvp01-20240426-5007" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_sbi_with_invalid_status(self, mock_oda, client_get):
         """Verifying that get_single_sbi_with_invalid_status throws error
         if invalid data passed"""
@@ -115,7 +201,7 @@ class TestSBInstanceAPI:
         assert invalid_sbi_id in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_sbi_status_history(
         self, mock_oda, client_get, create_entity_object
     ):
@@ -142,7 +228,7 @@ class TestSBInstanceAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_sbi_status_history(self, mock_oda, client_get):
         """Verifying that get_single_invalid_sbi_status_history throws error
         if invalid data passed
@@ -160,8 +246,8 @@ class TestSBInstanceAPI:
         assert "sbi-t000-00100" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_sbi_status(
         self, mock_oda, mock_get_sbi_status, client_get, create_entity_object
     ):
@@ -187,8 +273,8 @@ class TestSBInstanceAPI:
         )
         assert result["result_code"] == HTTPStatus.OK
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.common_get_entity_status")
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.common_get_entity_status")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_get_single_invalid_sbi_status(
         self, mock_oda, mock_get_sbi_status, client_get
     ):
@@ -208,7 +294,7 @@ class TestSBInstanceAPI:
         assert "sbi-t0001-20240702-00100" in result["result_data"]
         assert result["result_code"] == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_ptt_services.routers.sbis.oda")
+    @mock.patch("ska_oso_ptt_services.routers.entities.oda")
     def test_put_sbi_history(self, mock_oda, client_put, create_entity_object):
         """Verifying that put_sbi_history updates the sbi status correctly"""
 
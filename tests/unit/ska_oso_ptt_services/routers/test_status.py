@@ -1,8 +1,11 @@
 from http import HTTPStatus
+from unittest import mock
 
 import pytest
+from ska_oso_pdm import SBInstance
 
 from ska_oso_ptt_services.app import API_PREFIX
+from tests.unit.ska_oso_ptt_services.common.constant import MULTIPLE_SBIS
 from tests.unit.ska_oso_ptt_services.utils import assert_json_is_equal
 
 
@@ -83,6 +86,26 @@ def test_entity_status_api(entity_name: str, expected_response, client_get):
     assert result_response["result_code"] == HTTPStatus.OK
 
 
+def test_entity_status_api_conditional_get(client_get):
+    """Verifying that status/get_entity API is cacheable and answers a matching
+    If-None-Match with 304 Not Modified"""
+
+    response = client_get(f"{API_PREFIX}/status/get_entity?entity_name=sbd")
+
+    assert response.status_code == HTTPStatus.OK
+    assert "max-age" in response.headers["cache-control"]
+    etag = response.headers["etag"]
+
+    not_modified = client_get(
+        f"{API_PREFIX}/status/get_entity?entity_name=sbd",
+        headers={"accept": "application/json", "if-none-match": etag},
+    )
+
+    assert not_modified.status_code == HTTPStatus.NOT_MODIFIED
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+
 def test_get_invalid_entity_status(client_get):
     """Verifying that get_entity_status API returns error for invalid entity"""
 
@@ -92,3 +115,146 @@ def test_get_invalid_entity_status(client_get):
 
     assert "requested entity" in result_invalid_entity["result_data"]
     assert result_invalid_entity["result_code"] == HTTPStatus.NOT_FOUND
+
+
+def test_get_status_cache_stats(client_get):
+    """Verifying that the status cache counters are exposed"""
+
+    result = client_get(f"{API_PREFIX}/status/cache").json()
+
+    assert result["result_data"][0]["hits"] == 0
+    assert result["result_data"][0]["misses"] == 0
+    assert result["result_code"] == HTTPStatus.OK
+
+
+@mock.patch("ska_oso_ptt_services.routers.status.oda")
+def test_get_status_summary(mock_oda, client_get, create_entity_object):
+    """Verifying that status/summary counts the entities in each status"""
+
+    sbis = [SBInstance(**sbi) for sbi in create_entity_object(MULTIPLE_SBIS)]
+
+    uow_mock = mock.MagicMock()
+    uow_mock.sbis.query.return_value = sbis
+    uow_mock.sbis_status_history.get.side_effect = lambda entity_id, **_: mock.Mock(
+        current_status="Executing" if entity_id == sbis[0].sbi_id else "Created"
+    )
+    mock_oda.uow().__enter__.return_value = uow_mock
+
+    result = client_get(
+        f"{API_PREFIX}/status/summary",
+        params={
+            "entity_name": "sbi",
+            "query_type": "created_between",
+            "created_after": "2022-03-28T15:43:53.971548+00:00",
+        },
+    ).json()
+
+    assert result["result_code"] == HTTPStatus.OK
+    assert result["result_data"][0]["entity_type"] == "sbi"
+    assert result["result_data"][0]["total"] == len(sbis)
+    assert result["result_data"][0]["counts"]["Executing"] == 1
+    assert result["result_data"][0]["counts"]["Created"] == len(sbis) - 1
+    assert result["result_data"][0]["counts"]["Failed"] == 0
+
+
+def test_get_status_summary_invalid_entity(client_get):
+    """Verifying that status/summary returns error for invalid entity"""
+
+    result = client_get(f"{API_PREFIX}/status/summary?entity_name=ebi").json()
+
+    assert "requested entity" in result["result_data"]
+    assert result["result_code"] == HTTPStatus.NOT_FOUND
+
+
+BULK_STATUS_UPDATE = [
+    {
+        "current_status": "Executing",
+        "previous_status": "Created",
+        "sbi_ref": "sbi-mvp01-20220923-00002",
+    },
+    {
+        "current_status": "Complete",
+        "previous_status": "Draft",
+        "sbd_ref": "sbd-t0001-20240702-00002",
+    },
+]
+
+
+@mock.patch("ska_oso_ptt_services.routers.status.oda")
+def test_put_bulk_status_history(mock_oda, client_put):
+    """Verifying that put_bulk_status_history adds every status in one commit"""
+
+    uow_mock = mock.MagicMock()
+    uow_mock.sbis_status_history.add.side_effect = lambda status: status
+    uow_mock.sbds_status_history.add.side_effect = lambda status: status
+    mock_oda.uow().__enter__.return_value = uow_mock
+
+    result = client_put(f"{API_PREFIX}/status/bulk", json=BULK_STATUS_UPDATE).json()
+
+    assert result["result_code"] == HTTPStatus.OK
+    assert [
+        (item["entity_type"], item["entity_id"], item["result_code"])
+        for item in result["result_data"]
+    ] == [
+        ("sbi", "sbi-mvp01-20220923-00002", HTTPStatus.OK),
+        ("sbd", "sbd-t0001-20240702-00002", HTTPStatus.OK),
+    ]
+    assert result["result_data"][1]["result_data"]["current_status"] == "Complete"
+    uow_mock.commit.assert_called_once()
+
+
+@mock.patch("ska_oso_ptt_services.routers.status.oda")
+def test_put_bulk_status_history_rejected(mock_oda, client_put):
+    """Verifying that put_bulk_status_history commits nothing when a status is
+    rejected and reports the following statuses as not attempted"""
+
+    uow_mock = mock.MagicMock()
+    uow_mock.sbis_status_history.add.side_effect = ValueError("Invalid transition")
+    mock_oda.uow().__enter__.return_value = uow_mock
+
+    result = client_put(f"{API_PREFIX}/status/bulk", json=BULK_STATUS_UPDATE).json()
+
+    assert result["result_code"] == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert [item["result_code"] for item in result["result_data"]] == [
+        HTTPStatus.UNPROCESSABLE_ENTITY,
+        HTTPStatus.FAILED_DEPENDENCY,
+    ]
+    assert result["result_data"][0]["result_data"] == "Invalid transition"
+    uow_mock.sbds_status_history.add.assert_not_called()
+    uow_mock.commit.assert_not_called()
+
+
+@mock.patch("ska_oso_ptt_services.routers.status.oda")
+def test_put_bulk_status_history_rejected_rolls_back(mock_oda, client_put):
+    """Verifying that put_bulk_status_history reports the statuses added before
+    the rejected one as rolled back rather than persisted"""
+
+    uow_mock = mock.MagicMock()
+    uow_mock.sbis_status_history.add.side_effect = lambda status: status
+    uow_mock.sbds_status_history.add.side_effect = ValueError("Invalid transition")
+    mock_oda.uow().__enter__.return_value = uow_mock
+
+    result = client_put(
+        f"{API_PREFIX}/status/bulk",
+        json=BULK_STATUS_UPDATE
+        + [
+            {
+                "current_status": "Submitted",
+                "previous_status": "Draft",
+                "prj_ref": "prj-mvp01-20220923-00001",
+            }
+        ],
+    ).json()
+
+    assert result["result_code"] == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert [
+        (item["result_status"], item["result_code"]) for item in result["result_data"]
+    ] == [
+        ("failed", HTTPStatus.FAILED_DEPENDENCY),
+        ("failed", HTTPStatus.UNPROCESSABLE_ENTITY),
+        ("failed", HTTPStatus.FAILED_DEPENDENCY),
+    ]
+    assert "Rolled back" in result["result_data"][0]["result_data"]
+    assert "Not attempted" in result["result_data"][2]["result_data"]
+    uow_mock.prjs_status_history.add.assert_not_called()
+    uow_mock.commit.assert_not_called()